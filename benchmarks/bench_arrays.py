@@ -0,0 +1,263 @@
+"""
+Benchmarks the arrays subsystem against list and array.array.
+
+Every (structure, operation, size) combination is timed on a fresh setup,
+keeping the best of --repeat runs, then run once more under tracemalloc for
+the peak memory allocated by the operation. Results are written as JSON.
+
+Usage:
+    python benchmarks/bench_arrays.py
+    python benchmarks/bench_arrays.py --sizes 1e3 1e5 --operations append pop
+    python benchmarks/bench_arrays.py --structures DynamicArray list -o results.json
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from array import array
+
+from playground.dsa.arrays import DynamicArray, TypedDynamicArray
+
+STRUCTURES = {
+    "DynamicArray": DynamicArray,
+    "TypedDynamicArray": lambda: TypedDynamicArray("q"),
+    "list": list,
+    "array.array": lambda: array("q"),
+}
+
+DEFAULT_SIZES = (10**3, 10**4, 10**5, 10**6, 10**7)
+
+
+def _filled(factory, n):
+    """Returns a structure holding 0 .. n - 1."""
+    seq = factory()
+    seq.extend(range(n))
+    return seq
+
+
+def _resizes(seq):
+    """Returns the number of reallocations so far, or None if not tracked."""
+    return seq.stats()["resizes"] if hasattr(seq, "stats") else None
+
+
+# Each benchmark takes (factory, n, ops) and returns the structure under test
+# and a callable that runs the operation and returns how many units it did.
+
+
+def bench_append(factory, n, ops):
+    seq = factory()
+
+    def run():
+        append = seq.append
+        for i in range(n):
+            append(i)
+        return n
+
+    return seq, run
+
+
+def bench_extend(factory, n, ops):
+    seq = factory()
+    values = list(range(n))
+
+    def run():
+        seq.extend(values)
+        return n
+
+    return seq, run
+
+
+def _bench_insert(position):
+    def bench(factory, n, ops):
+        seq = _filled(factory, n)
+
+        def run():
+            for i in range(ops):
+                seq.insert(position(len(seq)), i)
+            return ops
+
+        return seq, run
+
+    return bench
+
+
+def bench_pop(factory, n, ops):
+    seq = _filled(factory, n)
+    count = min(ops, n)
+
+    def run():
+        pop = seq.pop
+        for _ in range(count):
+            pop()
+        return count
+
+    return seq, run
+
+
+def bench_contains(factory, n, ops):
+    seq = _filled(factory, n)
+    missing = -1  # Forces a full scan
+
+    def run():
+        for _ in range(ops):
+            missing in seq  # noqa: B015
+        return ops
+
+    return seq, run
+
+
+def bench_concat(factory, n, ops):
+    seq = _filled(factory, n)
+    other = _filled(factory, n)
+
+    def run():
+        seq + other
+        return 2 * n
+
+    return seq, run
+
+
+def bench_iterate(factory, n, ops):
+    seq = _filled(factory, n)
+
+    def run():
+        for _ in seq:
+            pass
+        return n
+
+    return seq, run
+
+
+# name: (benchmark, unit counted by ops_per_sec)
+OPERATIONS = {
+    "append": (bench_append, "elements"),
+    "extend": (bench_extend, "elements"),
+    "insert_head": (_bench_insert(lambda length: 0), "calls"),
+    "insert_middle": (_bench_insert(lambda length: length // 2), "calls"),
+    "insert_tail": (_bench_insert(lambda length: length), "calls"),
+    "pop": (bench_pop, "calls"),
+    "contains": (bench_contains, "calls"),
+    "concat": (bench_concat, "elements"),
+    "iterate": (bench_iterate, "elements"),
+}
+
+
+def measure(structure, operation, n, ops, repeat):
+    """
+    Times one operation on one structure at one size.
+
+    Args:
+        structure (str): A key of STRUCTURES.
+        operation (str): A key of OPERATIONS.
+        n (int): The size of the structure.
+        ops (int): The number of calls for per-call operations.
+        repeat (int): The number of timed runs; the fastest one is kept.
+
+    Returns:
+        dict: The measurement, ready to be serialized as JSON.
+    """
+    factory = STRUCTURES[structure]
+    bench, unit = OPERATIONS[operation]
+
+    best = None
+    for _ in range(repeat):
+        seq, run = bench(factory, n, ops)
+        before = _resizes(seq)
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            count = run()
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        if best is None or elapsed < best[0]:
+            after = _resizes(seq)
+            resizes = None if before is None else after - before
+            best = (elapsed, count, resizes)
+
+    # Separate run for memory: tracemalloc slows down the timed code
+    seq, run = bench(factory, n, ops)
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    elapsed, count, resizes = best
+    return {
+        "structure": structure,
+        "operation": operation,
+        "size": n,
+        "unit": unit,
+        "count": count,
+        "seconds": elapsed,
+        "ops_per_sec": count / elapsed if elapsed > 0 else None,
+        "peak_bytes": peak,
+        "resizes": resizes,
+    }
+
+
+def _size(text):
+    """Parses a size such as 1000 or 1e6."""
+    value = float(text)
+    if value < 1 or value != int(value):
+        raise argparse.ArgumentTypeError(f"invalid size: {text!r}")
+    return int(value)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--sizes", nargs="+", type=_size, default=DEFAULT_SIZES, metavar="N"
+    )
+    parser.add_argument(
+        "--structures", nargs="+", choices=STRUCTURES, default=list(STRUCTURES)
+    )
+    parser.add_argument(
+        "--operations", nargs="+", choices=OPERATIONS, default=list(OPERATIONS)
+    )
+    parser.add_argument(
+        "--ops",
+        type=int,
+        default=100,
+        help="calls per run for insert, pop and contains (default: 100)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs (best kept)")
+    parser.add_argument("-o", "--output", help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    results = []
+    for n in args.sizes:
+        for operation in args.operations:
+            for structure in args.structures:
+                result = measure(structure, operation, n, args.ops, args.repeat)
+                results.append(result)
+                print(
+                    f"{structure:>17} {operation:>13} n={n:<9}"
+                    f" {result['ops_per_sec'] or 0:>14,.0f} {result['unit']}/s",
+                    file=sys.stderr,
+                )
+
+    report = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "ops": args.ops,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
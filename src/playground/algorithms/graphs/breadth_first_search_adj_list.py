@@ -23,7 +23,7 @@ def bfs_adj_list(graph, start_node):
                 queue.append(neighbor)
 
 
-def bfs_adj_matrix(graph, start_node_index, num_nodes):
+def bfs_adj_matrix(graph, start_node_index, num_nodes, visited=None):
     """
     Performs a Breadth-First Search on a graph represented by an adjacency matrix.
 
@@ -31,8 +31,11 @@ def bfs_adj_matrix(graph, start_node_index, num_nodes):
         graph: A 2D list representing the adjacency matrix.
         start_node_index: The index of the starting node for the BFS traversal.
         num_nodes: The total number of nodes in the graph.
+        visited: An indexable store of visited flags, such as a BitArray of
+            num_nodes bits. Defaults to a new list.
     """
-    visited = [False] * num_nodes
+    if visited is None:
+        visited = [False] * num_nodes
     queue = deque([start_node_index])
     visited[start_node_index] = True
 
@@ -10,7 +10,7 @@ def dfs_recursive_adj_matrix(graph, node_index, visited, num_nodes):
     Args:
         graph: A 2D list representing the adjacency matrix.
         node_index: The index of the starting node for the DFS traversal.
-        visited: A list or set to keep track of visited node indices.
+        visited: A list or BitArray to keep track of visited node indices.
         num_nodes: The total number of nodes in the graph.
     """
     print(node_index, end=" ")
@@ -21,7 +21,7 @@ def dfs_recursive_adj_matrix(graph, node_index, visited, num_nodes):
             dfs_recursive_adj_matrix(graph, i, visited, num_nodes)
 
 
-def dfs_iterative_adj_matrix(graph, start_node_index, num_nodes):
+def dfs_iterative_adj_matrix(graph, start_node_index, num_nodes, visited=None):
     """
     Performs an iterative Depth-First Search on a graph represented by an adjacency matrix.
 
@@ -29,8 +29,11 @@ def dfs_iterative_adj_matrix(graph, start_node_index, num_nodes):
         graph: A 2D list representing the adjacency matrix.
         start_node_index: The index of the starting node for the DFS traversal.
         num_nodes: The total number of nodes in the graph.
+        visited: An indexable store of visited flags, such as a BitArray of
+            num_nodes bits. Defaults to a new list.
     """
-    visited = [False] * num_nodes
+    if visited is None:
+        visited = [False] * num_nodes
     stack = [start_node_index]
 
     while stack:
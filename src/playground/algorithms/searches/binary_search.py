@@ -44,6 +44,46 @@ def binary_search_by_recursion(a, k, lo=0, hi=None):
     return binary_search_by_recursion(a, k, mid + 1, hi)
 
 
+def lower_bound(a, k, lo=0, hi=None):
+    """
+    Find the first position where the key could be inserted into a sorted list.
+    :param a: Sorted list of elements
+    :param k: Key to search
+    :param lo: Lower bound
+    :param hi: Upper bound (exclusive), defaults to len(a)
+    :return: Index of the first element not less than the key
+    """
+    if hi is None:
+        hi = len(a)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if a[mid] < k:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def upper_bound(a, k, lo=0, hi=None):
+    """
+    Find the last position where the key could be inserted into a sorted list.
+    :param a: Sorted list of elements
+    :param k: Key to search
+    :param lo: Lower bound
+    :param hi: Upper bound (exclusive), defaults to len(a)
+    :return: Index of the first element greater than the key
+    """
+    if hi is None:
+        hi = len(a)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if k < a[mid]:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
 searches = (
     binary_search,
     binary_search_by_recursion,
@@ -3,3 +3,4 @@ from .linked_list import *  # noqa
 from .stacks import *  # noqa
 from .queues import *  # noqa
 from .heaps import *  # noqa
+from .caches import *  # noqa
@@ -1,4 +1,38 @@
 from .arrays import DynamicArray  # noqa
 from .array_adt import DynamicArrayADT  # noqa
+from .array_view import ArrayView  # noqa
+from .bit_array import BitArray  # noqa
+from .capacity_policy import (  # noqa
+    AdditivePolicy,
+    CapacityPolicy,
+    GeometricPolicy,
+    HysteresisPolicy,
+    NeverShrinkPolicy,
+)
+from .gap_buffer import GapBuffer  # noqa
+from .mapped_array import MappedDynamicArray  # noqa
+from .persistent_vector import PersistentVector, TransientVector  # noqa
+from .shared_array import SharedDynamicArray  # noqa
+from .sorted_array import SortedArray  # noqa
+from .tiered_vector import TieredVector  # noqa
+from .typed_array import TypedDynamicArray  # noqa
 
-__all__ = ["DynamicArray", "DynamicArrayADT"]
+__all__ = [
+    "AdditivePolicy",
+    "ArrayView",
+    "BitArray",
+    "CapacityPolicy",
+    "DynamicArray",
+    "DynamicArrayADT",
+    "GapBuffer",
+    "GeometricPolicy",
+    "HysteresisPolicy",
+    "MappedDynamicArray",
+    "NeverShrinkPolicy",
+    "PersistentVector",
+    "SharedDynamicArray",
+    "SortedArray",
+    "TieredVector",
+    "TransientVector",
+    "TypedDynamicArray",
+]
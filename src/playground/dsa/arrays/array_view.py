@@ -0,0 +1,216 @@
+from .array_adt import DynamicArrayADT
+
+
+class ArrayView(DynamicArrayADT):
+    """
+    Zero-copy view over a contiguous range of a DynamicArray.
+
+    The view reads and writes through its parent, so creating it costs O(1)
+    regardless of the window size. With ``copy_on_write`` set, the first write
+    copies the window into private storage and leaves the parent untouched.
+
+    Attributes:
+        _parent (DynamicArrayADT): The array whose storage is shared.
+        _start (int): The parent index of the first element in the view.
+        _stop (int): The parent index one past the last element in the view.
+        _copy_on_write (bool): Whether writes detach the view from its parent.
+        _copy (DynamicArrayADT): The private copy of the window once detached.
+    """
+
+    def __init__(self, parent, start=0, stop=None, copy_on_write=False):
+        """
+        Initializes the ArrayView.
+
+        Args:
+            parent (DynamicArrayADT): The array (or view) to share storage with.
+            start (int): The first index covered by the view.
+            stop (int): One past the last index covered by the view (default: the end).
+            copy_on_write (bool): If True, writes copy the window instead of
+                modifying the parent.
+
+        Raises:
+            IndexError: If the range is not within the parent.
+        """
+        if stop is None:
+            stop = len(parent)
+        if not 0 <= start <= stop <= len(parent):
+            raise IndexError("View range out of range.")
+
+        # Views of views share the innermost storage directly
+        if isinstance(parent, ArrayView):
+            parent, offset = parent._source()
+            start, stop = start + offset, stop + offset
+
+        self._parent = parent
+        self._start = start
+        self._stop = stop
+        self._copy_on_write = copy_on_write
+        self._copy = None
+
+    def __len__(self):
+        """
+        Returns the number of elements in the view.
+
+        Returns:
+            int: The number of elements.
+        """
+        return self._stop - self._start
+
+    def __getitem__(self, index):
+        """
+        Retrieves the element at the given index, or a sub-view for a slice.
+
+        Args:
+            index (int or slice): The index of the element to retrieve.
+
+        Returns:
+            object: The element at the specified index. A contiguous slice
+            returns a new ArrayView; an extended slice returns a copy.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if isinstance(index, slice):
+            r = range(len(self))[index]
+            if r.step != 1:
+                return self.materialize()[index]
+            return ArrayView(
+                self, r.start, max(r.stop, r.start), copy_on_write=self._copy_on_write
+            )
+        if not 0 <= index < len(self):
+            raise IndexError("Index out of range.")
+        source, offset = self._source()
+        return source[offset + index]
+
+    def __setitem__(self, index, obj):
+        """
+        Sets the element at the given index, or replaces the given slice.
+
+        Args:
+            index (int or slice): The index to set.
+            obj (object): The value to set, or an iterable of values for a slice.
+
+        Raises:
+            IndexError: If the index is out of range.
+            ValueError: If a slice assignment would change the size of the view.
+        """
+        if isinstance(index, slice):
+            r = range(len(self))[index]
+            values = obj if hasattr(obj, "__len__") else list(obj)
+            if len(values) != len(r):
+                raise ValueError("ArrayView cannot change size.")
+            target, offset = self._writable()
+            if r.step == 1:
+                target[offset + r.start : offset + r.start + len(r)] = values
+            else:
+                for i, value in zip(r, values):
+                    target[offset + i] = value
+            return
+        if not 0 <= index < len(self):
+            raise IndexError("Index out of range.")
+        target, offset = self._writable()
+        target[offset + index] = obj
+
+    def __iter__(self):
+        """
+        Returns an iterator for the view.
+
+        Yields:
+            object: The next element in the view.
+        """
+        source, offset = self._source()
+        for i in range(offset, offset + len(self)):
+            yield source[i]
+
+    def __contains__(self, obj):
+        """
+        Checks if the view contains the specified object.
+
+        Args:
+            obj (object): The object to search for.
+
+        Returns:
+            bool: True if the object is found, False otherwise.
+        """
+        for value in self:
+            if value == obj:
+                return True
+        return False
+
+    def __add__(self, other):
+        """
+        Concatenates the elements of this view with another array or view.
+
+        Args:
+            other (DynamicArrayADT): The array or view to concatenate with.
+
+        Returns:
+            DynamicArrayADT: A new array of the parent's type containing all elements.
+
+        Raises:
+            TypeError: If 'other' is not a DynamicArray or view.
+        """
+        return self.materialize() + other
+
+    def __repr__(self):
+        """
+        Returns a string representation of the view.
+
+        Returns:
+            str: A string representation of the view.
+        """
+        return f"[{', '.join(map(str, self))}]"
+
+    def _make_array(self, c):
+        """
+        Creates a new storage array of the parent's kind.
+
+        Args:
+            c (int): The capacity of the array.
+
+        Returns:
+            object: A new storage array.
+        """
+        return self._parent._make_array(c)
+
+    @property
+    def detached(self):
+        """
+        Checks if the view has copied its window away from the parent.
+
+        Returns:
+            bool: True if writes no longer reach the parent, False otherwise.
+        """
+        return self._copy is not None
+
+    def materialize(self):
+        """
+        Copies the elements of the view into a new array of the parent's type.
+
+        Returns:
+            DynamicArrayADT: A new array holding the view's elements.
+        """
+        source, offset = self._source()
+        return source[offset : offset + len(self)]
+
+    def _source(self):
+        """
+        Returns the array currently backing the view and the view's offset in it.
+
+        Returns:
+            tuple: The backing array and the offset of the view's first element.
+        """
+        if self._copy is not None:
+            return self._copy, 0
+        return self._parent, self._start
+
+    def _writable(self):
+        """
+        Returns the array that writes should go to, detaching first if needed.
+
+        Returns:
+            tuple: The backing array and the offset of the view's first element.
+        """
+        if self._copy_on_write and self._copy is None:
+            self._copy = self.materialize()
+        return self._source()
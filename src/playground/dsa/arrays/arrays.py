@@ -1,8 +1,36 @@
 import ctypes
+import functools
+import math
 
 from playground.dsa.logging_config import logger
 
 from .array_adt import DynamicArrayADT
+from .array_view import ArrayView
+from .capacity_policy import GeometricPolicy
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+
+def _require_numpy(name):
+    """Raises ImportError if NumPy, needed by the named method, is missing."""
+    if np is None:
+        raise ImportError(f"{name}() requires NumPy; install playground[numpy].")
+
+
+_NAN_KEY = object()  # Stands in for NaN, which never equals itself, in the index
+
+
+def _index_key(obj):
+    """Returns the hash index key of a stored value."""
+    return _NAN_KEY if isinstance(obj, float) and math.isnan(obj) else obj
+
+
+def _is_ufunc(func, nin):
+    """Returns True if func is a NumPy ufunc taking nin arguments."""
+    return np is not None and isinstance(func, np.ufunc) and func.nin == nin
 
 
 class DynamicArray(DynamicArrayADT):
@@ -15,18 +43,32 @@ class DynamicArray(DynamicArrayADT):
         _A (ctypes.py_object array): The underlying array used for storage.
         _SHRINK_THRESHOLD (float): The threshold (load factor) at which to shrink the array.
         _RESIZE_FACTOR (float): The factor by which to grow the array when resizing.
+        _FILL_VALUE (object): The value written into vacated slots.
+        _policy (CapacityPolicy): Decides the capacity on growth and shrinkage.
+        _resize_count (int): The number of reallocations so far.
+        _copied_count (int): The number of elements copied by reallocations so far.
+        _index (dict): Maps each stored value to the set of its positions, or
+            None when the index is disabled.
     """
 
     _SHRINK_THRESHOLD = 0.25  # Shrink when the array is 25% full
     _RESIZE_FACTOR = 2.0  # Double the capacity when resizing
+    _FILL_VALUE = None  # Drop the reference so it can be garbage collected
+    _index = None  # No value index unless enabled
 
-    def __init__(self, initial_capacity=10, resize_factor=2.0):
+    def __init__(
+        self, initial_capacity=10, resize_factor=2.0, policy=None, indexed=False
+    ):
         """
         Initializes the DynamicArray.
 
         Args:
             initial_capacity (int): The initial capacity of the array. Must be > 0.
             resize_factor (float): The factor by which to grow the array on resize. Must be > 1.
+            policy (CapacityPolicy): The growth and shrink policy. Defaults to a
+                GeometricPolicy using 'resize_factor' and _SHRINK_THRESHOLD.
+            indexed (bool): If True, keep a hash index of the values (see
+                ``enable_index``). The values must then be hashable.
         """
 
         if not isinstance(initial_capacity, int) or initial_capacity <= 0:
@@ -38,6 +80,13 @@ class DynamicArray(DynamicArrayADT):
         self._capacity = initial_capacity
         self._A = self._make_array(self._capacity)
         self._RESIZE_FACTOR = float(resize_factor)  # Ensure it's a float
+        self._policy = policy or GeometricPolicy(
+            self._RESIZE_FACTOR, self._SHRINK_THRESHOLD
+        )
+        self._resize_count = 0
+        self._copied_count = 0
+        if indexed:
+            self.enable_index()
 
     def __len__(self):
         """
@@ -50,35 +99,57 @@ class DynamicArray(DynamicArrayADT):
 
     def __getitem__(self, index):
         """
-        Retrieves the element at the given index.
+        Retrieves the element at the given index, or a copy of the given slice.
 
         Args:
-            index (int): The index of the element to retrieve.
+            index (int or slice): The index of the element to retrieve.
 
         Returns:
-            object: The element at the specified index.
+            object: The element at the specified index, or a new array of the
+            same type holding the sliced elements.
 
         Raises:
             IndexError: If the index is out of range.
         """
+        if isinstance(index, slice):
+            r = range(self._n)[index]
+            result = self._empty_like(max(len(r), 1))
+            if r.step == 1:
+                result.extend(self._A[r.start : r.stop])
+            else:
+                result.extend([self._A[i] for i in r])
+            return result
         if not 0 <= index < self._n:
             raise IndexError("Index out of range.")
         return self._A[index]
 
     def __setitem__(self, index, obj):
         """
-        Sets the element at the given index to the specified value.
+        Sets the element at the given index, or replaces the given slice.
+
+        Like ``list``, assigning to a contiguous slice may change the length
+        of the array, while an extended slice must keep it.
 
         Args:
-            index (int): The index to set.
-            obj (object): The value to set at the index.
+            index (int or slice): The index to set.
+            obj (object): The value to set at the index, or an iterable of
+                values when 'index' is a slice.
 
         Raises:
             IndexError: If the index is out of range.
+            ValueError: If an extended slice is assigned a different number of values.
         """
+        if isinstance(index, slice):
+            self._set_slice(index, obj)
+            return
         if not 0 <= index < self._n:
             raise IndexError("Index out of range.")
+        old = self._A[index]
         self._A[index] = obj
+        if self._index is not None:
+            # Index the value as stored, which a typed subclass may have coerced
+            self._index_discard(old, index)
+            self._index_add(self._A[index], index)
 
     def __iter__(self):
         """
@@ -94,12 +165,19 @@ class DynamicArray(DynamicArrayADT):
         """
         Checks if the array contains the specified object.
 
+        With the index enabled this is a single hash lookup.
+
         Args:
             obj (object): The object to search for.
 
         Returns:
             bool: True if the object is found, False otherwise.
         """
+        if self._index is not None:
+            try:
+                return obj in self._index
+            except TypeError:  # Unhashable, so scan as without the index
+                pass
         for i in range(self._n):
             if self._A[i] == obj:
                 return True
@@ -110,24 +188,22 @@ class DynamicArray(DynamicArrayADT):
         Concatenates this DynamicArray with another DynamicArray.
 
         Args:
-            other (DynamicArray): The other DynamicArray to concatenate with.
+            other (DynamicArrayADT): The other DynamicArray (or view) to concatenate with.
 
         Returns:
-            DynamicArray: A new DynamicArray containing all elements.
+            DynamicArray: A new array of the same type containing all elements.
 
         Raises:
             TypeError: If 'other' is not a DynamicArray.
         """
-        if not isinstance(other, DynamicArray):
+        if not isinstance(other, DynamicArrayADT):
             raise TypeError(
                 "Can only concatenate DynamicArray with another DynamicArray."
             )
 
-        result = DynamicArray(initial_capacity=self._n + other._n)
-        for i in range(self._n):
-            result.append(self._A[i])
-        for i in range(other._n):
-            result.append(other._A[i])
+        result = self._empty_like(max(self._n + len(other), 1))
+        result.extend(self)
+        result.extend(other)
         return result
 
     def __repr__(self):
@@ -153,6 +229,114 @@ class DynamicArray(DynamicArrayADT):
             raise ValueError("Capacity must be a positive integer.")
         return (ctypes.py_object * c)()
 
+    @classmethod
+    def _result_class(cls):
+        """
+        Returns the class that slices, concatenation and bulk operations build.
+
+        Subclasses whose constructor needs more than these settings (such as a
+        file path) return the nearest class whose constructor does not.
+
+        Returns:
+            type: The class of new result arrays.
+        """
+        return cls
+
+    def _empty_like(self, capacity):
+        """
+        Creates an empty array of the same type and settings as this one.
+
+        Args:
+            capacity (int): The initial capacity of the new array.
+
+        Returns:
+            DynamicArray: A new, empty array.
+        """
+        return self._result_class()(
+            initial_capacity=capacity,
+            resize_factor=self._RESIZE_FACTOR,
+            policy=self._policy,
+            indexed=self._index is not None,
+        )
+
+    def _set_slice(self, index, values):
+        """
+        Replaces the elements selected by a slice with the given values.
+
+        Args:
+            index (slice): The slice to replace.
+            values (iterable): The replacement values.
+
+        Raises:
+            ValueError: If an extended slice is assigned a different number of values.
+        """
+        r = range(self._n)[index]
+        if isinstance(values, DynamicArray):
+            values = values._A[: values._n]
+        block = self._to_block(values)
+
+        if r.step != 1:
+            if len(block) != len(r):
+                raise ValueError(
+                    f"Cannot assign {len(block)} values to an extended slice of size {len(r)}."
+                )
+            for i, obj in zip(r, block):
+                self[i] = obj
+            return
+
+        start, stop = r.start, max(r.stop, r.start)
+        count = len(block)
+        new_n = self._n - (stop - start) + count
+        if new_n > self._capacity:
+            self._resize(self._policy.grow(self._capacity, new_n))
+
+        if stop - start != count:
+            # Move the tail once, then clear any slots it vacated
+            self._A[start + count : new_n] = self._A[stop : self._n]
+            if new_n < self._n:
+                self._A[new_n : self._n] = self._to_block(
+                    [self._FILL_VALUE] * (self._n - new_n)
+                )
+        if self._index is not None and stop - start == count:
+            old = self._A[start:stop]
+            self._A[start:stop] = block
+            for i, obj in enumerate(old, start):
+                self._index_discard(obj, i)
+                self._index_add(self._A[i], i)
+            return
+        self._A[start : start + count] = block
+        if self._index is not None and stop - start != count:
+            self._n = new_n
+            self._rebuild_index()  # Every later position moved
+        self._n = new_n
+
+    def view(self, start=0, stop=None, copy_on_write=False):
+        """
+        Returns a zero-copy view over a range of this array.
+
+        Args:
+            start (int): The first index covered by the view.
+            stop (int): One past the last index covered by the view (default: the end).
+            copy_on_write (bool): If True, the first write through the view copies
+                its window instead of modifying this array.
+
+        Returns:
+            ArrayView: A view sharing this array's storage.
+        """
+        return ArrayView(self, start, stop, copy_on_write=copy_on_write)
+
+    def _to_block(self, values):
+        """
+        Converts a sized iterable into a block that can be slice-assigned into storage.
+
+        Args:
+            values (iterable): The values to convert.
+
+        Returns:
+            list or tuple: The values as a sequence.
+        """
+        return values if isinstance(values, (list, tuple)) else list(values)
+
     def _resize(self, new_capacity):
         """
         Resizes the underlying array to the given capacity.
@@ -164,10 +348,11 @@ class DynamicArray(DynamicArrayADT):
             raise ValueError("New capacity must be a positive integer.")
 
         B = self._make_array(new_capacity)
-        for i in range(self._n):
-            B[i] = self._A[i]
+        B[: self._n] = self._A[: self._n]  # Block copy instead of a per-element loop
         self._A = B
         self._capacity = new_capacity
+        self._resize_count += 1
+        self._copied_count += self._n
 
     def append(self, obj):
         """
@@ -177,8 +362,10 @@ class DynamicArray(DynamicArrayADT):
             obj (object): The element to append.
         """
         if self._n == self._capacity:
-            self._resize(int(self._capacity * self._RESIZE_FACTOR))
+            self._resize(self._policy.grow(self._capacity, self._n + 1))
         self._A[self._n] = obj
+        if self._index is not None:
+            self._index_add(self._A[self._n], self._n)
         self._n += 1
 
     def insert(self, index, obj):
@@ -196,13 +383,17 @@ class DynamicArray(DynamicArrayADT):
             raise IndexError("Index out of range.")
 
         if self._n == self._capacity:
-            self._resize(int(self._capacity * self._RESIZE_FACTOR))
+            self._resize(self._policy.grow(self._capacity, self._n + 1))
 
-        for j in range(self._n, index, -1):
-            self._A[j] = self._A[j - 1]
+        # Shift the tail right by one slot in a single block move
+        self._A[index + 1 : self._n + 1] = self._A[index : self._n]
         self._A[index] = obj
         self._n += 1
 
+        if self._index is not None:
+            self._index_shift(index + 1, self._n, 1, moved=True)
+            self._index_add(self._A[index], index)
+
     def pop(self, index=-1):
         """
         Removes and returns the element at the given index (default: last element).
@@ -223,19 +414,20 @@ class DynamicArray(DynamicArrayADT):
                 raise IndexError("Index out of range.")
 
         value = self._A[index]
+        if self._index is not None:
+            self._index_discard(value, index)
+            self._index_shift(index + 1, self._n, -1)
 
-        for j in range(index, self._n - 1):
-            self._A[j] = self._A[j + 1]
+        # Shift the tail left by one slot in a single block move
+        self._A[index : self._n - 1] = self._A[index + 1 : self._n]
 
-        self._A[self._n - 1] = None  # Help garbage collection
+        self._A[self._n - 1] = self._FILL_VALUE  # Help garbage collection
         self._n -= 1
 
-        # Shrink the array if it's less than _SHRINK_THRESHOLD full
-        if (
-            self._n < int(self._capacity * self._SHRINK_THRESHOLD)
-            and self._capacity > 1
-        ):
-            self._resize(max(int(self._capacity / self._RESIZE_FACTOR), 1))
+        # Let the policy decide whether to give memory back
+        new_capacity = self._policy.shrink(self._capacity, self._n)
+        if new_capacity is not None and new_capacity != self._capacity:
+            self._resize(new_capacity)
 
         return value
 
@@ -243,12 +435,25 @@ class DynamicArray(DynamicArrayADT):
         """
         Removes the first occurrence of the specified element from the array.
 
+        With the index enabled the element is found by a hash lookup instead
+        of a scan.
+
         Args:
             obj (object): The element to remove.
 
         Raises:
             ValueError: If the element is not found in the array.
         """
+        if self._index is not None:
+            try:
+                positions = self._index.get(obj)
+            except TypeError:  # Unhashable, so scan as without the index
+                pass
+            else:
+                if not positions:
+                    raise ValueError("Element not found in array.")
+                self.pop(min(positions))
+                return
         for i in range(self._n):
             if self._A[i] == obj:
                 self.pop(i)
@@ -259,11 +464,28 @@ class DynamicArray(DynamicArrayADT):
         """
         Extends the array by appending elements from an iterable.
 
+        When the iterable has a known length the storage is resized at most
+        once and the elements are copied in a single block.
+
         Args:
             iterable (iterable): The iterable containing elements to append.
         """
-        for item in iterable:
-            self.append(item)
+        if not hasattr(iterable, "__len__"):
+            for item in iterable:
+                self.append(item)
+            return
+
+        if isinstance(iterable, DynamicArray):
+            iterable = iterable._A[: iterable._n]
+        block = self._to_block(iterable)
+        needed = self._n + len(block)
+        if needed > self._capacity:
+            self._resize(self._policy.grow(self._capacity, needed))
+        self._A[self._n : needed] = block
+        if self._index is not None:
+            for i in range(self._n, needed):
+                self._index_add(self._A[i], i)
+        self._n = needed
 
     def clear(self):
         """
@@ -271,6 +493,280 @@ class DynamicArray(DynamicArrayADT):
         """
         self._n = 0
         self._A = self._make_array(self._capacity)  # Reset to initial capacity
+        if self._index is not None:
+            self._index = {}
+
+    def reserve(self, n):
+        """
+        Ensures the array can hold at least n elements without reallocating.
+
+        Args:
+            n (int): The number of elements to make room for.
+        """
+        if n > self._capacity:
+            self._resize(n)
+
+    def shrink_to_fit(self):
+        """
+        Reduces the capacity to the number of stored elements.
+        """
+        target = max(self._n, 1)
+        if target != self._capacity:
+            self._resize(target)
+
+    def enable_index(self):
+        """
+        Builds a hash index from each value to its positions and keeps it up to date.
+
+        With the index enabled, ``in`` is O(1) and ``remove`` no longer scans
+        for the element. Every mutation also updates the index, so an insert
+        or pop renumbers the positions of the elements it shifts. All stored
+        values must be hashable.
+
+        Raises:
+            TypeError: If a stored value is not hashable.
+        """
+        self._index = {}
+        try:
+            self._rebuild_index()
+        except TypeError:
+            self._index = None
+            raise
+
+    def disable_index(self):
+        """
+        Drops the hash index, going back to linear scans.
+        """
+        self._index = None
+
+    def _rebuild_index(self):
+        """
+        Recomputes the hash index from the stored elements.
+        """
+        self._index = {}
+        for i in range(self._n):
+            self._index_add(self._A[i], i)
+
+    def _index_add(self, obj, position):
+        """
+        Records that obj is stored at position.
+
+        Args:
+            obj (object): The stored value.
+            position (int): Its position.
+        """
+        key = _index_key(obj)
+        positions = self._index.get(key)
+        if positions is None:
+            self._index[key] = {position}
+        else:
+            positions.add(position)
+
+    def _index_discard(self, obj, position):
+        """
+        Forgets that obj is stored at position.
+
+        Args:
+            obj (object): The stored value.
+            position (int): Its position.
+        """
+        key = _index_key(obj)
+        positions = self._index[key]
+        positions.discard(position)
+        if not positions:
+            del self._index[key]
+
+    def _index_shift(self, start, stop, delta, moved=False):
+        """
+        Moves the indexed positions of the elements in [start, stop) by delta.
+
+        Positions are renumbered in the direction of the move so that two
+        equal neighbours never collide in the same set.
+
+        Args:
+            start (int): The first position to move.
+            stop (int): One past the last position to move.
+            delta (int): The distance to move, +1 or -1.
+            moved (bool): True if [start, stop) is the range after the storage
+                has already moved, rather than before.
+        """
+        if moved:
+            start, stop = start - delta, stop - delta
+        order = range(stop - 1, start - 1, -1) if delta > 0 else range(start, stop)
+        for i in order:
+            positions = self._index[_index_key(self._A[i + delta if moved else i])]
+            positions.discard(i)
+            positions.add(i + delta)
+
+    @classmethod
+    def from_numpy(cls, ndarray):
+        """
+        Creates an array holding the elements of a one-dimensional NumPy array.
+
+        The elements are converted to Python objects in a single bulk copy.
+
+        Args:
+            ndarray (numpy.ndarray): The array to copy.
+
+        Returns:
+            DynamicArray: A new array holding the elements.
+
+        Raises:
+            ValueError: If the array is not one-dimensional.
+        """
+        if ndarray.ndim != 1:
+            raise ValueError("Expected a one-dimensional array.")
+        result = cls._result_class()(initial_capacity=max(len(ndarray), 1))
+        result.extend(ndarray.tolist())
+        return result
+
+    def to_numpy(self, dtype=None):
+        """
+        Copies the elements into a NumPy array in a single bulk copy.
+
+        Args:
+            dtype (numpy.dtype): The dtype of the result. Defaults to the
+                dtype NumPy infers from the elements.
+
+        Returns:
+            numpy.ndarray: A new one-dimensional array.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        _require_numpy("to_numpy")
+        return np.array(self._A[: self._n], dtype=dtype)
+
+    def map(self, func):
+        """
+        Applies a function to every element.
+
+        A one-argument NumPy ufunc is applied to the whole array at once;
+        any other callable is called once per element.
+
+        Args:
+            func (callable): The function to apply.
+
+        Returns:
+            DynamicArray: A new array of the same type holding the results.
+        """
+        if _is_ufunc(func, 1):
+            return self._from_numpy_result(func(self.to_numpy()))
+        result = self._empty_like(max(self._n, 1))
+        result.extend([func(value) for value in self._A[: self._n]])
+        return result
+
+    def filter(self, predicate):
+        """
+        Keeps the elements for which a predicate is true.
+
+        A one-argument NumPy ufunc is evaluated as a mask over the whole
+        array at once; any other callable is called once per element.
+
+        Args:
+            predicate (callable): The test to apply.
+
+        Returns:
+            DynamicArray: A new array of the same type holding the kept elements.
+        """
+        if _is_ufunc(predicate, 1):
+            values = self.to_numpy()
+            return self._from_numpy_result(values[predicate(values).astype(bool)])
+        result = self._empty_like(max(self._n, 1))
+        result.extend([value for value in self._A[: self._n] if predicate(value)])
+        return result
+
+    def reduce(self, func, initial=None):
+        """
+        Folds the elements from left to right with a two-argument function.
+
+        A two-argument NumPy ufunc (such as ``numpy.add``) is reduced over the
+        whole array at once; any other callable goes through functools.reduce.
+
+        Args:
+            func (callable): The function combining the running value and an element.
+            initial (object): The starting value, or None to start from the first element.
+
+        Returns:
+            object: The reduced value.
+
+        Raises:
+            TypeError: If the array is empty and no initial value is given.
+        """
+        if self._n == 0 and initial is None:
+            raise TypeError("reduce() of empty array with no initial value.")
+        if _is_ufunc(func, 2):
+            values = self.to_numpy()
+            if initial is None:
+                result = func.reduce(values)
+            else:
+                result = func.reduce(values, initial=initial)
+            return result.item() if isinstance(result, np.generic) else result
+        values = self._A[: self._n]
+        if initial is None:
+            return functools.reduce(func, values)
+        return functools.reduce(func, values, initial)
+
+    def argsort(self):
+        """
+        Returns the indices that would sort the array (a stable sort).
+
+        The elements are compared as the Python objects they are, so the
+        result does not depend on whether NumPy is installed.
+
+        Returns:
+            DynamicArray: The indices, in sorted order of their elements.
+        """
+        order = sorted(range(self._n), key=self._A.__getitem__)
+        result = DynamicArray(initial_capacity=max(self._n, 1))
+        result.extend(order)
+        return result
+
+    def take(self, indices):
+        """
+        Gathers the elements at the given indices.
+
+        Args:
+            indices (iterable): The indices of the elements to take, in order.
+
+        Returns:
+            DynamicArray: A new array of the same type holding the elements.
+
+        Raises:
+            IndexError: If an index is out of range.
+        """
+        result = self._empty_like(max(self._n, 1))
+        result.extend([self[i] for i in indices])
+        return result
+
+    def _from_numpy_result(self, values):
+        """
+        Wraps the NumPy result of a bulk operation in an array of this type.
+
+        Args:
+            values (numpy.ndarray): The one-dimensional result.
+
+        Returns:
+            DynamicArray: A new array holding the values.
+        """
+        result = self._empty_like(max(len(values), 1))
+        result.extend(values.tolist())
+        return result
+
+    def stats(self):
+        """
+        Returns resize telemetry for the array.
+
+        Returns:
+            dict: The length, capacity, number of reallocations and number of
+            elements copied by them.
+        """
+        return {
+            "length": self._n,
+            "capacity": self._capacity,
+            "resizes": self._resize_count,
+            "elements_copied": self._copied_count,
+        }
 
 
 if __name__ == "__main__":
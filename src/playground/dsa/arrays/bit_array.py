@@ -0,0 +1,246 @@
+from playground.dsa.logging_config import logger
+
+
+class BitArray:
+    """
+    Fixed-size array of bits packed eight to a byte.
+
+    Bit i lives in byte i // 8 at bit position i % 8 (least significant
+    first), so the whole array reads as one little-endian integer. Counting
+    and the bulk ``&``, ``|``, ``^`` and ``~`` operators work on that integer
+    a machine word at a time instead of bit by bit. Unused bits in the last
+    byte are always kept clear.
+
+    Attributes:
+        _n (int): The number of bits.
+        _bits (bytearray): The packed bits.
+    """
+
+    __slots__ = ("_n", "_bits")
+
+    def __init__(self, size, fill=False):
+        """
+        Initializes the BitArray.
+
+        Args:
+            size (int): The number of bits. Must be >= 0.
+            fill (bool): The initial value of every bit.
+        """
+        if not isinstance(size, int) or size < 0:
+            raise ValueError("Size must be a non-negative integer.")
+
+        self._n = size
+        self._bits = bytearray((size + 7) // 8)
+        if fill:
+            self.setall(True)
+
+    @classmethod
+    def _from_int(cls, size, value):
+        """Creates a BitArray of the given size from its integer form."""
+        bit_array = cls(size)
+        bit_array._bits[:] = value.to_bytes(len(bit_array._bits), "little")
+        return bit_array
+
+    def _to_int(self):
+        """Returns the bits as one little-endian integer."""
+        return int.from_bytes(self._bits, "little")
+
+    def __len__(self):
+        """
+        Returns the number of bits.
+
+        Returns:
+            int: The number of bits.
+        """
+        return self._n
+
+    def __getitem__(self, index):
+        """
+        Returns the bit at the given index.
+
+        Args:
+            index (int): The index of the bit.
+
+        Returns:
+            bool: The value of the bit.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if not 0 <= index < self._n:
+            raise IndexError("Index out of range.")
+        return bool(self._bits[index >> 3] & (1 << (index & 7)))
+
+    def __setitem__(self, index, value):
+        """
+        Sets or clears the bit at the given index.
+
+        Args:
+            index (int): The index of the bit.
+            value (bool): The new value of the bit.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if not 0 <= index < self._n:
+            raise IndexError("Index out of range.")
+        if value:
+            self._bits[index >> 3] |= 1 << (index & 7)
+        else:
+            self._bits[index >> 3] &= ~(1 << (index & 7))
+
+    def __iter__(self):
+        """
+        Returns an iterator over the bits.
+
+        Yields:
+            bool: The next bit.
+        """
+        for i in range(self._n):
+            yield bool(self._bits[i >> 3] & (1 << (i & 7)))
+
+    def __eq__(self, other):
+        if not isinstance(other, BitArray):
+            return NotImplemented
+        return self._n == other._n and self._bits == other._bits
+
+    def __repr__(self):
+        """
+        Returns a string representation of the bits, lowest index first.
+
+        Returns:
+            str: A string representation of the bit array.
+        """
+        return f"BitArray('{''.join('1' if bit else '0' for bit in self)}')"
+
+    def test_and_set(self, index):
+        """
+        Sets the bit at the given index and returns its previous value.
+
+        Args:
+            index (int): The index of the bit.
+
+        Returns:
+            bool: True if the bit was already set.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if not 0 <= index < self._n:
+            raise IndexError("Index out of range.")
+        mask = 1 << (index & 7)
+        byte = self._bits[index >> 3]
+        self._bits[index >> 3] = byte | mask
+        return bool(byte & mask)
+
+    def setall(self, value):
+        """
+        Sets or clears every bit.
+
+        Args:
+            value (bool): The new value of every bit.
+        """
+        self._bits[:] = (b"\xff" if value else b"\x00") * len(self._bits)
+        self._clear_padding()
+
+    def count(self):
+        """
+        Returns the number of set bits (the population count).
+
+        Returns:
+            int: The number of bits that are set.
+        """
+        return self._to_int().bit_count()
+
+    def find_first_set(self):
+        """
+        Returns the index of the first set bit.
+
+        Returns:
+            int: The index of the first set bit, or -1 if no bit is set.
+        """
+        skipped = len(self._bits) - len(self._bits.lstrip(b"\x00"))
+        if skipped == len(self._bits):
+            return -1
+        byte = self._bits[skipped]
+        return skipped * 8 + (byte & -byte).bit_length() - 1
+
+    def find_first_unset(self):
+        """
+        Returns the index of the first clear bit.
+
+        Whole bytes of set bits are skipped in one C-level scan.
+
+        Returns:
+            int: The index of the first clear bit, or -1 if every bit is set.
+        """
+        skipped = len(self._bits) - len(self._bits.lstrip(b"\xff"))
+        if skipped == len(self._bits):
+            return -1
+        byte = self._bits[skipped]
+        index = skipped * 8 + (~byte & (byte + 1)).bit_length() - 1
+        return index if index < self._n else -1  # Padding bits are always clear
+
+    def tobytes(self):
+        """
+        Returns the packed bits.
+
+        Returns:
+            bytes: The bits, eight per byte, least significant bit first.
+        """
+        return bytes(self._bits)
+
+    def _clear_padding(self):
+        """Clears the unused bits of the last byte."""
+        if self._n & 7:
+            self._bits[-1] &= (1 << (self._n & 7)) - 1
+
+    def _check_size(self, other):
+        """
+        Validates the operand of a bulk operation.
+
+        Raises:
+            TypeError: If 'other' is not a BitArray.
+            ValueError: If 'other' has a different number of bits.
+        """
+        if not isinstance(other, BitArray):
+            raise TypeError("Bulk operations need another BitArray.")
+        if other._n != self._n:
+            raise ValueError("Bit arrays must have the same length.")
+
+    def __and__(self, other):
+        self._check_size(other)
+        return self._from_int(self._n, self._to_int() & other._to_int())
+
+    def __or__(self, other):
+        self._check_size(other)
+        return self._from_int(self._n, self._to_int() | other._to_int())
+
+    def __xor__(self, other):
+        self._check_size(other)
+        return self._from_int(self._n, self._to_int() ^ other._to_int())
+
+    def __invert__(self):
+        return self._from_int(self._n, ~self._to_int() & ((1 << self._n) - 1))
+
+    def __iand__(self, other):
+        self._bits[:] = (self & other)._bits
+        return self
+
+    def __ior__(self, other):
+        self._bits[:] = (self | other)._bits
+        return self
+
+    def __ixor__(self, other):
+        self._bits[:] = (self ^ other)._bits
+        return self
+
+
+if __name__ == "__main__":
+    visited = BitArray(10)
+    logger.debug(visited.test_and_set(3))  # Output: False
+    logger.debug(visited.test_and_set(3))  # Output: True
+    visited.setall(True)
+    visited[7] = False
+    logger.debug(visited.find_first_unset())  # Output: 7
+    logger.debug((visited & ~BitArray(10, fill=True)).count())  # Output: 0
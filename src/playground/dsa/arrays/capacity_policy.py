@@ -0,0 +1,145 @@
+from abc import ABC, abstractmethod
+
+
+class CapacityPolicy(ABC):
+    """
+    Decides how a DynamicArray grows and when it gives memory back.
+    """
+
+    @abstractmethod
+    def grow(self, capacity, required):
+        """
+        Returns the capacity to grow to.
+
+        Args:
+            capacity (int): The current capacity.
+            required (int): The number of slots that must fit.
+
+        Returns:
+            int: The new capacity, at least 'required'.
+        """
+        pass
+
+    @abstractmethod
+    def shrink(self, capacity, n):
+        """
+        Returns the capacity to shrink to after a removal, if any.
+
+        Args:
+            capacity (int): The current capacity.
+            n (int): The number of elements now stored.
+
+        Returns:
+            int: The new capacity, or None to keep the current one.
+        """
+        pass
+
+
+class GeometricPolicy(CapacityPolicy):
+    """
+    Multiplies the capacity on growth and divides it once the load drops low.
+
+    This is the classic DynamicArray behaviour: double when full, halve when
+    less than a quarter full.
+
+    Attributes:
+        factor (float): The growth factor.
+        shrink_threshold (float): The load factor below which to shrink.
+    """
+
+    def __init__(self, factor=2.0, shrink_threshold=0.25):
+        if not isinstance(factor, (int, float)) or factor <= 1.0:
+            raise ValueError("Resize factor must be a number greater than 1.")
+        if not 0 <= shrink_threshold < 1:
+            raise ValueError("Shrink threshold must be in [0, 1).")
+        self.factor = float(factor)
+        self.shrink_threshold = shrink_threshold
+
+    def grow(self, capacity, required):
+        return max(required, int(capacity * self.factor))
+
+    def shrink(self, capacity, n):
+        if n < int(capacity * self.shrink_threshold) and capacity > 1:
+            return max(int(capacity / self.factor), 1)
+        return None
+
+
+class AdditivePolicy(CapacityPolicy):
+    """
+    Grows the capacity by a fixed increment and frees whole increments.
+
+    Wastes at most about two increments of slots, at the cost of O(n)
+    amortized appends once n is much larger than the increment.
+
+    Attributes:
+        increment (int): The number of slots added per growth step.
+    """
+
+    def __init__(self, increment=64):
+        if not isinstance(increment, int) or increment <= 0:
+            raise ValueError("Increment must be a positive integer.")
+        self.increment = increment
+
+    def grow(self, capacity, required):
+        steps = -(-(required - capacity) // self.increment)  # Ceiling division
+        return capacity + max(steps, 1) * self.increment
+
+    def shrink(self, capacity, n):
+        if capacity - n > 2 * self.increment:
+            return max(n + self.increment, 1)
+        return None
+
+
+class HysteresisPolicy(CapacityPolicy):
+    """
+    Geometric growth with a shrink band that keeps the array from thrashing.
+
+    The array only shrinks once its load factor falls below 'shrink_below',
+    and then only down to a load factor of 'shrink_to', leaving room for
+    growth before the next reallocation in either direction.
+
+    Attributes:
+        factor (float): The growth factor.
+        shrink_below (float): The load factor below which to shrink.
+        shrink_to (float): The load factor to shrink to.
+    """
+
+    def __init__(self, factor=2.0, shrink_below=0.25, shrink_to=0.5):
+        if not isinstance(factor, (int, float)) or factor <= 1.0:
+            raise ValueError("Resize factor must be a number greater than 1.")
+        if not 0 < shrink_below < shrink_to < 1:
+            raise ValueError("Expected 0 < shrink_below < shrink_to < 1.")
+        self.factor = float(factor)
+        self.shrink_below = shrink_below
+        self.shrink_to = shrink_to
+
+    def grow(self, capacity, required):
+        return max(required, int(capacity * self.factor))
+
+    def shrink(self, capacity, n):
+        if n < capacity * self.shrink_below:
+            target = max(int(n / self.shrink_to), 1)
+            return target if target < capacity else None
+        return None
+
+
+class NeverShrinkPolicy(CapacityPolicy):
+    """
+    Geometric growth that never gives memory back on removal.
+
+    Use ``shrink_to_fit()`` to release memory explicitly.
+
+    Attributes:
+        factor (float): The growth factor.
+    """
+
+    def __init__(self, factor=2.0):
+        if not isinstance(factor, (int, float)) or factor <= 1.0:
+            raise ValueError("Resize factor must be a number greater than 1.")
+        self.factor = float(factor)
+
+    def grow(self, capacity, required):
+        return max(required, int(capacity * self.factor))
+
+    def shrink(self, capacity, n):
+        return None
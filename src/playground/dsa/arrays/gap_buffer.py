@@ -0,0 +1,345 @@
+from playground.dsa.logging_config import logger
+
+from .array_adt import DynamicArrayADT
+
+
+class GapBuffer(DynamicArrayADT):
+    """
+    Sequence with a movable gap at the cursor, for edits that cluster together.
+
+    The free capacity is kept as a gap at the cursor position, so inserting
+    or deleting at the cursor is O(1) amortized and moving the cursor only
+    copies the elements it passes over.
+
+    Attributes:
+        _A (list): The underlying storage, elements on both sides of the gap.
+        _gap_start (int): The first slot of the gap, which is also the cursor.
+        _gap_end (int): One past the last slot of the gap.
+        _RESIZE_FACTOR (float): The factor by which to grow the storage.
+    """
+
+    _RESIZE_FACTOR = 2.0
+
+    def __init__(self, initial_capacity=10, resize_factor=2.0):
+        """
+        Initializes the GapBuffer.
+
+        Args:
+            initial_capacity (int): The initial capacity of the buffer. Must be > 0.
+            resize_factor (float): The factor by which to grow the buffer on resize. Must be > 1.
+        """
+        if not isinstance(initial_capacity, int) or initial_capacity <= 0:
+            raise ValueError("Initial capacity must be a positive integer.")
+        if not isinstance(resize_factor, (int, float)) or resize_factor <= 1.0:
+            raise ValueError("Resize factor must be a number greater than 1.")
+
+        self._A = self._make_array(initial_capacity)
+        self._gap_start = 0
+        self._gap_end = initial_capacity
+        self._RESIZE_FACTOR = float(resize_factor)
+
+    def __len__(self):
+        """
+        Returns the number of elements in the buffer.
+
+        Returns:
+            int: The number of elements.
+        """
+        return len(self._A) - (self._gap_end - self._gap_start)
+
+    def __getitem__(self, index):
+        """
+        Retrieves the element at the given index, or a copy of the given slice.
+
+        Args:
+            index (int or slice): The index of the element to retrieve.
+
+        Returns:
+            object: The element at the specified index, or a new GapBuffer
+            holding the sliced elements.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if isinstance(index, slice):
+            r = range(len(self))[index]
+            result = GapBuffer(initial_capacity=max(len(r), 1))
+            result.insert_many([self[i] for i in r])
+            return result
+        if not 0 <= index < len(self):
+            raise IndexError("Index out of range.")
+        return self._A[self._slot(index)]
+
+    def __setitem__(self, index, obj):
+        """
+        Sets the element at the given index to the specified value.
+
+        Args:
+            index (int): The index to set.
+            obj (object): The value to set at the index.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if not 0 <= index < len(self):
+            raise IndexError("Index out of range.")
+        self._A[self._slot(index)] = obj
+
+    def __iter__(self):
+        """
+        Returns an iterator for the buffer.
+
+        Yields:
+            object: The next element in the buffer.
+        """
+        yield from self._A[: self._gap_start]
+        yield from self._A[self._gap_end :]
+
+    def __contains__(self, obj):
+        """
+        Checks if the buffer contains the specified object.
+
+        Args:
+            obj (object): The object to search for.
+
+        Returns:
+            bool: True if the object is found, False otherwise.
+        """
+        return obj in self._A[: self._gap_start] or obj in self._A[self._gap_end :]
+
+    def __add__(self, other):
+        """
+        Concatenates this GapBuffer with another sequence of the DynamicArray family.
+
+        Args:
+            other (DynamicArrayADT): The other array to concatenate with.
+
+        Returns:
+            GapBuffer: A new GapBuffer containing all elements, cursor at the end.
+
+        Raises:
+            TypeError: If 'other' is not a DynamicArrayADT.
+        """
+        if not isinstance(other, DynamicArrayADT):
+            raise TypeError(
+                "Can only concatenate GapBuffer with another DynamicArrayADT."
+            )
+        result = GapBuffer(initial_capacity=max(len(self) + len(other), 1))
+        result.insert_many(self)
+        result.insert_many(other)
+        return result
+
+    def __repr__(self):
+        """
+        Returns a string representation of the buffer.
+
+        Returns:
+            str: A string representation of the buffer.
+        """
+        return f"[{', '.join(map(str, self))}]"
+
+    def _make_array(self, c):
+        """
+        Creates new storage of the given capacity.
+
+        Args:
+            c (int): The capacity of the storage.
+
+        Returns:
+            list: A list of c empty slots.
+        """
+        if not isinstance(c, int) or c <= 0:
+            raise ValueError("Capacity must be a positive integer.")
+        return [None] * c
+
+    @property
+    def cursor(self):
+        """
+        Returns the cursor position (the index the next insert goes to).
+
+        Returns:
+            int: The cursor position.
+        """
+        return self._gap_start
+
+    def move_cursor(self, position):
+        """
+        Moves the cursor, copying only the elements between the old and new positions.
+
+        Args:
+            position (int): The new cursor position, 0 <= position <= len(self).
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        if not 0 <= position <= len(self):
+            raise IndexError("Cursor position out of range.")
+
+        start, end = self._gap_start, self._gap_end
+        if position < start:
+            # Elements in [position, start) move to the right end of the gap
+            distance = start - position
+            self._A[end - distance : end] = self._A[position:start]
+            stale_end = min(start, end - distance)
+            self._A[position:stale_end] = [None] * (stale_end - position)
+            self._gap_start, self._gap_end = position, end - distance
+        elif position > start:
+            # Elements after the gap move to its left end
+            distance = position - start
+            self._A[start:position] = self._A[end : end + distance]
+            stale_start = max(position, end)
+            self._A[stale_start : end + distance] = [None] * (
+                end + distance - stale_start
+            )
+            self._gap_start, self._gap_end = position, end + distance
+
+    def insert_at_cursor(self, obj):
+        """
+        Inserts an element at the cursor and moves the cursor past it.
+
+        Args:
+            obj (object): The element to insert.
+        """
+        if self._gap_start == self._gap_end:
+            self._grow(1)
+        self._A[self._gap_start] = obj
+        self._gap_start += 1
+
+    def insert_many(self, iterable):
+        """
+        Inserts all elements of an iterable at the cursor in one block copy.
+
+        The cursor ends up after the inserted elements.
+
+        Args:
+            iterable (iterable): The elements to insert.
+        """
+        block = list(iterable)
+        if len(block) > self._gap_end - self._gap_start:
+            self._grow(len(block))
+        self._A[self._gap_start : self._gap_start + len(block)] = block
+        self._gap_start += len(block)
+
+    def delete_at_cursor(self, count=1):
+        """
+        Removes elements following the cursor.
+
+        Args:
+            count (int): The number of elements to remove.
+
+        Returns:
+            list: The removed elements.
+
+        Raises:
+            IndexError: If fewer than 'count' elements follow the cursor.
+        """
+        if not 0 <= count <= len(self._A) - self._gap_end:
+            raise IndexError("Cannot delete past the end of the buffer.")
+        removed = self._A[self._gap_end : self._gap_end + count]
+        self._A[self._gap_end : self._gap_end + count] = [None] * count
+        self._gap_end += count
+        return removed
+
+    def append(self, obj):
+        """
+        Appends an element to the end of the buffer, moving the cursor there.
+
+        Args:
+            obj (object): The element to append.
+        """
+        self.insert(len(self), obj)
+
+    def insert(self, index, obj):
+        """
+        Inserts an element at the specified index, moving the cursor after it.
+
+        Args:
+            index (int): The index at which to insert the element.
+            obj (object): The element to insert.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        self.move_cursor(index)
+        self.insert_at_cursor(obj)
+
+    def pop(self, index=-1):
+        """
+        Removes and returns the element at the given index (default: last element).
+
+        The cursor is left at the removed position.
+
+        Args:
+            index (int): The index of the element to remove.
+
+        Returns:
+            object: The removed element.
+
+        Raises:
+            IndexError: If the index is out of range or the buffer is empty.
+        """
+        if not 0 <= index < len(self):
+            if index == -1 and len(self) > 0:
+                index = len(self) - 1
+            else:
+                raise IndexError("Index out of range.")
+        self.move_cursor(index)
+        return self.delete_at_cursor()[0]
+
+    def extend(self, iterable):
+        """
+        Extends the buffer by appending elements from an iterable.
+
+        Args:
+            iterable (iterable): The iterable containing elements to append.
+        """
+        self.move_cursor(len(self))
+        self.insert_many(iterable)
+
+    def clear(self):
+        """
+        Removes all elements from the buffer.
+        """
+        self._A = self._make_array(len(self._A))
+        self._gap_start = 0
+        self._gap_end = len(self._A)
+
+    def _slot(self, index):
+        """
+        Maps an element index to its storage slot.
+
+        Args:
+            index (int): The element index.
+
+        Returns:
+            int: The slot holding the element.
+        """
+        if index < self._gap_start:
+            return index
+        return index + self._gap_end - self._gap_start
+
+    def _grow(self, needed):
+        """
+        Enlarges the gap so that it holds at least 'needed' more elements.
+
+        Args:
+            needed (int): The number of free slots required.
+        """
+        capacity = len(self._A)
+        new_capacity = max(int(capacity * self._RESIZE_FACTOR), len(self) + needed)
+        B = self._make_array(new_capacity)
+        tail = capacity - self._gap_end
+        B[: self._gap_start] = self._A[: self._gap_start]
+        B[new_capacity - tail :] = self._A[self._gap_end :]
+        self._A = B
+        self._gap_end = new_capacity - tail
+
+
+if __name__ == "__main__":
+    gb = GapBuffer()
+    gb.insert_many("hello world")
+    gb.move_cursor(5)
+    gb.insert_at_cursor(",")
+    gb.delete_at_cursor()
+    gb.insert_many(" there ")
+    logger.debug("".join(gb))  # Output: hello, there world
@@ -0,0 +1,250 @@
+import mmap
+import os
+import struct
+from array import array
+
+from playground.dsa.logging_config import logger
+
+from .capacity_policy import GeometricPolicy
+from .typed_array import TypedDynamicArray
+
+
+class MappedDynamicArray(TypedDynamicArray):
+    """
+    Typed Dynamic Array stored in a memory-mapped file of fixed-width records.
+
+    The file starts with a small header (magic, typecode, length, capacity)
+    followed by the raw records, so reopening an existing file maps it
+    without parsing or copying. Growing extends the file and remaps it.
+
+    Memoryviews returned by ``buffer()`` pin the current mapping; release
+    them before the array is resized or closed.
+
+    Attributes:
+        _path (str): The path of the backing file.
+        _file (file): The open backing file.
+        _map (mmap.mmap): The current mapping of the backing file.
+        _header (memoryview): The length and capacity fields of the header.
+        _A (memoryview): The records, cast to the array's typecode.
+    """
+
+    _MAGIC = b"PGDARRAY"
+    _HEADER = struct.Struct("<8sc7xqq")  # magic, typecode, length, capacity
+    _LENGTH_OFFSET = 16
+
+    def __init__(
+        self, path, typecode=None, initial_capacity=10, resize_factor=2.0, policy=None
+    ):
+        """
+        Opens or creates a MappedDynamicArray.
+
+        Args:
+            path (str): The path of the backing file. An existing non-empty
+                file is reopened as is; otherwise a new one is created.
+            typecode (str): The ``array`` typecode of the records. Defaults to the
+                typecode stored in an existing file, or 'q' for a new one.
+            initial_capacity (int): The initial capacity of a new file. Must be > 0.
+            resize_factor (float): The factor by which to grow the array on resize. Must be > 1.
+            policy (CapacityPolicy): The growth and shrink policy (see DynamicArray).
+
+        Raises:
+            ValueError: If the arguments are invalid or the file is not a
+                MappedDynamicArray file with the requested typecode.
+        """
+        if not isinstance(initial_capacity, int) or initial_capacity <= 0:
+            raise ValueError("Initial capacity must be a positive integer.")
+        if not isinstance(resize_factor, (int, float)) or resize_factor <= 1.0:
+            raise ValueError("Resize factor must be a number greater than 1.")
+
+        self._path = os.fspath(path)
+        self._map = None
+        self._header = None
+        self._A = None
+        self._RESIZE_FACTOR = float(resize_factor)
+        self._policy = policy or GeometricPolicy(
+            self._RESIZE_FACTOR, self._SHRINK_THRESHOLD
+        )
+        self._resize_count = 0
+        self._copied_count = 0
+
+        exists = os.path.exists(self._path) and os.path.getsize(self._path) > 0
+        self._file = open(self._path, "r+b" if exists else "w+b")
+        try:
+            if exists:
+                magic, stored, _, capacity = self._HEADER.unpack(
+                    self._file.read(self._HEADER.size)
+                )
+                stored = stored.decode()
+                if magic != self._MAGIC:
+                    raise ValueError(f"{self._path} is not a MappedDynamicArray file.")
+                if typecode is not None and typecode != stored:
+                    raise ValueError(
+                        f"{self._path} holds typecode {stored!r}, not {typecode!r}."
+                    )
+                typecode = stored
+            else:
+                typecode = "q" if typecode is None else typecode
+                if typecode not in self._TYPECODES:
+                    raise ValueError(f"Typecode must be one of {self._TYPECODES!r}.")
+                self._file.write(
+                    self._HEADER.pack(self._MAGIC, typecode.encode(), 0, 0)
+                )
+                capacity = initial_capacity
+
+            self._typecode = typecode
+            self._capacity = capacity
+            self._A = self._make_array(capacity)
+        except Exception:
+            self.close()
+            raise
+
+    @property
+    def _n(self):
+        """
+        Returns the number of records, as stored in the file header.
+
+        Returns:
+            int: The number of records.
+        """
+        return self._header[0]
+
+    @_n.setter
+    def _n(self, value):
+        """
+        Stores the number of records in the file header.
+
+        Args:
+            value (int): The number of records.
+        """
+        self._header[0] = value
+
+    @property
+    def path(self):
+        """
+        Returns the path of the backing file.
+
+        Returns:
+            str: The file path.
+        """
+        return self._path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def flush(self):
+        """
+        Writes any modified records and the header back to the file.
+        """
+        self._map.flush()
+
+    def close(self):
+        """
+        Flushes and unmaps the file, then closes it.
+        """
+        if self._map is not None:
+            self._map.flush()
+        self._unmap()
+        if not self._file.closed:
+            self._file.close()
+
+    def clear(self):
+        """
+        Removes all records from the array, keeping the file's capacity.
+        """
+        self._n = 0
+        if self._index is not None:
+            self._index = {}
+
+    @classmethod
+    def _result_class(cls):
+        """
+        Returns TypedDynamicArray, so slices and bulk results live in memory.
+
+        Returns:
+            type: The class of new result arrays.
+        """
+        return TypedDynamicArray
+
+    def _resize(self, new_capacity):
+        """
+        Resizes the backing file to the given capacity and remaps it.
+
+        The records stay in place in the file, so nothing is copied.
+
+        Args:
+            new_capacity (int): The new capacity of the array.
+        """
+        if not isinstance(new_capacity, int) or new_capacity <= 0:
+            raise ValueError("New capacity must be a positive integer.")
+        self._A = self._make_array(new_capacity)
+        self._capacity = new_capacity
+        self._resize_count += 1
+
+    def _make_array(self, c):
+        """
+        Sizes the backing file for the given capacity and maps its records.
+
+        Args:
+            c (int): The capacity of the array.
+
+        Returns:
+            memoryview: The mapped records, cast to the array's typecode.
+        """
+        if not isinstance(c, int) or c <= 0:
+            raise ValueError("Capacity must be a positive integer.")
+
+        self._unmap()
+        self._file.truncate(self._HEADER.size + c * array(self._typecode).itemsize)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        records = self._map_views()
+        self._header[1] = c
+        return records
+
+    def _map_views(self):
+        """
+        Maps the header fields into '_header' and casts the records of the current mapping.
+
+        Returns:
+            memoryview: The mapped records, cast to the array's typecode.
+        """
+        fields = memoryview(self._map)[self._LENGTH_OFFSET : self._HEADER.size]
+        self._header = fields.cast("q")
+        return memoryview(self._map)[self._HEADER.size :].cast(self._typecode)
+
+    def _unmap(self):
+        """
+        Releases the views onto the current mapping and closes it.
+
+        Raises:
+            BufferError: If a view from ``buffer()`` or ``to_numpy()`` is still
+                alive. The mapping is then left open and the array unchanged.
+        """
+        for view in (self._A, self._header):
+            if view is not None:
+                view.release()
+        self._A = self._header = None
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                self._A = self._map_views()  # The records are still mapped
+                raise BufferError(
+                    "Release the views from buffer() before resizing or closing the array."
+                ) from None
+            self._map = None
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    path = os.path.join(tempfile.mkdtemp(), "samples.bin")
+    with MappedDynamicArray(path, "d", initial_capacity=2) as samples:
+        samples.extend([0.5, 1.5, 2.5])
+        logger.debug(samples)  # Output: [0.5, 1.5, 2.5]
+
+    with MappedDynamicArray(path) as samples:
+        logger.debug(samples.typecode)  # Output: d
+        logger.debug(samples.pop())  # Output: 2.5
@@ -0,0 +1,474 @@
+from playground.dsa.logging_config import logger
+
+from .arrays import DynamicArray
+
+_BITS = 5
+_WIDTH = 1 << _BITS  # 32-way branching
+_MASK = _WIDTH - 1
+
+
+class _Node:
+    """
+    Interior or leaf node of a vector trie.
+
+    Attributes:
+        children (list): Up to 32 child nodes, or elements in a leaf.
+        owner (object): The transient allowed to mutate this node in place.
+    """
+
+    __slots__ = ("children", "owner")
+
+    def __init__(self, children=None, owner=None):
+        self.children = children if children is not None else []
+        self.owner = owner
+
+
+class PersistentVector:
+    """
+    Immutable vector stored as a 32-way trie with a tail buffer.
+
+    ``set``, ``append`` and ``pop`` return a new vector in O(log32 n) and
+    share every untouched node with the original, so old versions stay
+    valid and cheap to keep. The last (up to 32) elements live in a tail
+    outside the trie, which makes ``append`` and ``pop`` O(1) in most cases.
+    Use ``transient()`` to build or edit a vector in place, then call
+    ``persistent()`` to freeze it again.
+
+    Attributes:
+        _n (int): The number of elements.
+        _shift (int): The bit shift of the root level.
+        _root (_Node): The root of the trie holding all but the tail.
+        _tail (list): The last elements, not yet pushed into the trie.
+    """
+
+    __slots__ = ("_n", "_shift", "_root", "_tail")
+
+    def __init__(self, iterable=()):
+        """
+        Initializes the PersistentVector.
+
+        Args:
+            iterable (iterable): The initial elements.
+        """
+        self._n = 0
+        self._shift = _BITS
+        self._root = _Node()
+        self._tail = []
+        if iterable:
+            built = TransientVector(self).extend(iterable)
+            self._n, self._shift, self._root, self._tail = (
+                built._n,
+                built._shift,
+                built._root,
+                built._tail,
+            )
+
+    @classmethod
+    def _make(cls, n, shift, root, tail):
+        """Creates a vector directly from its trie parts."""
+        vector = cls.__new__(cls)
+        vector._n, vector._shift, vector._root, vector._tail = n, shift, root, tail
+        return vector
+
+    @classmethod
+    def from_dynamic_array(cls, array):
+        """
+        Builds a PersistentVector holding the elements of a DynamicArray.
+
+        Args:
+            array (DynamicArray): The array to copy.
+
+        Returns:
+            PersistentVector: A new vector.
+        """
+        return cls(array)
+
+    def to_dynamic_array(self):
+        """
+        Copies the elements into a new DynamicArray.
+
+        Returns:
+            DynamicArray: A new array holding the elements.
+        """
+        array = DynamicArray(initial_capacity=max(self._n, 1))
+        array.extend(list(self))
+        return array
+
+    def __len__(self):
+        """
+        Returns the number of elements in the vector.
+
+        Returns:
+            int: The number of elements.
+        """
+        return self._n
+
+    def __getitem__(self, index):
+        """
+        Retrieves the element at the given index in O(log32 n).
+
+        Args:
+            index (int): The index of the element to retrieve.
+
+        Returns:
+            object: The element at the specified index.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if not 0 <= index < self._n:
+            raise IndexError("Index out of range.")
+        return self._leaf_for(index)[index & _MASK]
+
+    def __iter__(self):
+        """
+        Returns an iterator for the vector, one leaf at a time.
+
+        Yields:
+            object: The next element in the vector.
+        """
+        tail_offset = self._tail_offset()
+        for start in range(0, tail_offset, _WIDTH):
+            yield from self._leaf_for(start)
+        yield from self._tail
+
+    def __contains__(self, obj):
+        """
+        Checks if the vector contains the specified object.
+
+        Args:
+            obj (object): The object to search for.
+
+        Returns:
+            bool: True if the object is found, False otherwise.
+        """
+        return any(value == obj for value in self)
+
+    def __eq__(self, other):
+        if not isinstance(other, PersistentVector):
+            return NotImplemented
+        return self._n == other._n and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self):
+        """
+        Returns a string representation of the vector.
+
+        Returns:
+            str: A string representation of the vector.
+        """
+        return f"PersistentVector([{', '.join(map(str, self))}])"
+
+    def set(self, index, obj):
+        """
+        Returns a new vector with the element at the given index replaced.
+
+        Args:
+            index (int): The index to set.
+            obj (object): The new value.
+
+        Returns:
+            PersistentVector: The updated vector.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if not 0 <= index < self._n:
+            raise IndexError("Index out of range.")
+        if index >= self._tail_offset():
+            tail = list(self._tail)
+            tail[index & _MASK] = obj
+            return self._make(self._n, self._shift, self._root, tail)
+        root = _assoc(self._root, self._shift, index, obj, None)
+        return self._make(self._n, self._shift, root, self._tail)
+
+    def append(self, obj):
+        """
+        Returns a new vector with the element added at the end.
+
+        Args:
+            obj (object): The element to append.
+
+        Returns:
+            PersistentVector: The extended vector.
+        """
+        if len(self._tail) < _WIDTH:
+            return self._make(self._n + 1, self._shift, self._root, self._tail + [obj])
+        root, shift = _push_tail(
+            self._root, self._shift, self._n, _Node(self._tail), None
+        )
+        return self._make(self._n + 1, shift, root, [obj])
+
+    def pop(self):
+        """
+        Returns a new vector without its last element.
+
+        Returns:
+            PersistentVector: The shortened vector.
+
+        Raises:
+            IndexError: If the vector is empty.
+        """
+        if self._n == 0:
+            raise IndexError("Cannot pop from an empty vector.")
+        if self._n == 1:
+            return PersistentVector()
+        if len(self._tail) > 1:
+            return self._make(self._n - 1, self._shift, self._root, self._tail[:-1])
+        tail = self._leaf_for(self._n - 2)
+        root, shift = _pop_tail(self._root, self._shift, self._n, None)
+        return self._make(self._n - 1, shift, root, list(tail))
+
+    def transient(self):
+        """
+        Returns a mutable TransientVector sharing this vector's structure.
+
+        Returns:
+            TransientVector: A transient copy that edits nodes in place.
+        """
+        return TransientVector(self)
+
+    def _tail_offset(self):
+        """
+        Returns the index of the first element stored in the tail.
+
+        Returns:
+            int: The tail offset.
+        """
+        return 0 if self._n < _WIDTH else ((self._n - 1) >> _BITS) << _BITS
+
+    def _leaf_for(self, index):
+        """
+        Returns the list of up to 32 elements holding the given index.
+
+        Args:
+            index (int): The element index.
+
+        Returns:
+            list: The leaf (or tail) containing the index.
+        """
+        if index >= self._tail_offset():
+            return self._tail
+        node = self._root
+        for level in range(self._shift, 0, -_BITS):
+            node = node.children[(index >> level) & _MASK]
+        return node.children
+
+
+class TransientVector(PersistentVector):
+    """
+    Mutable vector for batch updates that reuses nodes it has already copied.
+
+    A transient copies each shared node once on its first write, then edits
+    it in place; ``persistent()`` ends the batch and returns an immutable
+    vector. The transient must not be used after ``persistent()``.
+
+    Attributes:
+        _owner (object): The token marking nodes this transient may mutate.
+    """
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, vector):
+        """
+        Initializes the TransientVector from a persistent vector.
+
+        Args:
+            vector (PersistentVector): The vector to start from.
+        """
+        self._owner = object()
+        self._n = vector._n
+        self._shift = vector._shift
+        self._root = _Node(list(vector._root.children), self._owner)
+        self._tail = list(vector._tail)
+
+    def _check(self):
+        """Rejects edits once the transient has been frozen."""
+        if self._owner is None:
+            raise RuntimeError("Transient used after persistent() call.")
+
+    def set(self, index, obj):
+        """
+        Replaces the element at the given index in place.
+
+        Args:
+            index (int): The index to set.
+            obj (object): The new value.
+
+        Returns:
+            TransientVector: This transient, for chaining.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        self._check()
+        if not 0 <= index < self._n:
+            raise IndexError("Index out of range.")
+        if index >= self._tail_offset():
+            self._tail[index & _MASK] = obj
+        else:
+            self._root = _assoc(self._root, self._shift, index, obj, self._owner)
+        return self
+
+    def append(self, obj):
+        """
+        Appends an element in place.
+
+        Args:
+            obj (object): The element to append.
+
+        Returns:
+            TransientVector: This transient, for chaining.
+        """
+        self._check()
+        if len(self._tail) == _WIDTH:
+            self._root, self._shift = _push_tail(
+                self._root,
+                self._shift,
+                self._n,
+                _Node(self._tail, self._owner),
+                self._owner,
+            )
+            self._tail = []
+        self._tail.append(obj)
+        self._n += 1
+        return self
+
+    def extend(self, iterable):
+        """
+        Appends every element of an iterable in place.
+
+        Args:
+            iterable (iterable): The elements to append.
+
+        Returns:
+            TransientVector: This transient, for chaining.
+        """
+        for obj in iterable:
+            self.append(obj)
+        return self
+
+    def pop(self):
+        """
+        Removes the last element in place.
+
+        Returns:
+            TransientVector: This transient, for chaining.
+
+        Raises:
+            IndexError: If the vector is empty.
+        """
+        self._check()
+        if self._n == 0:
+            raise IndexError("Cannot pop from an empty vector.")
+        if len(self._tail) > 1 or self._n == 1:
+            self._tail.pop()
+        else:
+            self._tail = list(self._leaf_for(self._n - 2))
+            self._root, self._shift = _pop_tail(
+                self._root, self._shift, self._n, self._owner
+            )
+        self._n -= 1
+        return self
+
+    def persistent(self):
+        """
+        Freezes the transient into an immutable PersistentVector.
+
+        Returns:
+            PersistentVector: A vector holding the current elements.
+        """
+        self._check()
+        self._owner = None
+        return PersistentVector._make(
+            self._n, self._shift, self._root, list(self._tail)
+        )
+
+    def transient(self):
+        return self
+
+    def __repr__(self):
+        return f"TransientVector([{', '.join(map(str, self))}])"
+
+
+def _editable(node, owner):
+    """Returns node itself if owner may mutate it, else a copy owned by owner."""
+    if owner is not None and node.owner is owner:
+        return node
+    return _Node(list(node.children), owner)
+
+
+def _assoc(node, shift, index, obj, owner):
+    """Returns a path-copied trie with the element at index replaced."""
+    node = _editable(node, owner)
+    if shift == 0:
+        node.children[index & _MASK] = obj
+    else:
+        slot = (index >> shift) & _MASK
+        node.children[slot] = _assoc(
+            node.children[slot], shift - _BITS, index, obj, owner
+        )
+    return node
+
+
+def _new_path(shift, leaf, owner):
+    """Returns a chain of single-child nodes leading down to leaf."""
+    for _ in range(0, shift, _BITS):
+        leaf = _Node([leaf], owner)
+    return leaf
+
+
+def _push_tail(root, shift, n, leaf, owner):
+    """Inserts a full tail leaf into the trie, growing the root when needed."""
+    if (n >> _BITS) > (1 << shift):
+        # The trie is full: add a level above the current root
+        return _Node([root, _new_path(shift, leaf, owner)], owner), shift + _BITS
+    return _push_leaf(root, shift, n - 1, leaf, owner), shift
+
+
+def _push_leaf(node, shift, last, leaf, owner):
+    node = _editable(node, owner)
+    slot = (last >> shift) & _MASK
+    if shift == _BITS:
+        node.children.append(leaf)
+    elif slot < len(node.children):
+        node.children[slot] = _push_leaf(
+            node.children[slot], shift - _BITS, last, leaf, owner
+        )
+    else:
+        node.children.append(_new_path(shift - _BITS, leaf, owner))
+    return node
+
+
+def _pop_tail(root, shift, n, owner):
+    """Removes the rightmost leaf from the trie, dropping a level when possible."""
+    root = _pop_leaf(root, shift, n - 2, owner) or _Node([], owner)
+    if shift > _BITS and len(root.children) == 1:
+        return root.children[0], shift - _BITS
+    return root, shift
+
+
+def _pop_leaf(node, shift, last, owner):
+    slot = (last >> shift) & _MASK
+    if shift > _BITS:
+        child = _pop_leaf(node.children[slot], shift - _BITS, last, owner)
+        if child is None and slot == 0:
+            return None
+        node = _editable(node, owner)
+        if child is None:
+            node.children.pop()
+        else:
+            node.children[slot] = child
+        return node
+    if slot == 0:
+        return None
+    node = _editable(node, owner)
+    node.children.pop()
+    return node
+
+
+if __name__ == "__main__":
+    v1 = PersistentVector(range(5))
+    v2 = v1.append(5).set(0, "zero")
+    logger.debug(v1)  # Output: PersistentVector([0, 1, 2, 3, 4])
+    logger.debug(v2)  # Output: PersistentVector([zero, 1, 2, 3, 4, 5])
+    logger.debug(v2.pop().to_dynamic_array())  # Output: [zero, 1, 2, 3, 4]
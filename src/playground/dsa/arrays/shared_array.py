@@ -0,0 +1,330 @@
+import struct
+import time
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+
+from playground.dsa.logging_config import logger
+
+from .capacity_policy import NeverShrinkPolicy
+from .typed_array import TypedDynamicArray
+
+
+class ArrayOverflowError(Exception):
+    """Exception raised when a fixed-capacity array has no room left."""
+
+    pass
+
+
+class SharedDynamicArray(TypedDynamicArray):
+    """
+    Typed Dynamic Array stored in a ``multiprocessing.shared_memory`` segment.
+
+    A parent process creates and fills the array; other processes attach to
+    it by name and read the same memory. Pickling the array only sends the
+    segment name, so passing it to pool workers copies no elements.
+
+    The segment starts with a header holding magic, typecode, length,
+    capacity and a sequence counter. Shared memory cannot grow, so the
+    capacity is fixed at creation. Writers bump the sequence counter to an
+    odd value before a mutation and back to even afterwards (a seqlock);
+    ``read_consistent`` retries a read until it saw no concurrent write.
+    Concurrent writers must serialize among themselves.
+
+    Attributes:
+        _shm (SharedMemory): The shared memory segment.
+        _header (memoryview): The length, capacity and sequence header fields.
+        _A (memoryview): The elements, cast to the array's typecode.
+        _write_depth (int): Nesting depth of the current write.
+    """
+
+    _MAGIC = b"PGSHARED"
+    _HEADER = struct.Struct("<8sc7xqqq")  # magic, typecode, length, capacity, sequence
+    _FIELDS_OFFSET = 16
+    _LENGTH, _CAPACITY, _SEQUENCE = range(3)
+
+    def __init__(self, typecode="q", initial_capacity=10, name=None):
+        """
+        Creates a new shared memory segment holding an empty array.
+
+        Args:
+            typecode (str): The ``array`` typecode of the elements.
+            initial_capacity (int): The fixed capacity of the array. Must be > 0.
+            name (str): The name of the segment (default: a random name).
+
+        Raises:
+            ValueError: If the arguments are invalid.
+        """
+        if typecode not in self._TYPECODES:
+            raise ValueError(f"Typecode must be one of {self._TYPECODES!r}.")
+        if not isinstance(initial_capacity, int) or initial_capacity <= 0:
+            raise ValueError("Initial capacity must be a positive integer.")
+
+        itemsize = struct.calcsize(typecode)
+        shm = shared_memory.SharedMemory(
+            name=name, create=True, size=self._HEADER.size + initial_capacity * itemsize
+        )
+        self._HEADER.pack_into(
+            shm.buf, 0, self._MAGIC, typecode.encode(), 0, initial_capacity, 0
+        )
+        self._bind(shm)
+
+    @classmethod
+    def attach(cls, name):
+        """
+        Attaches to an existing SharedDynamicArray segment by name.
+
+        Args:
+            name (str): The name of the segment.
+
+        Returns:
+            SharedDynamicArray: An array sharing the segment's memory.
+
+        Raises:
+            ValueError: If the segment does not hold a SharedDynamicArray.
+        """
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:  # 'track' was added in Python 3.13
+            shm = shared_memory.SharedMemory(name=name)
+        if bytes(shm.buf[: len(cls._MAGIC)]) != cls._MAGIC:
+            shm.close()
+            raise ValueError(f"{name} is not a SharedDynamicArray segment.")
+
+        array = cls.__new__(cls)
+        array._bind(shm)
+        return array
+
+    def _bind(self, shm):
+        """
+        Binds this array to a shared memory segment with an initialized header.
+
+        Args:
+            shm (SharedMemory): The shared memory segment.
+        """
+        _, typecode, _, capacity, _ = self._HEADER.unpack_from(shm.buf, 0)
+        self._shm = shm
+        self._write_depth = 0
+        self._policy = NeverShrinkPolicy()
+        self._resize_count = 0
+        self._copied_count = 0
+        self._typecode = typecode.decode()
+        self._capacity = capacity
+        fields = shm.buf[self._FIELDS_OFFSET : self._HEADER.size]
+        self._header = fields.cast("q")
+        end = self._HEADER.size + capacity * struct.calcsize(self._typecode)
+        self._A = shm.buf[self._HEADER.size : end].cast(self._typecode)
+
+    def __reduce__(self):
+        """
+        Pickles the array as a reference to its segment, not its elements.
+
+        Returns:
+            tuple: A callable and arguments that attach to the segment.
+        """
+        return (type(self).attach, (self.name,))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def _n(self):
+        """
+        Returns the number of elements, as stored in the shared header.
+
+        Returns:
+            int: The number of elements.
+        """
+        return self._header[self._LENGTH]
+
+    @_n.setter
+    def _n(self, value):
+        """
+        Stores the number of elements in the shared header.
+
+        Args:
+            value (int): The number of elements.
+        """
+        self._header[self._LENGTH] = value
+
+    @property
+    def name(self):
+        """
+        Returns the name other processes use to attach to the segment.
+
+        Returns:
+            str: The segment name.
+        """
+        return self._shm.name
+
+    @property
+    def version(self):
+        """
+        Returns the current value of the seqlock counter.
+
+        Returns:
+            int: The sequence number; odd while a write is in progress.
+        """
+        return self._header[self._SEQUENCE]
+
+    @contextmanager
+    def write(self):
+        """
+        Marks a group of mutations as a single write for concurrent readers.
+
+        Yields:
+            SharedDynamicArray: This array.
+        """
+        if self._write_depth == 0:
+            self._header[self._SEQUENCE] += 1
+        self._write_depth += 1
+        try:
+            yield self
+        finally:
+            self._write_depth -= 1
+            if self._write_depth == 0:
+                self._header[self._SEQUENCE] += 1
+
+    def read_consistent(self, func, timeout=1.0):
+        """
+        Calls func(self) until it runs without overlapping a write.
+
+        Between attempts the reader backs off, first yielding the CPU and then
+        sleeping up to a millisecond, so a long write is not met with a busy spin.
+
+        Args:
+            func (callable): The read to perform.
+            timeout (float): The most seconds to keep retrying. A writer that
+                died mid-write leaves the sequence odd, so the wait must end.
+
+        Returns:
+            object: The result of the first read that saw no concurrent write.
+
+        Raises:
+            TimeoutError: If no read succeeded within the timeout.
+        """
+        deadline = time.monotonic() + timeout
+        delay = 0.0
+        while True:
+            before = self._header[self._SEQUENCE]
+            if not before % 2:
+                try:
+                    result = func(self)
+                except IndexError:
+                    if self._header[self._SEQUENCE] == before:
+                        raise
+                else:
+                    if self._header[self._SEQUENCE] == before:
+                        return result
+            if time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"No consistent read within {timeout} s; is a writer stuck?"
+                )
+            time.sleep(delay)  # sleep(0) just yields the CPU
+            delay = min(delay * 2 or 1e-6, 1e-3)
+
+    def snapshot(self):
+        """
+        Copies the elements into a private TypedDynamicArray without tearing.
+
+        Returns:
+            TypedDynamicArray: A consistent copy of the elements.
+        """
+        return self.read_consistent(lambda array: array[:])
+
+    def __setitem__(self, index, obj):
+        with self.write():
+            super().__setitem__(index, obj)
+
+    def append(self, obj):
+        with self.write():
+            super().append(obj)
+
+    def insert(self, index, obj):
+        with self.write():
+            super().insert(index, obj)
+
+    def pop(self, index=-1):
+        with self.write():
+            return super().pop(index)
+
+    def remove(self, obj):
+        with self.write():
+            super().remove(obj)
+
+    def extend(self, iterable):
+        with self.write():
+            super().extend(iterable)
+
+    def clear(self):
+        """
+        Removes all elements from the array, keeping the segment.
+        """
+        with self.write():
+            self._n = 0
+
+    def enable_index(self):
+        """
+        Not supported: a per-process index cannot see writes from other processes.
+
+        Raises:
+            TypeError: Always.
+        """
+        raise TypeError("SharedDynamicArray does not support a value index.")
+
+    def __del__(self):
+        if hasattr(self, "_shm"):
+            self.close()
+
+    def close(self):
+        """
+        Detaches this process from the segment.
+        """
+        for view in (self._A, self._header):
+            view.release()
+        self._shm.close()
+
+    def unlink(self):
+        """
+        Destroys the segment once every process has closed it.
+        """
+        self._shm.unlink()
+
+    @classmethod
+    def _result_class(cls):
+        """
+        Returns TypedDynamicArray, so slices and bulk results stay private.
+
+        Returns:
+            type: The class of new result arrays.
+        """
+        return TypedDynamicArray
+
+    def _resize(self, new_capacity):
+        """
+        Rejects growth, since a shared memory segment has a fixed size.
+
+        Shrinking is a no-op: the segment keeps its capacity.
+
+        Args:
+            new_capacity (int): The requested capacity.
+
+        Raises:
+            ArrayOverflowError: If the requested capacity exceeds the segment's.
+        """
+        if new_capacity > self._capacity:
+            raise ArrayOverflowError(
+                f"SharedDynamicArray is full (capacity {self._capacity})."
+            )
+
+
+if __name__ == "__main__":
+    from multiprocessing import Pool
+
+    with SharedDynamicArray("d", initial_capacity=1000) as samples:
+        samples.extend(i / 2 for i in range(1000))
+        with Pool(2) as pool:
+            logger.debug(pool.map(sum, [samples] * 2))  # Output: [249750.0, 249750.0]
+        samples.unlink()
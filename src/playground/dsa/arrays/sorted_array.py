@@ -0,0 +1,440 @@
+from playground.algorithms.searches.binary_search import lower_bound, upper_bound
+from playground.dsa.logging_config import logger
+
+
+class SortedArray:
+    """
+    Sorted sequence stored as a list of sorted blocks.
+
+    Each block holds between about load / 2 and 2 * load elements, and
+    '_maxes' records the largest element of every block. A search first
+    bisects '_maxes' to find the block, then bisects inside it, so
+    ``add`` and ``discard`` only shift elements within one short block.
+    Positional access walks a Fenwick tree of the block lengths. The tree
+    is updated in place while blocks keep their layout and is rebuilt
+    lazily after a block is split or merged.
+
+    Attributes:
+        _n (int): The number of elements.
+        _load (int): The target block size.
+        _lists (list): The sorted blocks, in order.
+        _maxes (list): The last (largest) element of each block.
+        _fenwick (list): A 1-based Fenwick tree of block lengths, or None
+            when it must be rebuilt.
+    """
+
+    def __init__(self, iterable=(), load=1000):
+        """
+        Initializes the SortedArray.
+
+        Args:
+            iterable (iterable): The initial elements, in any order.
+            load (int): The target block size. Must be >= 4.
+        """
+        if not isinstance(load, int) or load < 4:
+            raise ValueError("Load must be an integer of at least 4.")
+
+        self._load = load
+        self._reset(sorted(iterable))
+
+    def __len__(self):
+        """
+        Returns the number of elements.
+
+        Returns:
+            int: The number of elements.
+        """
+        return self._n
+
+    def __getitem__(self, index):
+        """
+        Retrieves the element at the given position in sorted order.
+
+        Args:
+            index (int): The position of the element.
+
+        Returns:
+            object: The element at that position.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if not 0 <= index < self._n:
+            raise IndexError("Index out of range.")
+        if index == self._n - 1:
+            return self._maxes[-1]
+        k, offset = self._locate(index)
+        return self._lists[k][offset]
+
+    def __iter__(self):
+        """
+        Returns an iterator over the elements in ascending order.
+
+        Yields:
+            object: The next element.
+        """
+        for block in self._lists:
+            yield from block
+
+    def __reversed__(self):
+        for block in reversed(self._lists):
+            yield from reversed(block)
+
+    def __contains__(self, value):
+        """
+        Checks if the array contains the given value in O(log n).
+
+        Args:
+            value (object): The value to search for.
+
+        Returns:
+            bool: True if the value is found, False otherwise.
+        """
+        k = lower_bound(self._maxes, value)
+        if k == len(self._maxes):
+            return False
+        block = self._lists[k]
+        return block[lower_bound(block, value)] == value
+
+    def __repr__(self):
+        """
+        Returns a string representation of the array.
+
+        Returns:
+            str: A string representation of the array.
+        """
+        return f"SortedArray([{', '.join(map(str, self))}])"
+
+    def add(self, value):
+        """
+        Inserts a value, keeping the elements sorted.
+
+        Equal values are kept in insertion order.
+
+        Args:
+            value (object): The value to insert.
+        """
+        if not self._maxes:
+            self._lists.append([value])
+            self._maxes.append(value)
+            self._n = 1
+            self._fenwick = None
+            return
+
+        k = upper_bound(self._maxes, value)
+        if k == len(self._maxes):
+            # Larger than everything: append to the last block
+            k -= 1
+            self._lists[k].append(value)
+            self._maxes[k] = value
+        else:
+            block = self._lists[k]
+            block.insert(upper_bound(block, value), value)
+        self._n += 1
+        self._fenwick_add(k, 1)
+        if len(self._lists[k]) > 2 * self._load:
+            self._split(k)
+
+    def update(self, iterable):
+        """
+        Inserts every value of an iterable.
+
+        Args:
+            iterable (iterable): The values to insert.
+        """
+        values = list(iterable)
+        if len(values) > self._n:
+            # Cheaper to re-sort everything and re-block once
+            values.extend(self)
+            self._reset(sorted(values))
+            return
+        for value in values:
+            self.add(value)
+
+    def discard(self, value):
+        """
+        Removes one occurrence of a value, if present.
+
+        Args:
+            value (object): The value to remove.
+        """
+        k = lower_bound(self._maxes, value)
+        if k == len(self._maxes):
+            return
+        block = self._lists[k]
+        i = lower_bound(block, value)
+        if block[i] == value:
+            self._delete(k, i)
+
+    def remove(self, value):
+        """
+        Removes one occurrence of a value.
+
+        Args:
+            value (object): The value to remove.
+
+        Raises:
+            ValueError: If the value is not found.
+        """
+        if value not in self:
+            raise ValueError("Element not found in array.")
+        self.discard(value)
+
+    def pop(self, index=-1):
+        """
+        Removes and returns the element at the given position (default: the largest).
+
+        Args:
+            index (int): The position of the element to remove.
+
+        Returns:
+            object: The removed element.
+
+        Raises:
+            IndexError: If the index is out of range or the array is empty.
+        """
+        if not 0 <= index < self._n:
+            if index == -1 and self._n > 0:
+                index = self._n - 1
+            else:
+                raise IndexError("Index out of range.")
+        k, offset = self._locate(index)
+        value = self._lists[k][offset]
+        self._delete(k, offset)
+        return value
+
+    def index(self, value):
+        """
+        Returns the position of the first occurrence of a value.
+
+        Args:
+            value (object): The value to search for.
+
+        Returns:
+            int: The position of the value.
+
+        Raises:
+            ValueError: If the value is not found.
+        """
+        k = lower_bound(self._maxes, value)
+        if k < len(self._maxes):
+            i = lower_bound(self._lists[k], value)
+            if self._lists[k][i] == value:
+                return self._prefix(k) + i
+        raise ValueError("Element not found in array.")
+
+    def count(self, value):
+        """
+        Returns the number of occurrences of a value.
+
+        Args:
+            value (object): The value to count.
+
+        Returns:
+            int: The number of occurrences.
+        """
+        return self.bisect_right(value) - self.bisect_left(value)
+
+    def bisect_left(self, value):
+        """
+        Returns the position of the first element not less than value.
+
+        Args:
+            value (object): The value to locate.
+
+        Returns:
+            int: The insertion point before any equal elements.
+        """
+        k = lower_bound(self._maxes, value)
+        if k == len(self._maxes):
+            return self._n
+        return self._prefix(k) + lower_bound(self._lists[k], value)
+
+    def bisect_right(self, value):
+        """
+        Returns the position of the first element greater than value.
+
+        Args:
+            value (object): The value to locate.
+
+        Returns:
+            int: The insertion point after any equal elements.
+        """
+        k = upper_bound(self._maxes, value)
+        if k == len(self._maxes):
+            return self._n
+        return self._prefix(k) + upper_bound(self._lists[k], value)
+
+    def irange(self, lo=None, hi=None, inclusive=(True, True)):
+        """
+        Lazily yields the elements between lo and hi in ascending order.
+
+        The array must not be modified while the iterator is in use.
+
+        Args:
+            lo (object): The lower bound, or None for no lower bound.
+            hi (object): The upper bound, or None for no upper bound.
+            inclusive (tuple): Whether each bound is included.
+
+        Yields:
+            object: The next element in the range.
+        """
+        start_bound = lower_bound if inclusive[0] else upper_bound
+        stop_bound = upper_bound if inclusive[1] else lower_bound
+
+        k = i = 0
+        if lo is not None:
+            k = start_bound(self._maxes, lo)
+            if k == len(self._maxes):
+                return
+            i = start_bound(self._lists[k], lo)
+
+        for block in self._lists[k:]:
+            last = block[-1]
+            if hi is not None and (hi < last if inclusive[1] else not last < hi):
+                # The range ends inside this block
+                yield from block[i : stop_bound(block, hi)]
+                return
+            yield from block[i:]
+            i = 0
+
+    def clear(self):
+        """
+        Removes all elements.
+        """
+        self._reset([])
+
+    def _reset(self, values):
+        """
+        Replaces the contents with already sorted values, cut into full blocks.
+
+        Args:
+            values (list): The new elements, in ascending order.
+        """
+        load = self._load
+        self._lists = [values[i : i + load] for i in range(0, len(values), load)]
+        self._maxes = [block[-1] for block in self._lists]
+        self._n = len(values)
+        self._fenwick = None
+
+    def _delete(self, k, i):
+        """
+        Deletes the element at offset i of block k, merging short blocks.
+
+        Args:
+            k (int): The block index.
+            i (int): The offset within the block.
+        """
+        block = self._lists[k]
+        del block[i]
+        self._n -= 1
+        if not block:
+            del self._lists[k]
+            del self._maxes[k]
+            self._fenwick = None
+            return
+
+        self._maxes[k] = block[-1]
+        self._fenwick_add(k, -1)
+        if len(block) < self._load // 2 and len(self._lists) > 1:
+            # Merge with a neighbour, splitting again if that overfills it
+            k = k - 1 if k else k
+            self._lists[k].extend(self._lists.pop(k + 1))
+            self._maxes.pop(k + 1)
+            self._maxes[k] = self._lists[k][-1]
+            self._fenwick = None
+            if len(self._lists[k]) > 2 * self._load:
+                self._split(k)
+
+    def _split(self, k):
+        """
+        Splits block k in two halves.
+
+        Args:
+            k (int): The block index.
+        """
+        block = self._lists[k]
+        half = block[self._load :]
+        del block[self._load :]
+        self._lists.insert(k + 1, half)
+        self._maxes[k] = block[-1]
+        self._maxes.insert(k + 1, half[-1])
+        self._fenwick = None
+
+    def _build_fenwick(self):
+        """
+        Builds the Fenwick tree of block lengths in O(number of blocks).
+        """
+        tree = [0] + [len(block) for block in self._lists]
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._fenwick = tree
+
+    def _fenwick_add(self, k, delta):
+        """
+        Adjusts the recorded length of block k, if the tree is built.
+
+        Args:
+            k (int): The block index.
+            delta (int): The change in length.
+        """
+        tree = self._fenwick
+        if tree is None:
+            return
+        i = k + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, k):
+        """
+        Returns the number of elements stored before block k.
+
+        Args:
+            k (int): The block index.
+
+        Returns:
+            int: The total length of blocks 0 to k - 1.
+        """
+        if self._fenwick is None:
+            self._build_fenwick()
+        tree = self._fenwick
+        total = 0
+        while k:
+            total += tree[k]
+            k -= k & -k
+        return total
+
+    def _locate(self, index):
+        """
+        Maps a position to the block holding it and the offset within that block.
+
+        Args:
+            index (int): The position, 0 <= index < len(self).
+
+        Returns:
+            tuple: The block index and the offset.
+        """
+        if self._fenwick is None:
+            self._build_fenwick()
+        tree = self._fenwick
+        k = 0
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            nxt = k + step
+            if nxt < len(tree) and tree[nxt] <= index:
+                k = nxt
+                index -= tree[nxt]
+            step >>= 1
+        return k, index
+
+
+if __name__ == "__main__":
+    scores = SortedArray([42, 7, 19, 7])
+    scores.add(23)
+    logger.debug(scores)  # Output: SortedArray([7, 7, 19, 23, 42])
+    logger.debug(scores.bisect_left(19))  # Output: 2
+    logger.debug(list(scores.irange(10, 30)))  # Output: [19, 23]
+    logger.debug(scores[3])  # Output: 23
@@ -0,0 +1,386 @@
+from playground.dsa.logging_config import logger
+
+from .array_adt import DynamicArrayADT
+
+
+class _Block:
+    """
+    Fixed-capacity circular buffer holding one tier of a TieredVector.
+
+    Attributes:
+        items (list): The slots of the buffer.
+        start (int): The slot holding the first element.
+        count (int): The number of elements in the block.
+    """
+
+    __slots__ = ("items", "start", "count")
+
+    def __init__(self, items):
+        self.items = items
+        self.start = 0
+        self.count = 0
+
+    def __getitem__(self, offset):
+        return self.items[(self.start + offset) % len(self.items)]
+
+    def __setitem__(self, offset, obj):
+        self.items[(self.start + offset) % len(self.items)] = obj
+
+    def values(self):
+        """Returns the elements of the block in order."""
+        end = self.start + self.count
+        if end <= len(self.items):
+            return self.items[self.start : end]
+        return self.items[self.start :] + self.items[: end - len(self.items)]
+
+    def push_front(self, obj):
+        self.start = (self.start - 1) % len(self.items)
+        self.items[self.start] = obj
+        self.count += 1
+
+    def push_back(self, obj):
+        self.items[(self.start + self.count) % len(self.items)] = obj
+        self.count += 1
+
+    def pop_front(self):
+        obj = self.items[self.start]
+        self.items[self.start] = None
+        self.start = (self.start + 1) % len(self.items)
+        self.count -= 1
+        return obj
+
+    def pop_back(self):
+        index = (self.start + self.count - 1) % len(self.items)
+        obj = self.items[index]
+        self.items[index] = None
+        self.count -= 1
+        return obj
+
+    def insert(self, offset, obj):
+        """Inserts obj at offset, shifting the later elements with one block move."""
+        self._normalize()
+        self.items[offset + 1 : self.count + 1] = self.items[offset : self.count]
+        self.items[offset] = obj
+        self.count += 1
+
+    def delete(self, offset):
+        """Removes and returns the element at offset with one block move."""
+        self._normalize()
+        obj = self.items[offset]
+        self.items[offset : self.count - 1] = self.items[offset + 1 : self.count]
+        self.items[self.count - 1] = None
+        self.count -= 1
+        return obj
+
+    def _normalize(self):
+        """Rotates the buffer so that the first element is in slot 0."""
+        if self.start:
+            self.items[:] = self.items[self.start :] + self.items[: self.start]
+            self.start = 0
+
+
+class TieredVector(DynamicArrayADT):
+    """
+    Sequence built from fixed-size circular blocks (a two-level tiered vector).
+
+    Every block except the last is full, so element i lives in block
+    i // b at offset i % b and indexing stays O(1). A middle insert or
+    delete shifts elements inside one block and then moves a single
+    element across each later block, costing O(b + n / b). The block size
+    b is kept near sqrt(n), giving O(sqrt n) middle edits.
+
+    Attributes:
+        _n (int): The number of elements currently stored.
+        _block_size (int): The capacity b of every block (a power of two).
+        _blocks (list): The blocks, in order.
+        _MIN_BLOCK_SIZE (int): The smallest block size used.
+    """
+
+    _MIN_BLOCK_SIZE = 16
+
+    def __init__(self, initial_capacity=10):
+        """
+        Initializes the TieredVector.
+
+        Args:
+            initial_capacity (int): The expected number of elements, used to pick
+                the initial block size. Must be > 0.
+        """
+        if not isinstance(initial_capacity, int) or initial_capacity <= 0:
+            raise ValueError("Initial capacity must be a positive integer.")
+
+        self._n = 0
+        self._block_size = self._block_size_for(initial_capacity)
+        self._blocks = []
+
+    def __len__(self):
+        """
+        Returns the number of elements in the vector.
+
+        Returns:
+            int: The number of elements.
+        """
+        return self._n
+
+    def __getitem__(self, index):
+        """
+        Retrieves the element at the given index, or a copy of the given slice.
+
+        Args:
+            index (int or slice): The index of the element to retrieve.
+
+        Returns:
+            object: The element at the specified index, or a new TieredVector
+            holding the sliced elements.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if isinstance(index, slice):
+            r = range(self._n)[index]
+            result = TieredVector(initial_capacity=max(len(r), 1))
+            result.extend([self[i] for i in r])
+            return result
+        if not 0 <= index < self._n:
+            raise IndexError("Index out of range.")
+        return self._blocks[index // self._block_size][index % self._block_size]
+
+    def __setitem__(self, index, obj):
+        """
+        Sets the element at the given index to the specified value.
+
+        Args:
+            index (int): The index to set.
+            obj (object): The value to set at the index.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if not 0 <= index < self._n:
+            raise IndexError("Index out of range.")
+        self._blocks[index // self._block_size][index % self._block_size] = obj
+
+    def __iter__(self):
+        """
+        Returns an iterator for the vector.
+
+        Yields:
+            object: The next element in the vector.
+        """
+        for block in self._blocks:
+            yield from block.values()
+
+    def __contains__(self, obj):
+        """
+        Checks if the vector contains the specified object.
+
+        Args:
+            obj (object): The object to search for.
+
+        Returns:
+            bool: True if the object is found, False otherwise.
+        """
+        return any(obj in block.values() for block in self._blocks)
+
+    def __add__(self, other):
+        """
+        Concatenates this TieredVector with another sequence of the DynamicArray family.
+
+        Args:
+            other (DynamicArrayADT): The other array to concatenate with.
+
+        Returns:
+            TieredVector: A new TieredVector containing all elements.
+
+        Raises:
+            TypeError: If 'other' is not a DynamicArrayADT.
+        """
+        if not isinstance(other, DynamicArrayADT):
+            raise TypeError(
+                "Can only concatenate TieredVector with another DynamicArrayADT."
+            )
+        result = TieredVector(initial_capacity=max(self._n + len(other), 1))
+        result.extend(self)
+        result.extend(other)
+        return result
+
+    def __repr__(self):
+        """
+        Returns a string representation of the vector.
+
+        Returns:
+            str: A string representation of the vector.
+        """
+        return f"[{', '.join(map(str, self))}]"
+
+    def _make_array(self, c):
+        """
+        Creates the storage for one block.
+
+        Args:
+            c (int): The capacity of the block.
+
+        Returns:
+            list: A list of c empty slots.
+        """
+        if not isinstance(c, int) or c <= 0:
+            raise ValueError("Capacity must be a positive integer.")
+        return [None] * c
+
+    def append(self, obj):
+        """
+        Appends an element to the end of the vector.
+
+        Args:
+            obj (object): The element to append.
+        """
+        self._make_room()
+        self._blocks[-1].push_back(obj)
+        self._n += 1
+
+    def insert(self, index, obj):
+        """
+        Inserts an element at the specified index in O(sqrt n).
+
+        Args:
+            index (int): The index at which to insert the element.
+            obj (object): The element to insert.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if not 0 <= index <= self._n:
+            raise IndexError("Index out of range.")
+        if index == self._n:
+            self.append(obj)
+            return
+
+        self._make_room()
+
+        # Carry one element from each block into the next, back to front
+        k = index // self._block_size
+        for j in range(len(self._blocks) - 1, k, -1):
+            self._blocks[j].push_front(self._blocks[j - 1].pop_back())
+        self._blocks[k].insert(index % self._block_size, obj)
+        self._n += 1
+
+    def pop(self, index=-1):
+        """
+        Removes and returns the element at the given index (default: last element).
+
+        Args:
+            index (int): The index of the element to remove.
+
+        Returns:
+            object: The removed element.
+
+        Raises:
+            IndexError: If the index is out of range or the vector is empty.
+        """
+        if not 0 <= index < self._n:
+            if index == -1 and self._n > 0:
+                index = self._n - 1
+            else:
+                raise IndexError("Index out of range.")
+
+        k = index // self._block_size
+        value = self._blocks[k].delete(index % self._block_size)
+        # Pull one element from each later block to refill the gap
+        for j in range(k + 1, len(self._blocks)):
+            self._blocks[j - 1].push_back(self._blocks[j].pop_front())
+        if self._blocks[-1].count == 0:
+            self._blocks.pop()
+        self._n -= 1
+
+        if (
+            self._block_size > self._MIN_BLOCK_SIZE
+            and self._n < self._block_size**2 // 4
+        ):
+            self._rebuild(self._block_size // 2)
+        return value
+
+    def remove(self, obj):
+        """
+        Removes the first occurrence of the specified element from the vector.
+
+        Args:
+            obj (object): The element to remove.
+
+        Raises:
+            ValueError: If the element is not found in the vector.
+        """
+        for i, value in enumerate(self):
+            if value == obj:
+                self.pop(i)
+                return
+        raise ValueError("Element not found in array.")
+
+    def extend(self, iterable):
+        """
+        Extends the vector by appending elements from an iterable.
+
+        Args:
+            iterable (iterable): The iterable containing elements to append.
+        """
+        for item in iterable:
+            self.append(item)
+
+    def clear(self):
+        """
+        Removes all elements from the vector.
+        """
+        self._n = 0
+        self._blocks = []
+        self._block_size = self._MIN_BLOCK_SIZE
+
+    def _block_size_for(self, n):
+        """
+        Returns the power-of-two block size to use for n elements.
+
+        Args:
+            n (int): The number of elements.
+
+        Returns:
+            int: A block size of roughly sqrt(n), at least _MIN_BLOCK_SIZE.
+        """
+        size = self._MIN_BLOCK_SIZE
+        while 4 * size * size < n:
+            size *= 2
+        return size
+
+    def _make_room(self):
+        """
+        Ensures the last block can take one more element.
+
+        Doubles the block size first when the vector outgrows it.
+        """
+        if self._n + 1 > 4 * self._block_size**2:
+            self._rebuild(self._block_size * 2)
+        if not self._blocks or self._blocks[-1].count == self._block_size:
+            self._blocks.append(_Block(self._make_array(self._block_size)))
+
+    def _rebuild(self, block_size):
+        """
+        Redistributes all elements into full blocks of a new size.
+
+        Args:
+            block_size (int): The new block size.
+        """
+        values = list(self)
+        self._block_size = block_size
+        self._blocks = []
+        for start in range(0, len(values), block_size):
+            block = _Block(self._make_array(block_size))
+            chunk = values[start : start + block_size]
+            block.items[: len(chunk)] = chunk
+            block.count = len(chunk)
+            self._blocks.append(block)
+
+
+if __name__ == "__main__":
+    tv = TieredVector()
+    tv.extend(range(10))
+    tv.insert(5, 42)
+    logger.debug(tv)  # Output: [0, 1, 2, 3, 4, 42, 5, 6, 7, 8, 9]
+    logger.debug(tv.pop(0))  # Output: 0
+    logger.debug(tv[4])  # Output: 42
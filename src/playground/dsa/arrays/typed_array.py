@@ -0,0 +1,358 @@
+from array import array
+
+from playground.dsa.logging_config import logger
+
+from .arrays import DynamicArray, _require_numpy
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+
+class TypedDynamicArray(DynamicArray):
+    """
+    Dynamic Array that stores raw machine values in a typed buffer.
+
+    Elements are kept unboxed in an ``array.array`` of the given typecode, so
+    an int64 element costs 8 bytes instead of a pointer plus a Python object.
+    ``buffer()`` returns a memoryview of the stored elements. On Python 3.12
+    and later the array also supports the buffer protocol directly (PEP 688),
+    so ``memoryview(array)`` works too.
+
+    Attributes:
+        _typecode (str): The ``array`` typecode of the stored elements.
+        _A (array.array): The underlying typed buffer used for storage.
+    """
+
+    _TYPECODES = "bBhHiIlLqQfd"  # Numeric typecodes supported by array.array
+    _FILL_VALUE = 0
+
+    def __init__(
+        self,
+        typecode="q",
+        initial_capacity=10,
+        resize_factor=2.0,
+        policy=None,
+        indexed=False,
+    ):
+        """
+        Initializes the TypedDynamicArray.
+
+        Args:
+            typecode (str): The ``array`` typecode of the elements (e.g. 'q', 'd', 'i').
+            initial_capacity (int): The initial capacity of the array. Must be > 0.
+            resize_factor (float): The factor by which to grow the array on resize. Must be > 1.
+            policy (CapacityPolicy): The growth and shrink policy (see DynamicArray).
+            indexed (bool): If True, keep a hash index of the values (see DynamicArray).
+        """
+        if typecode not in self._TYPECODES:
+            raise ValueError(f"Typecode must be one of {self._TYPECODES!r}.")
+
+        self._typecode = typecode
+        super().__init__(
+            initial_capacity=initial_capacity,
+            resize_factor=resize_factor,
+            policy=policy,
+            indexed=indexed,
+        )
+
+    @property
+    def typecode(self):
+        """
+        Returns the typecode of the stored elements.
+
+        Returns:
+            str: The ``array`` typecode.
+        """
+        return self._typecode
+
+    @property
+    def itemsize(self):
+        """
+        Returns the size in bytes of one stored element.
+
+        Returns:
+            int: The element size in bytes.
+        """
+        return self._A.itemsize
+
+    def __contains__(self, obj):
+        """
+        Checks if the array contains the specified object.
+
+        Args:
+            obj (object): The object to search for.
+
+        Returns:
+            bool: True if the object is found, False otherwise.
+        """
+        if self._index is not None:
+            try:
+                return obj in self._index
+            except TypeError:  # Unhashable, so scan as without the index
+                pass
+        return obj in self._A[: self._n]
+
+    def insert(self, index, obj):
+        """
+        Inserts an element at the specified index.
+
+        The element is converted to the typecode before the tail is shifted,
+        so a rejected value leaves the array unchanged.
+
+        Args:
+            index (int): The index at which to insert the element.
+            obj (object): The element to insert.
+
+        Raises:
+            IndexError: If the index is out of range.
+            TypeError: If the element does not fit the typecode.
+            OverflowError: If the element is out of range for the typecode.
+        """
+        super().insert(index, array(self._typecode, [obj])[0])
+
+    def __buffer__(self, flags):
+        """
+        Exports the stored elements through the buffer protocol (PEP 688).
+
+        Only Python 3.12 and later call this hook; use ``buffer()`` on older
+        versions.
+
+        Args:
+            flags (int): The requested buffer flags.
+
+        Returns:
+            memoryview: A view over the stored elements.
+        """
+        return self.buffer()
+
+    def buffer(self):
+        """
+        Returns a memoryview over the stored elements without copying them.
+
+        The view refers to the current storage and goes stale once the array
+        is resized.
+
+        Returns:
+            memoryview: A view over the stored elements.
+        """
+        return memoryview(self._A)[: self._n]
+
+    def tobytes(self):
+        """
+        Returns the stored elements as raw machine bytes.
+
+        Returns:
+            bytes: The packed element values.
+        """
+        return self._A[: self._n].tobytes()
+
+    def tolist(self):
+        """
+        Returns the stored elements as a Python list.
+
+        Returns:
+            list: The element values.
+        """
+        return self._A[: self._n].tolist()
+
+    @classmethod
+    def from_numpy(cls, ndarray, typecode=None):
+        """
+        Creates a TypedDynamicArray holding the values of a one-dimensional NumPy array.
+
+        The raw values are copied once, without boxing them as Python objects.
+
+        Args:
+            ndarray (numpy.ndarray): The array to copy.
+            typecode (str): The typecode of the result. Defaults to the typecode
+                matching the array's dtype. The values must cast safely to it.
+
+        Returns:
+            TypedDynamicArray: A new array holding the values.
+
+        Raises:
+            ValueError: If the array is not one-dimensional or its dtype has no
+                matching typecode.
+            TypeError: If the values cannot be cast safely to 'typecode'.
+        """
+        if ndarray.ndim != 1:
+            raise ValueError("Expected a one-dimensional array.")
+        typecode = ndarray.dtype.char if typecode is None else typecode
+        if typecode not in cls._TYPECODES:
+            raise ValueError(f"Typecode must be one of {cls._TYPECODES!r}.")
+
+        block = _typed_block(ndarray, typecode)
+        result = cls._result_class()(typecode, initial_capacity=max(len(block), 1))
+        if block:
+            # Adopt the block as the storage instead of copying it again
+            result._A, result._n, result._capacity = block, len(block), len(block)
+        return result
+
+    def to_numpy(self, dtype=None):
+        """
+        Returns a NumPy array sharing the stored values, without copying them.
+
+        Like ``buffer()``, the result refers to the current storage and goes
+        stale once the array is resized.
+
+        Args:
+            dtype (numpy.dtype): If given, a converted copy with this dtype is
+                returned instead.
+
+        Returns:
+            numpy.ndarray: A one-dimensional array over the stored values.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        _require_numpy("to_numpy")
+        values = np.frombuffer(self.buffer(), dtype=self._typecode)
+        return values if dtype is None else values.astype(dtype)
+
+    def argsort(self):
+        """
+        Returns the indices that would sort the array (a stable sort).
+
+        With NumPy installed the sort runs over the typed buffer directly.
+
+        Returns:
+            DynamicArray: The indices, in sorted order of their elements.
+        """
+        if np is None:
+            return super().argsort()
+        order = np.argsort(self.to_numpy(), kind="stable").tolist()
+        result = DynamicArray(initial_capacity=max(self._n, 1))
+        result.extend(order)
+        return result
+
+    def take(self, indices):
+        """
+        Gathers the elements at the given indices.
+
+        With NumPy installed the elements are gathered from the typed buffer
+        in one call.
+
+        Args:
+            indices (iterable): The indices of the elements to take, in order.
+
+        Returns:
+            TypedDynamicArray: A new array holding the elements.
+
+        Raises:
+            IndexError: If an index is out of range.
+        """
+        if np is None:
+            return super().take(indices)
+        positions = np.asarray(indices, dtype=np.intp)
+        if positions.size and not (0 <= positions.min() and positions.max() < self._n):
+            raise IndexError("Index out of range.")
+        return self._from_numpy_result(self.to_numpy().take(positions))
+
+    def _from_numpy_result(self, values):
+        """
+        Wraps the NumPy result of a bulk operation in an array of this typecode.
+
+        Args:
+            values (numpy.ndarray): The one-dimensional result.
+
+        Returns:
+            TypedDynamicArray: A new array holding the values.
+
+        Raises:
+            TypeError: If the values cannot be cast safely to this typecode.
+        """
+        block = _typed_block(values, self._typecode)
+        result = self._empty_like(max(len(block), 1))
+        result.extend(block)
+        return result
+
+    def _empty_like(self, capacity):
+        """
+        Creates an empty array of the same type, typecode and settings as this one.
+
+        Args:
+            capacity (int): The initial capacity of the new array.
+
+        Returns:
+            TypedDynamicArray: A new, empty array.
+        """
+        return self._result_class()(
+            self._typecode,
+            initial_capacity=capacity,
+            resize_factor=self._RESIZE_FACTOR,
+            policy=self._policy,
+            indexed=self._index is not None,
+        )
+
+    def _to_block(self, values):
+        """
+        Converts a sized iterable into a typed array that can be slice-assigned into storage.
+
+        Args:
+            values (iterable): The values to convert.
+
+        Returns:
+            array.array: The values as an array with this array's typecode.
+        """
+        if isinstance(values, array) and values.typecode == self._typecode:
+            return values
+        if isinstance(values, memoryview) and values.format == self._typecode:
+            return array(self._typecode, values.tobytes())
+        return array(self._typecode, values)
+
+    def _make_array(self, c):
+        """
+        Creates a new zero-filled typed array of the given capacity.
+
+        Args:
+            c (int): The capacity of the array.
+
+        Returns:
+            array.array: A new typed array.
+        """
+        if not isinstance(c, int) or c <= 0:
+            raise ValueError("Capacity must be a positive integer.")
+        return array(self._typecode, bytes(c * array(self._typecode).itemsize))
+
+
+def _typed_block(ndarray, typecode):
+    """
+    Copies the raw values of a NumPy array into an ``array.array``.
+
+    Integers may narrow to a smaller integer type only when every value
+    fits; floats may narrow to float32 with the usual loss of precision.
+
+    Args:
+        ndarray (numpy.ndarray): The one-dimensional values.
+        typecode (str): The typecode of the result.
+
+    Returns:
+        array.array: The values with the given typecode.
+
+    Raises:
+        TypeError: If the values cannot be cast safely to 'typecode'.
+    """
+    target, casting = np.dtype(typecode), "same_kind"
+    if (
+        target.kind in "iu"
+        and ndarray.dtype.kind in "iu"
+        and not np.can_cast(ndarray.dtype, target)
+    ):
+        limits = np.iinfo(target)
+        if ndarray.size and (ndarray.min() < limits.min or ndarray.max() > limits.max):
+            raise TypeError(f"Values out of range for typecode {typecode!r}.")
+        casting = "unsafe"  # Every value fits, so nothing wraps
+    values = ndarray.astype(typecode, order="C", casting=casting, copy=False)
+    block = array(typecode)
+    block.frombytes(memoryview(values).cast("B"))
+    return block
+
+
+if __name__ == "__main__":
+    samples = TypedDynamicArray("d", initial_capacity=4)
+    samples.extend([0.5, 1.5, 2.5, 3.5, 4.5])
+    logger.debug(samples)  # Output: [0.5, 1.5, 2.5, 3.5, 4.5]
+    logger.debug(samples.itemsize)  # Output: 8
+    logger.debug(bytes(samples.buffer()) == samples.tobytes())  # Output: True
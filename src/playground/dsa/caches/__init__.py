@@ -0,0 +1,7 @@
+from .arc_cache import ARCCache  # noqa
+from .cache_adt import CacheADT  # noqa
+from .lfu_cache import LFUCache  # noqa
+from .lru_cache import LRUCache  # noqa
+from .memoize import memoize  # noqa
+
+__all__ = ["ARCCache", "CacheADT", "LFUCache", "LRUCache", "memoize"]
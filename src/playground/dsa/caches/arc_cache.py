@@ -0,0 +1,172 @@
+from playground.dsa.linked_list import DoublyLinkedList
+
+from .cache_adt import CacheADT, _check_capacity, _Entry
+
+
+class ARCCache(CacheADT):
+    """
+    An adaptive replacement cache (Megiddo and Modha, 2003).
+
+    ARC splits the cache between T1, entries seen once recently, and T2,
+    entries seen at least twice. It also remembers the keys it recently
+    evicted from each, in the ghost lists B1 and B2. A put() of a key in
+    B1 shows that T1 was too small, so the target size 'p' of T1 grows;
+    a put() of a key in B2 shrinks it. The cache thereby balances recency
+    against frequency for the workload, and a one-off scan only churns T1.
+
+    All four lists are DoublyLinkedLists with the most recent entry at the
+    front, and one dict maps every key to its list and node, so every
+    operation is O(1). ARC sizes its lists in entries, so 'capacity' is
+    the number of cached entries; for cost-based eviction use LRUCache or
+    LFUCache.
+
+    Attributes:
+        capacity (int): The maximum number of cached entries.
+        hits (int): The number of get() calls that found their key.
+        misses (int): The number of get() calls that did not.
+        evictions (int): The number of entries evicted to make room.
+    """
+
+    def __init__(self, capacity=128):
+        """
+        Initializes an empty cache.
+
+        Args:
+            capacity (int, optional): The maximum number of entries. Defaults to 128.
+
+        Raises:
+            ValueError: If capacity is not a positive number.
+            TypeError: If capacity is not an integer; ARC counts entries.
+        """
+        _check_capacity(capacity)
+        if not isinstance(capacity, int):
+            raise TypeError("Capacity must be an integer.")
+        self.capacity = capacity
+        self.p = 0  # The target size of T1
+        self._t1 = DoublyLinkedList()  # Entries seen once
+        self._t2 = DoublyLinkedList()  # Entries seen at least twice
+        self._b1 = DoublyLinkedList()  # Keys evicted from T1
+        self._b2 = DoublyLinkedList()  # Keys evicted from T2
+        self._map = {}  # key -> (list, node) for all four lists
+        self.hits = self.misses = self.evictions = 0
+
+    def __contains__(self, key):
+        found = self._map.get(key)
+        return found is not None and (found[0] is self._t1 or found[0] is self._t2)
+
+    def __len__(self):
+        return len(self._t1) + len(self._t2)
+
+    def get(self, key, default=None):
+        """
+        Returns the value cached for key and promotes it to T2.
+
+        Args:
+            key: The key to look up.
+            default (optional): Returned on a miss. Defaults to None.
+
+        Returns:
+            Any: The cached value, or default.
+        """
+        found = self._map.get(key)
+        if found is None or found[0] is self._b1 or found[0] is self._b2:
+            self.misses += 1
+            return default
+        self.hits += 1
+        entry = self._promote(*found)
+        return entry.value
+
+    def put(self, key, value):
+        """
+        Caches value under key, adapting the T1 target on a ghost hit.
+
+        Args:
+            key: The key to cache under.
+            value: The value to cache.
+        """
+        found = self._map.get(key)
+        if found is not None:
+            lst, node = found
+            if lst is self._t1 or lst is self._t2:
+                self._promote(lst, node).value = value
+                return
+            b1, b2 = len(self._b1), len(self._b2)
+            if lst is self._b1:
+                self.p = min(self.capacity, self.p + max(b2 // b1, 1))
+            else:
+                self.p = max(0, self.p - max(b1 // b2, 1))
+            lst.remove_node(node)
+            del self._map[key]
+            if len(self) >= self.capacity:
+                self._replace(lst is self._b2)
+            self._map[key] = (self._t2, self._t2.push_front(_Entry(key, value)))
+            return
+
+        t1_and_b1 = len(self._t1) + len(self._b1)
+        if t1_and_b1 >= self.capacity:
+            if len(self._t1) < self.capacity:
+                self._drop_ghost(self._b1)
+                if len(self) >= self.capacity:
+                    self._replace(False)
+            else:
+                # B1 is empty; evict the oldest T1 entry outright
+                entry = self._t1.pop_back()
+                del self._map[entry.key]
+                self.evictions += 1
+        elif len(self) >= self.capacity:
+            if t1_and_b1 + len(self._t2) + len(self._b2) >= 2 * self.capacity:
+                self._drop_ghost(self._b2)
+            self._replace(False)
+        self._map[key] = (self._t1, self._t1.push_front(_Entry(key, value)))
+
+    def remove(self, key):
+        found = self._map.pop(key, None)
+        if found is not None:
+            found[0].remove_node(found[1])
+
+    def clear(self):
+        self._t1, self._t2 = DoublyLinkedList(), DoublyLinkedList()
+        self._b1, self._b2 = DoublyLinkedList(), DoublyLinkedList()
+        self._map.clear()
+        self.p = 0
+
+    def stats(self):
+        stats = super().stats()
+        stats.update(p=self.p, t1=len(self._t1), t2=len(self._t2))
+        return stats
+
+    def _promote(self, lst, node):
+        """Moves a cached entry to the front of T2 and returns it."""
+        if lst is self._t2:
+            self._t2.move_to_front(node)
+            return node.data
+        entry = lst.remove_node(node)
+        self._map[entry.key] = (self._t2, self._t2.push_front(entry))
+        return entry
+
+    def _replace(self, in_b2):
+        """Evicts the LRU entry of T1 or T2 into its ghost list, as ARC's REPLACE."""
+        t1 = len(self._t1)
+        if t1 and (t1 > self.p or (in_b2 and t1 == self.p) or not self._t2):
+            source, ghost = self._t1, self._b1
+        else:
+            source, ghost = self._t2, self._b2
+        entry = source.pop_back()
+        self._map[entry.key] = (ghost, ghost.push_front(entry.key))
+        self.evictions += 1
+
+    def _drop_ghost(self, ghost):
+        """Forgets the oldest key of a ghost list."""
+        if ghost:
+            del self._map[ghost.pop_back()]
+
+    def __repr__(self):
+        return f"ARCCache(capacity={self.capacity}, size={len(self)}, p={self.p})"
+
+
+if __name__ == "__main__":
+    cache = ARCCache(capacity=3)
+    for key in ["a", "b", "a", "c", "d", "b", "e"]:
+        if cache.get(key) is None:
+            cache.put(key, key.upper())
+    print(cache.stats())
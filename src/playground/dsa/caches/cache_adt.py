@@ -0,0 +1,90 @@
+from abc import ABC, abstractmethod
+
+
+class CacheADT(ABC):
+    """
+    Abstract base class for a bounded key-value cache.
+
+    Implementations count their hits, misses and evictions in the 'hits',
+    'misses' and 'evictions' attributes, which stats() reports.
+    """
+
+    @abstractmethod
+    def get(self, key, default=None):
+        """
+        Returns the value cached for key, or default on a miss.
+        """
+        pass
+
+    @abstractmethod
+    def put(self, key, value):
+        """
+        Caches value under key, evicting other entries if the cache is full.
+        """
+        pass
+
+    @abstractmethod
+    def remove(self, key):
+        """
+        Removes key from the cache, if present.
+        """
+        pass
+
+    @abstractmethod
+    def clear(self):
+        """
+        Removes every entry, keeping the counters.
+        """
+        pass
+
+    @abstractmethod
+    def __contains__(self, key):
+        """
+        Checks if key is cached, without counting a hit or a miss.
+        """
+        pass
+
+    @abstractmethod
+    def __len__(self):
+        """
+        Returns the number of cached entries.
+        """
+        pass
+
+    def stats(self):
+        """
+        Returns the cache counters.
+
+        Returns:
+            dict: hits, misses, evictions, hit_ratio and size.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "size": len(self),
+        }
+
+
+class _Entry:
+    """Holds a cached value with its cost and, for LFU, its access count."""
+
+    __slots__ = ("key", "value", "cost", "freq")
+
+    def __init__(self, key, value, cost=1):
+        self.key = key
+        self.value = value
+        self.cost = cost
+        self.freq = 1
+
+
+def _check_capacity(capacity):
+    """Raises ValueError unless capacity is a positive number."""
+    if (
+        not isinstance(capacity, (int, float))
+        or isinstance(capacity, bool)
+        or capacity <= 0
+    ):
+        raise ValueError("Capacity must be a positive number.")
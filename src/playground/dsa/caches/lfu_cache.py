@@ -0,0 +1,183 @@
+from playground.dsa.linked_list import DoublyLinkedList
+
+from .cache_adt import CacheADT, _check_capacity, _Entry
+
+
+class LFUCache(CacheADT):
+    """
+    A least-frequently-used cache with O(1) get, put and eviction.
+
+    Entries are grouped into frequency buckets: a dict maps each access
+    count to a DoublyLinkedList of the entries with that count, most
+    recently used first. A hit moves the entry to the next bucket, and
+    eviction takes the least recently used entry of the lowest bucket,
+    whose count is tracked, so nothing is ever sorted or scanned.
+
+    Eviction is by total cost, as in LRUCache.
+
+    Attributes:
+        capacity (int | float): The maximum total cost of the entries.
+        hits (int): The number of get() calls that found their key.
+        misses (int): The number of get() calls that did not.
+        evictions (int): The number of entries evicted to make room.
+    """
+
+    def __init__(self, capacity=128, weigher=None):
+        """
+        Initializes an empty cache.
+
+        Args:
+            capacity (int | float, optional): The maximum total cost. Defaults to 128.
+            weigher (callable, optional): Called as weigher(key, value) to
+                cost an entry when put() is not given one.
+
+        Raises:
+            ValueError: If capacity is not a positive number.
+        """
+        _check_capacity(capacity)
+        self.capacity = capacity
+        self._weigher = weigher
+        self._buckets = {}  # access count -> DoublyLinkedList of entries
+        self._map = {}  # key -> node in its bucket
+        self._min_freq = 0
+        self._cost = 0
+        self.hits = self.misses = self.evictions = 0
+
+    @property
+    def cost(self):
+        """Returns the total cost of the cached entries."""
+        return self._cost
+
+    def __contains__(self, key):
+        return key in self._map
+
+    def __len__(self):
+        return len(self._map)
+
+    def frequency(self, key):
+        """Returns the access count of a cached key (0 if it is not cached)."""
+        node = self._map.get(key)
+        return node.data.freq if node else 0
+
+    def get(self, key, default=None):
+        """
+        Returns the value cached for key and counts an access to it.
+
+        Args:
+            key: The key to look up.
+            default (optional): Returned on a miss. Defaults to None.
+
+        Returns:
+            Any: The cached value, or default.
+        """
+        node = self._map.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        entry = self._unlink(node)
+        if self._min_freq == entry.freq and entry.freq not in self._buckets:
+            self._min_freq += 1  # The entry was alone in the lowest bucket
+        entry.freq += 1
+        self._link(entry)
+        return entry.value
+
+    def put(self, key, value, cost=None):
+        """
+        Caches value under key, counting an access if the key is already cached.
+
+        Args:
+            key: The key to cache under.
+            value: The value to cache.
+            cost (int | float, optional): The entry's cost. Defaults to the
+                weigher's cost, or 1.
+
+        Returns:
+            bool: True if the entry was cached, False if it costs more than
+            the capacity.
+        """
+        if cost is None:
+            cost = self._weigher(key, value) if self._weigher else 1
+        node = self._map.pop(key, None)
+        entry = None
+        if node is not None:
+            entry = self._unlink(node)
+            self._cost -= entry.cost
+            self._settle_cost()
+        if cost > self.capacity:
+            return False
+        while self._map and self._cost + cost > self.capacity:
+            self._evict()
+
+        if entry is None:
+            entry = _Entry(key, value, cost)
+        else:
+            entry.value, entry.cost = value, cost
+            entry.freq += 1
+        self._link(entry)
+        self._cost += cost
+        return True
+
+    def remove(self, key):
+        node = self._map.pop(key, None)
+        if node is not None:
+            self._cost -= self._unlink(node).cost
+            self._settle_cost()
+
+    def clear(self):
+        self._buckets.clear()
+        self._map.clear()
+        self._min_freq = 0
+        self._cost = 0
+
+    def stats(self):
+        stats = super().stats()
+        stats["cost"] = self._cost
+        return stats
+
+    def _link(self, entry):
+        """Adds entry to the front of the bucket for its access count."""
+        bucket = self._buckets.get(entry.freq)
+        if bucket is None:
+            bucket = self._buckets[entry.freq] = DoublyLinkedList()
+        if not self._min_freq or entry.freq < self._min_freq:
+            self._min_freq = entry.freq
+        self._map[entry.key] = bucket.push_front(entry)
+
+    def _unlink(self, node):
+        """Removes a node from its bucket and returns its entry."""
+        entry = node.data
+        bucket = self._buckets[entry.freq]
+        bucket.remove_node(node)
+        if bucket.empty():
+            del self._buckets[entry.freq]
+        return entry
+
+    def _evict(self):
+        """Evicts the least recently used entry with the lowest access count."""
+        if self._min_freq not in self._buckets:
+            # Stale after a removal emptied the lowest bucket
+            self._min_freq = min(self._buckets)
+        entry = self._unlink(self._buckets[self._min_freq].tail)
+        del self._map[entry.key]
+        self._cost -= entry.cost
+        self._settle_cost()
+        self.evictions += 1
+
+    def _settle_cost(self):
+        """Zeroes the cost of an empty cache, dropping float rounding left over."""
+        if not self._map:
+            self._cost = 0
+
+    def __repr__(self):
+        return f"LFUCache(capacity={self.capacity}, size={len(self)})"
+
+
+if __name__ == "__main__":
+    cache = LFUCache(capacity=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)  # Evicts "b", used least often
+    print("b" in cache, cache.frequency("a"))  # False 2
+    print(cache.stats())
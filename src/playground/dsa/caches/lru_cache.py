@@ -0,0 +1,150 @@
+from playground.dsa.linked_list import DoublyLinkedList
+
+from .cache_adt import CacheADT, _check_capacity, _Entry
+
+
+class LRUCache(CacheADT):
+    """
+    A least-recently-used cache with O(1) get, put and eviction.
+
+    A dict maps each key to its node in a DoublyLinkedList that is kept in
+    recency order, most recent at the front. A hit moves the node to the
+    front and eviction pops from the back, both in O(1).
+
+    Eviction is by total cost: every entry costs 1 unless put() is given
+    a cost or the cache has a 'weigher', so by default 'capacity' is the
+    number of entries. An entry that costs more than the whole capacity is
+    not cached.
+
+    Attributes:
+        capacity (int | float): The maximum total cost of the entries.
+        hits (int): The number of get() calls that found their key.
+        misses (int): The number of get() calls that did not.
+        evictions (int): The number of entries evicted to make room.
+    """
+
+    def __init__(self, capacity=128, weigher=None):
+        """
+        Initializes an empty cache.
+
+        Args:
+            capacity (int | float, optional): The maximum total cost. Defaults to 128.
+            weigher (callable, optional): Called as weigher(key, value) to
+                cost an entry when put() is not given one.
+
+        Raises:
+            ValueError: If capacity is not a positive number.
+        """
+        _check_capacity(capacity)
+        self.capacity = capacity
+        self._weigher = weigher
+        self._order = DoublyLinkedList()  # Entries, most recently used first
+        self._map = {}  # key -> node in _order
+        self._cost = 0
+        self.hits = self.misses = self.evictions = 0
+
+    @property
+    def cost(self):
+        """Returns the total cost of the cached entries."""
+        return self._cost
+
+    def __contains__(self, key):
+        return key in self._map
+
+    def __len__(self):
+        return len(self._map)
+
+    def __iter__(self):
+        """Iterates over the keys from most to least recently used."""
+        return (entry.key for entry in self._order)
+
+    def get(self, key, default=None):
+        """
+        Returns the value cached for key and marks it as most recently used.
+
+        Args:
+            key: The key to look up.
+            default (optional): Returned on a miss. Defaults to None.
+
+        Returns:
+            Any: The cached value, or default.
+        """
+        node = self._map.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._order.move_to_front(node)
+        return node.data.value
+
+    def put(self, key, value, cost=None):
+        """
+        Caches value under key as the most recently used entry.
+
+        Args:
+            key: The key to cache under.
+            value: The value to cache.
+            cost (int | float, optional): The entry's cost. Defaults to the
+                weigher's cost, or 1.
+
+        Returns:
+            bool: True if the entry was cached, False if it costs more than
+            the capacity.
+        """
+        if cost is None:
+            cost = self._weigher(key, value) if self._weigher else 1
+        self.remove(key)
+        if cost > self.capacity:
+            return False
+        while self._map and self._cost + cost > self.capacity:
+            self._evict()
+        self._map[key] = self._order.push_front(_Entry(key, value, cost))
+        self._cost += cost
+        return True
+
+    def peek(self, key, default=None):
+        """Returns the value cached for key without updating recency or counters."""
+        node = self._map.get(key)
+        return default if node is None else node.data.value
+
+    def remove(self, key):
+        node = self._map.pop(key, None)
+        if node is not None:
+            self._cost -= self._order.remove_node(node).cost
+            self._settle_cost()
+
+    def clear(self):
+        self._order = DoublyLinkedList()
+        self._map.clear()
+        self._cost = 0
+
+    def stats(self):
+        stats = super().stats()
+        stats["cost"] = self._cost
+        return stats
+
+    def _evict(self):
+        """Evicts the least recently used entry."""
+        entry = self._order.pop_back()
+        del self._map[entry.key]
+        self._cost -= entry.cost
+        self._settle_cost()
+        self.evictions += 1
+
+    def _settle_cost(self):
+        """Zeroes the cost of an empty cache, dropping float rounding left over."""
+        if not self._map:
+            self._cost = 0
+
+    def __repr__(self):
+        return f"LRUCache(capacity={self.capacity}, size={len(self)})"
+
+
+if __name__ == "__main__":
+    cache = LRUCache(capacity=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)  # Evicts "b"
+    print(list(cache))  # ['c', 'a']
+    print(cache.stats())
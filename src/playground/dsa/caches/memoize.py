@@ -0,0 +1,63 @@
+import functools
+
+from .lru_cache import LRUCache
+
+_MISSING = object()  # Tells a miss apart from a cached None
+
+
+def memoize(func=None, *, cache=None, maxsize=128, key=None):
+    """
+    Caches a function's results in a bounded cache.
+
+    Unlike an unbounded dict in front of the function, the cache evicts
+    entries once it is full, so memory stays bounded however many distinct
+    arguments the function sees. Use it bare, as ``@memoize``, for an
+    LRUCache of 'maxsize' entries, or pass any CacheADT as 'cache'.
+
+    The wrapper exposes the cache as 'cache' and empties it with
+    'cache_clear()'.
+
+    Args:
+        func (callable, optional): The function to wrap, when used bare.
+        cache (CacheADT, optional): The cache to store results in.
+            Defaults to a new LRUCache(maxsize).
+        maxsize (int, optional): The size of the default cache. Defaults to 128.
+        key (callable, optional): Builds the cache key from the call's
+            arguments. Defaults to the positional arguments plus the
+            sorted keyword arguments, all of which must be hashable.
+
+    Returns:
+        callable: The wrapped function, or a decorator if func is omitted.
+    """
+    if func is None:
+        return functools.partial(memoize, cache=cache, maxsize=maxsize, key=key)
+    if cache is None:
+        cache = LRUCache(maxsize)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if key is not None:
+            cache_key = key(*args, **kwargs)
+        elif kwargs:
+            cache_key = (args, tuple(sorted(kwargs.items())))
+        else:
+            cache_key = args
+        result = cache.get(cache_key, _MISSING)
+        if result is _MISSING:
+            result = func(*args, **kwargs)
+            cache.put(cache_key, result)
+        return result
+
+    wrapper.cache = cache
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+
+if __name__ == "__main__":
+
+    @memoize(maxsize=64)
+    def fibonacci(n):
+        return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)
+
+    print(fibonacci(80))  # 23416728348467685
+    print(fibonacci.cache.stats())
@@ -1,3 +1,23 @@
-from .singly_linked_list import LinkedList, Node  # noqa
+from .array_linked_list import ArrayLinkedList  # noqa
+from .doubly_linked_list import DoublyLinkedList, DoublyNode  # noqa
+from .merge import merge_sorted  # noqa
+from .node_pool import NodePool  # noqa
+from .self_organizing_list import CountedNode, SelfOrganizingList  # noqa
+from .singly_linked_list import LinkedList, LinkedListCursor, Node  # noqa
+from .skip_list import SkipList  # noqa
+from .unrolled_linked_list import UnrolledLinkedList  # noqa
 
-__all__ = ["LinkedList", "Node"]
+__all__ = [
+    "ArrayLinkedList",
+    "CountedNode",
+    "DoublyLinkedList",
+    "DoublyNode",
+    "LinkedList",
+    "LinkedListCursor",
+    "Node",
+    "NodePool",
+    "SelfOrganizingList",
+    "SkipList",
+    "UnrolledLinkedList",
+    "merge_sorted",
+]
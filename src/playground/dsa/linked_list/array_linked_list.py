@@ -0,0 +1,289 @@
+from array import array
+
+from .singly_linked_list import EmptyListError, OutOfBoundsError
+
+NULL = -1  # The "no node" index
+
+
+class ArrayLinkedList:
+    """
+    Implements a singly linked list stored as parallel arrays.
+
+    A node is an integer index: its data lives in '_data' and the index of
+    the next node in '_next', an ``array('q')``. There is no Python object
+    per node, so a list costs about 16 bytes per element (8 with a typed
+    'data' array) plus the elements themselves. Freed slots are chained
+    into a free list through '_next' and reused before the arrays grow.
+    Because the whole list is two flat buffers, it pickles compactly and
+    ``buffers()`` exposes them for writing to a file or an mmap.
+
+    The API matches LinkedList; push_front, push_back and insert also
+    return the index of the new node.
+    """
+
+    def __init__(self, iterable=(), typecode=None, initial_capacity=16):
+        if not isinstance(initial_capacity, int) or initial_capacity <= 0:
+            raise ValueError("Initial capacity must be a positive integer.")
+        self._typecode = typecode
+        self._next = array("q")
+        self._data = array(typecode) if typecode else []
+        self._head = NULL
+        self._tail = NULL
+        self._free = NULL
+        self._length = 0
+        self._grow(initial_capacity)
+        for data in iterable:
+            self.push_back(data)
+
+    def __iter__(self):
+        """Iterates over the data from front to back."""
+        data, next_ = self._data, self._next
+        current = self._head
+        while current != NULL:
+            yield data[current]
+            current = next_[current]
+
+    def __len__(self):
+        """Returns the number of nodes in the list (cached)."""
+        return self._length
+
+    @property
+    def capacity(self):
+        """Returns the number of slots, used or free."""
+        return len(self._next)
+
+    def size(self):
+        """Returns the number of nodes in the list (cached)."""
+        return self._length
+
+    def empty(self):
+        """Checks if the list is empty."""
+        return self._length == 0
+
+    def buffers(self):
+        """
+        Returns memoryviews over the next array and (if typed) the data array.
+
+        The views pin the arrays: growing the list raises BufferError until
+        they are released.
+        """
+        data = memoryview(self._data) if self._typecode else None
+        return memoryview(self._next), data
+
+    def value_at(self, index):
+        """Returns the data at the specified index."""
+        return self._data[self._node_at(index)]
+
+    def push_front(self, data):
+        """Inserts data at the beginning of the list and returns its node index."""
+        node = self._alloc(data)
+        self._next[node] = self._head
+        self._head = node
+        if self._tail == NULL:
+            self._tail = node
+        self._length += 1
+        return node
+
+    def pop_front(self):
+        """Removes and returns the data at the front of the list."""
+        if self._head == NULL:
+            raise EmptyListError("List is empty")
+        node = self._head
+        data = self._data[node]
+        self._head = self._next[node]
+        if self._head == NULL:
+            self._tail = NULL
+        self._release(node)
+        self._length -= 1
+        return data
+
+    def push_back(self, data):
+        """Inserts data at the end of the list in O(1) and returns its node index."""
+        node = self._alloc(data)
+        if self._tail == NULL:
+            self._head = node
+        else:
+            self._next[self._tail] = node
+        self._tail = node
+        self._length += 1
+        return node
+
+    def pop_back(self):
+        """Removes and returns the data at the end of the list."""
+        if self._head == NULL:
+            raise EmptyListError("List is empty")
+        if self._length == 1:
+            return self.pop_front()
+        prev = self._node_at(self._length - 2)
+        node = self._tail
+        data = self._data[node]
+        self._next[prev] = NULL
+        self._tail = prev
+        self._release(node)
+        self._length -= 1
+        return data
+
+    def front(self):
+        """Returns the data at the front of the list (None if empty)."""
+        return self._data[self._head] if self._length else None
+
+    def back(self):
+        """Returns the data at the end of the list (None if empty)."""
+        return self._data[self._tail] if self._length else None
+
+    def insert(self, index, data):
+        """Inserts data at the specified index and returns its node index."""
+        if not 0 <= index <= self._length:
+            raise OutOfBoundsError(f"Index {index} is out of bounds")
+        if index == 0:
+            return self.push_front(data)
+        if index == self._length:
+            return self.push_back(data)
+
+        prev = self._node_at(index - 1)
+        node = self._alloc(data)
+        self._next[node] = self._next[prev]
+        self._next[prev] = node
+        self._length += 1
+        return node
+
+    def erase(self, index):
+        """Removes the node at the specified index."""
+        if not 0 <= index < self._length:
+            raise OutOfBoundsError(f"Index {index} is out of bounds")
+        if index == 0:
+            self.pop_front()
+            return
+
+        prev = self._node_at(index - 1)
+        self._unlink_after(prev)
+
+    def value_n_from_end(self, n):
+        """Returns the value of the node at the nth position from the end."""
+        if not isinstance(n, int) or n < 1:
+            raise ValueError("n must be a positive integer")
+
+        if n > self._length:
+            raise OutOfBoundsError(f"{n} is greater than the list length")
+
+        next_ = self._next
+        slow = fast = self._head
+        for _ in range(n):
+            fast = next_[fast]
+        while fast != NULL:
+            slow = next_[slow]
+            fast = next_[fast]
+        return self._data[slow]
+
+    def reverse(self):
+        """Reverses the list in-place by rewriting the next array."""
+        next_ = self._next
+        prev, current = NULL, self._head
+        while current != NULL:
+            next_[current], prev, current = prev, current, next_[current]
+        self._head, self._tail = self._tail, self._head
+
+    def remove_value(self, value):
+        """Removes the first occurrence of a node with the given value."""
+        if self._head == NULL:
+            return
+        if self._data[self._head] == value:
+            self.pop_front()
+            return
+
+        data, next_ = self._data, self._next
+        current = self._head
+        while next_[current] != NULL:
+            if data[next_[current]] == value:
+                self._unlink_after(current)
+                return
+            current = next_[current]
+
+    def compact(self):
+        """
+        Renumbers the nodes in list order and trims the spare slots.
+
+        Afterwards node i is the i-th element, so scans walk memory
+        sequentially. Node indices returned earlier are no longer valid.
+        """
+        values = list(self)
+        capacity = max(len(values), 1)
+        self._next = array("q")
+        self._data = array(self._typecode) if self._typecode else []
+        self._head = self._tail = self._free = NULL
+        self._length = 0
+        self._grow(capacity)
+        for data in values:
+            self.push_back(data)
+
+    def _node_at(self, index):
+        """Returns the node index at the specified position."""
+        if not 0 <= index < self._length:
+            raise OutOfBoundsError(f"Index {index} is out of bounds")
+        if index == self._length - 1:
+            return self._tail
+        next_ = self._next
+        current = self._head
+        for _ in range(index):
+            current = next_[current]
+        return current
+
+    def _unlink_after(self, prev):
+        """Removes the node following prev."""
+        node = self._next[prev]
+        self._next[prev] = self._next[node]
+        if node == self._tail:
+            self._tail = prev
+        self._release(node)
+        self._length -= 1
+
+    def _alloc(self, data):
+        """Takes a slot from the free list, growing the arrays if it is empty."""
+        if self._free == NULL:
+            self._grow(len(self._next))
+        node = self._free
+        self._data[node] = data  # May be rejected by the typecode; the slot stays free
+        self._free = self._next[node]
+        self._next[node] = NULL
+        return node
+
+    def _release(self, node):
+        """Returns a slot to the free list."""
+        self._data[node] = 0 if self._typecode else None  # Drop the reference
+        self._next[node] = self._free
+        self._free = node
+
+    def _grow(self, extra):
+        """Adds extra free slots, chained onto the free list."""
+        start = len(self._next)
+        if self._typecode:
+            self._data.frombytes(bytes(extra * self._data.itemsize))
+        else:
+            self._data.extend([None] * extra)
+        try:
+            self._next.extend(range(start + 1, start + extra))
+        except BufferError:  # _next is pinned by a view; undo the data growth
+            del self._data[start:]
+            raise
+        self._next.append(self._free)
+        self._free = start
+
+    def __repr__(self):
+        """Returns a string representation of the linked list."""
+        return f"ArrayLinkedList([{', '.join(str(data) for data in self)}])"
+
+    def __str__(self):
+        """Returns a string representation of the linked list."""
+        return " => ".join(map(str, self))
+
+
+if __name__ == "__main__":
+    all_ = ArrayLinkedList([3, 54, 43], typecode="q")
+    all_.push_back(1992)
+    all_.push_front(2002)
+    print(all_)  # 2002 => 3 => 54 => 43 => 1992
+    all_.erase(2)
+    all_.reverse()
+    print(all_)  # 1992 => 43 => 3 => 2002
+    print(f"2nd last node: {all_.value_n_from_end(2)}")  # 3
+    print(f"capacity: {all_.capacity}")  # 16
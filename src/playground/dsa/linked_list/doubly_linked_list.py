@@ -0,0 +1,240 @@
+from .singly_linked_list import EmptyListError, OutOfBoundsError
+
+
+class DoublyNode:
+    """Represents a node in the doubly linked list."""
+
+    __slots__ = ("data", "prev_node", "next_node")
+
+    def __init__(self, data, prev_node=None, next_node=None):
+        self.data = data
+        self.prev_node = prev_node
+        self.next_node = next_node
+
+
+class DoublyLinkedList:
+    """
+    Implements a doubly linked list with head and tail sentinels.
+
+    Pushing and popping at either end, and removing a node given its handle,
+    are O(1). The methods match LinkedList's, and push_front/push_back also
+    return the new node so that callers can remove it later in O(1). Unlike
+    LinkedList, which takes a chain of nodes, the constructor takes an
+    iterable of items.
+
+    With a NodePool (of DoublyNode), removed nodes are recycled, so a
+    handle must not be used once its node has been removed.
+    """
+
+    def __init__(self, iterable=(), pool=None):
+        if pool is not None and not issubclass(pool.node_type, DoublyNode):
+            raise TypeError("The pool must have node_type=DoublyNode")
+        self._pool = pool
+        self._head = DoublyNode(None)  # Sentinel before the first node
+        self._tail = DoublyNode(None, prev_node=self._head)  # Sentinel after the last
+        self._head.next_node = self._tail
+        self._length = 0
+        for data in iterable:
+            self.push_back(data)
+
+    def __iter__(self):
+        """Iterates over the data from front to back."""
+        current = self._head.next_node
+        while current is not self._tail:
+            yield current.data
+            current = current.next_node
+
+    def __reversed__(self):
+        """Iterates over the data from back to front."""
+        current = self._tail.prev_node
+        while current is not self._head:
+            yield current.data
+            current = current.prev_node
+
+    def __len__(self):
+        """Returns the number of nodes in the list (cached)."""
+        return self._length
+
+    @property
+    def head(self):
+        """Returns the first node (None if empty)."""
+        return self._head.next_node if self._length else None
+
+    @property
+    def tail(self):
+        """Returns the last node (None if empty)."""
+        return self._tail.prev_node if self._length else None
+
+    def size(self):
+        """Returns the number of nodes in the list (cached)."""
+        return self._length
+
+    def empty(self):
+        """Checks if the list is empty."""
+        return self._length == 0
+
+    def nodes(self):
+        """Iterates over the nodes from front to back."""
+        current = self._head.next_node
+        while current is not self._tail:
+            next_node = current.next_node  # The caller may unlink current
+            yield current
+            current = next_node
+
+    def value_at(self, index):
+        """Returns the data at the specified index, walking from the nearer end."""
+        return self._node_at(index).data
+
+    def push_front(self, data):
+        """Inserts data at the front in O(1) and returns its node."""
+        return self._link_after(self._head, data)
+
+    def pop_front(self):
+        """Removes and returns the data at the front of the list in O(1)."""
+        if not self._length:
+            raise EmptyListError("List is empty")
+        return self.remove_node(self._head.next_node)
+
+    def push_back(self, data):
+        """Inserts data at the back in O(1) and returns its node."""
+        return self._link_after(self._tail.prev_node, data)
+
+    def pop_back(self):
+        """Removes and returns the data at the back of the list in O(1)."""
+        if not self._length:
+            raise EmptyListError("List is empty")
+        return self.remove_node(self._tail.prev_node)
+
+    def front(self):
+        """Returns the data at the front of the list (None if empty)."""
+        return self._head.next_node.data if self._length else None
+
+    def back(self):
+        """Returns the data at the back of the list (None if empty)."""
+        return self._tail.prev_node.data if self._length else None
+
+    def insert(self, index, data):
+        """Inserts data at the specified index and returns its node."""
+        if not 0 <= index <= self._length:
+            raise OutOfBoundsError(f"Index {index} is out of bounds")
+        if index == self._length:
+            return self.push_back(data)
+        return self.insert_before(self._node_at(index), data)
+
+    def insert_before(self, node, data):
+        """Inserts data just before the given node in O(1) and returns its node."""
+        return self._link_after(node.prev_node, data)
+
+    def insert_after(self, node, data):
+        """Inserts data just after the given node in O(1) and returns its node."""
+        return self._link_after(node, data)
+
+    def erase(self, index):
+        """Removes the node at the specified index."""
+        self.remove_node(self._node_at(index))
+
+    def remove_node(self, node):
+        """Unlinks the given node in O(1) and returns its data."""
+        if node.prev_node is None or node.next_node is None:
+            raise ValueError("Node is not linked into a list")
+        node.prev_node.next_node = node.next_node
+        node.next_node.prev_node = node.prev_node
+        node.prev_node = node.next_node = None
+        self._length -= 1
+        data = node.data
+        if self._pool is not None:
+            self._pool.release(node)
+        return data
+
+    def move_to_front(self, node):
+        """Moves one of this list's nodes to the front in O(1), without reallocating it."""
+        self._relink_after(self._head, node)
+
+    def move_to_back(self, node):
+        """Moves one of this list's nodes to the back in O(1), without reallocating it."""
+        self._relink_after(self._tail.prev_node, node)
+
+    def value_n_from_end(self, n):
+        """Returns the value of the node at the nth position from the end."""
+        if not isinstance(n, int) or n < 1:
+            raise ValueError("n must be a positive integer")
+
+        if n > self._length:
+            raise OutOfBoundsError(f"{n} is greater than the list length")
+
+        return self._node_at(self._length - n).data
+
+    def reverse(self):
+        """Reverses the list in-place by swapping every node's links."""
+        current = self._head
+        while current is not None:
+            current.prev_node, current.next_node = current.next_node, current.prev_node
+            current = current.prev_node  # The old next node
+        self._head, self._tail = self._tail, self._head
+
+    def remove_value(self, value):
+        """Removes the first occurrence of a node with the given value."""
+        for node in self.nodes():
+            if node.data == value:
+                self.remove_node(node)
+                return
+
+    def _node_at(self, index):
+        """Returns the node at the specified index, walking from the nearer end."""
+        if not 0 <= index < self._length:
+            raise OutOfBoundsError(f"Index {index} is out of bounds")
+
+        if index < self._length // 2:
+            current = self._head.next_node
+            for _ in range(index):
+                current = current.next_node
+        else:
+            current = self._tail.prev_node
+            for _ in range(self._length - 1 - index):
+                current = current.prev_node
+        return current
+
+    def _link_after(self, prev_node, data):
+        """Creates a node holding data right after prev_node and returns it."""
+        if self._pool is not None:
+            node = self._pool.acquire(data, prev_node, prev_node.next_node)
+        else:
+            node = DoublyNode(data, prev_node, prev_node.next_node)
+        prev_node.next_node.prev_node = node
+        prev_node.next_node = node
+        self._length += 1
+        return node
+
+    def _relink_after(self, prev_node, node):
+        """Moves a linked node to just after prev_node."""
+        if node.prev_node is None or node.next_node is None:
+            raise ValueError("Node is not linked into a list")
+        if node is prev_node or node.prev_node is prev_node:
+            return
+        node.prev_node.next_node = node.next_node
+        node.next_node.prev_node = node.prev_node
+        node.prev_node = prev_node
+        node.next_node = prev_node.next_node
+        prev_node.next_node.prev_node = node
+        prev_node.next_node = node
+
+    def __repr__(self):
+        """Returns a string representation of the list."""
+        return f"DoublyLinkedList([{', '.join(str(data) for data in self)}])"
+
+    def __str__(self):
+        """Returns a string representation of the list."""
+        return " <=> ".join(map(str, self))
+
+
+if __name__ == "__main__":
+    dll = DoublyLinkedList([3, 54, 43])
+    print(dll)  # 3 <=> 54 <=> 43
+    handle = dll.push_back(1992)
+    dll.push_front(2002)
+    print(dll)  # 2002 <=> 3 <=> 54 <=> 43 <=> 1992
+    print(f"remove node: {dll.remove_node(handle)}")  # 1992
+    print(f"pop back value: {dll.pop_back()}")  # 43
+    print(f"backwards: {list(reversed(dll))}")  # [54, 3, 2002]
+    dll.reverse()
+    print(dll)  # 54 <=> 3 <=> 2002
@@ -0,0 +1,58 @@
+from playground.dsa.heaps import Heap
+
+from .singly_linked_list import LinkedList
+
+
+def merge_sorted(lists, key=None):
+    """
+    Merges sorted LinkedLists into one sorted LinkedList in O(n log k).
+
+    A Heap holds the current front node of each of the k lists, so every
+    node is placed with one extract_min and one insert. Nodes are relinked
+    rather than copied and the input lists are left empty. The merge is
+    stable: equal elements keep their order, with earlier lists first.
+    """
+    lists = list(lists)
+    heap = Heap()
+    for seq, linked_list in enumerate(lists):
+        node = linked_list.head
+        if node:
+            # seq breaks ties, so nodes themselves are never compared
+            heap.insert((node.data if key is None else key(node.data), seq, node))
+
+    merged = LinkedList()
+    first = last = None
+    count = 0
+    while heap:
+        _, seq, node = heap.extract_min()
+        following = node.next_node
+        if following:
+            heap.insert(
+                (following.data if key is None else key(following.data), seq, following)
+            )
+        if last is None:
+            first = node
+        else:
+            last.next_node = node
+        last = node
+        count += 1
+
+    for linked_list in lists:
+        linked_list.head = linked_list._tail = None
+        linked_list._length = 0
+    if first is not None:
+        merged._attach(first, last, count)
+    return merged
+
+
+if __name__ == "__main__":
+    lists = [
+        LinkedList.from_iterable([1, 4, 7]),
+        LinkedList.from_iterable([2, 5, 8]),
+        LinkedList.from_iterable([3, 6, 9]),
+    ]
+    print(merge_sorted(lists))  # 1 => 2 => 3 => 4 => 5 => 6 => 7 => 8 => 9
+
+    ll = LinkedList.from_iterable([5, 3, 8, 1])
+    ll.sort()
+    print(ll)  # 1 => 3 => 5 => 8
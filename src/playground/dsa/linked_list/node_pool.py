@@ -0,0 +1,86 @@
+import sys
+
+from .singly_linked_list import Node
+
+
+class NodePool:
+    """
+    Bounded free list of spare nodes that lists recycle instead of reallocating.
+
+    A list built with a pool hands its removed nodes to ``release`` and takes
+    new ones from ``acquire``, which re-initializes a spare node in place when
+    one is available. Reusing nodes avoids allocator and garbage collector
+    work under heavy churn. Several lists may share one pool as long as they
+    use the same node type.
+
+    Nodes released to a pool must not be used by the caller afterwards: the
+    pool hands them out again.
+    """
+
+    def __init__(self, max_size=1024, node_type=Node):
+        if not isinstance(max_size, int) or max_size < 0:
+            raise ValueError("max_size must be a non-negative integer")
+        self.max_size = max_size
+        self.node_type = node_type
+        self._free = []
+        self.allocated = 0  # Nodes created because the pool was empty
+        self.reused = 0  # Nodes handed out again from the pool
+        self.released = 0  # Nodes taken back into the pool
+        self.discarded = 0  # Nodes dropped because the pool was full
+
+    def __len__(self):
+        """Returns the number of spare nodes held by the pool."""
+        return len(self._free)
+
+    def acquire(self, *fields):
+        """Returns a node initialized with the given fields, reusing a spare one if possible."""
+        if self._free:
+            node = self._free.pop()
+            node.__init__(*fields)
+            self.reused += 1
+            return node
+        self.allocated += 1
+        return self.node_type(*fields)
+
+    def release(self, node):
+        """Takes back a node that is no longer linked into any list."""
+        if len(self._free) < self.max_size:
+            node.__init__(None)  # Drop the references to data and neighbours
+            self._free.append(node)
+            self.released += 1
+        else:
+            self.discarded += 1
+
+    def clear(self):
+        """Drops every spare node."""
+        self._free.clear()
+
+    def stats(self):
+        """Returns the pool's counters and the memory held by its spare nodes."""
+        node_size = sys.getsizeof(self.node_type(None))
+        return {
+            "free": len(self._free),
+            "max_size": self.max_size,
+            "allocated": self.allocated,
+            "reused": self.reused,
+            "released": self.released,
+            "discarded": self.discarded,
+            "node_bytes": node_size,
+            "free_bytes": node_size * len(self._free) + sys.getsizeof(self._free),
+        }
+
+    def __repr__(self):
+        return f"NodePool(free={len(self._free)}, max_size={self.max_size})"
+
+
+if __name__ == "__main__":
+    from .singly_linked_list import LinkedList
+
+    pool = NodePool(max_size=2)
+    ll = LinkedList(pool=pool)
+    for i in range(3):
+        ll.push_front(i)
+    while not ll.empty():
+        ll.pop_front()
+    ll.push_front("recycled")
+    print(pool.stats())  # allocated 3, released 2, discarded 1, reused 1
@@ -0,0 +1,175 @@
+from .singly_linked_list import LinkedList, Node, OutOfBoundsError
+
+MOVE_TO_FRONT = "move_to_front"
+TRANSPOSE = "transpose"
+COUNT = "count"
+POLICIES = (MOVE_TO_FRONT, TRANSPOSE, COUNT)
+
+
+class CountedNode(Node):
+    """Represents a node that also counts how often it was found."""
+
+    __slots__ = ("count",)
+
+    def __init__(self, data, next_node=None, count=0):
+        super().__init__(data, next_node)
+        self.count = count
+
+
+class SelfOrganizingList(LinkedList):
+    """
+    Implements a linked list that reorders itself as it is searched.
+
+    find() scans from the head like any list search, then moves the node
+    it found forward according to the policy:
+
+    - "move_to_front" moves it to the head,
+    - "transpose" swaps it with its predecessor,
+    - "count" counts the hit and moves it ahead of the nodes found less
+      often, keeping the list in decreasing order of hits.
+
+    Frequently searched items thus gather near the head, and under a skewed
+    (e.g. Zipf) access pattern the average probe length drops far below the
+    n / 2 of a static list. 'searches' and 'probes' record the work done;
+    see stats(). With the count policy, add items with push_back (new items
+    have the fewest hits) to keep the order intact.
+
+    An optional key function maps each item to the value find() compares,
+    so a list of (key, value) pairs can serve as a lookup table. A NodePool
+    must have node_type=CountedNode.
+    """
+
+    def __init__(self, iterable=(), policy=MOVE_TO_FRONT, key=None, pool=None):
+        if policy not in POLICIES:
+            raise ValueError(f"policy must be one of {', '.join(POLICIES)}")
+        if pool is not None and not issubclass(pool.node_type, CountedNode):
+            raise ValueError("The pool must have node_type=CountedNode")
+        super().__init__(pool=pool)
+        self.policy = policy
+        self._key = key
+        self.searches = 0
+        self.probes = 0  # Nodes compared by find()
+        self.extend(iterable)
+
+    def __contains__(self, target):
+        """Checks for a key with find(), so membership tests also reorder the list."""
+        return self.find(target, self) is not self
+
+    def find(self, target, default=None):
+        """Returns the first item whose key equals target and moves it forward."""
+        key = self._key
+        counting = self.policy == COUNT  # Only CountedNodes have to be found here
+        prev = run_prev = None  # run_prev precedes the first node of the current run
+        current = self.head
+        probes = 0
+        while current:
+            probes += 1
+            if counting and prev is not None and current.count != prev.count:
+                run_prev = prev
+            if (current.data if key is None else key(current.data)) == target:
+                break
+            prev, current = current, current.next_node
+        self.searches += 1
+        self.probes += probes
+        if current is None:
+            return default
+
+        data = current.data
+        if self.policy == MOVE_TO_FRONT:
+            if prev is not None:
+                self._relink(prev, current, None)
+        elif self.policy == TRANSPOSE:
+            if prev is not None:
+                prev.data, current.data = current.data, prev.data
+        else:
+            current.count += 1
+            if prev is not run_prev:
+                # The list stays sorted by count once current leads its run
+                self._relink(prev, current, run_prev)
+        return data
+
+    def concat(self, other):
+        """Moves every item of another list onto the end, emptying it."""
+        super().concat(self._adopt(other))
+
+    def splice(self, index, other):
+        """Moves every item of another list in at the specified index, emptying it."""
+        if not 0 <= index <= self._length:
+            raise OutOfBoundsError(f"Index {index} is out of bounds")
+        super().splice(index, self._adopt(other))
+
+    def split_at(self, index):
+        """Splits the list before the specified index into two lists with its policy and key."""
+        front, rest = super().split_at(index)
+        front.policy, front._key = self.policy, self._key
+        back = self._like()
+        if rest.head is not None:
+            back._attach(rest.head, rest._tail, rest._length)  # Already CountedNodes
+        return front, back
+
+    def average_probe_length(self):
+        """Returns the mean number of nodes find() compared per search."""
+        return self.probes / self.searches if self.searches else 0.0
+
+    def stats(self):
+        """Returns the search counters."""
+        return {
+            "searches": self.searches,
+            "probes": self.probes,
+            "average_probe_length": self.average_probe_length(),
+        }
+
+    def reset_stats(self):
+        """Resets the search counters."""
+        self.searches = self.probes = 0
+
+    def _like(self):
+        """Returns an empty list with the same policy, key and pool."""
+        return type(self)(policy=self.policy, key=self._key, pool=self._pool)
+
+    def _adopt(self, other):
+        """Returns other if it holds CountedNodes, else moves its items into a list that does."""
+        if isinstance(other, SelfOrganizingList):
+            return other
+        adopted = self._like()
+        while other:
+            adopted.push_back(other.pop_front())
+        return adopted
+
+    def _relink(self, prev, node, new_prev):
+        """Moves node, which follows prev, to just after new_prev (the head if None)."""
+        prev.next_node = node.next_node
+        if node is self._tail:
+            self._tail = prev
+        if new_prev is None:
+            node.next_node = self.head
+            self.head = node
+        else:
+            node.next_node = new_prev.next_node
+            new_prev.next_node = node
+
+    def _new_node(self, data, next_node=None):
+        """Creates a CountedNode, reusing a pooled one when the list has a pool."""
+        if self._pool is not None:
+            return self._pool.acquire(data, next_node)
+        return CountedNode(data, next_node)
+
+    def __repr__(self):
+        """Returns a string representation of the list."""
+        return f"SelfOrganizingList([{', '.join(str(data) for data in self)}])"
+
+
+if __name__ == "__main__":
+    import random
+
+    rng = random.Random(0)
+    weights = [1 / rank**1.5 for rank in range(1, 1001)]  # Zipf, s = 1.5
+    lookups = rng.choices(range(1000), weights, k=20000)
+    items = rng.sample(range(1000), 1000)
+    static = sum(items.index(target) + 1 for target in lookups) / len(lookups)
+    print(f"static: {static:.1f} probes per search")  # 503.8
+    for policy in POLICIES:
+        sol = SelfOrganizingList(items, policy=policy)
+        for target in lookups:
+            sol.find(target)
+        print(f"{policy}: {sol.average_probe_length():.1f} probes per search")
@@ -13,16 +13,26 @@ class OutOfBoundsError(Exception):
 class Node:
     """Represents a node in the linked list."""
 
+    __slots__ = ("data", "next_node")  # No per-node __dict__
+
     def __init__(self, data, next_node=None):
         self.data = data
         self.next_node = next_node
 
 
 class LinkedList:
-    """Implements a singly linked list with optimized operations."""
+    """
+    Implements a singly linked list with optimized operations.
+
+    An optional NodePool lets the list recycle the nodes it removes for
+    the nodes it creates later. The last node is tracked in '_tail', so
+    push_back and back are O(1); relinking 'head' by hand bypasses it.
+    """
 
-    def __init__(self, head=None):
+    def __init__(self, head=None, pool=None):
         self.head = head
+        self._tail = head
+        self._pool = pool
         self._length = 0  # Cache the length for efficiency
         if head:
             self._length = 1
@@ -30,6 +40,7 @@ class LinkedList:
             while current.next_node:
                 self._length += 1
                 current = current.next_node
+            self._tail = current
 
     def __iter__(self):
         """Allows iteration over the linked list, yielding the data of each node."""
@@ -63,30 +74,18 @@ class LinkedList:
 
     def push_front(self, data):
         """Inserts a new node at the beginning of the linked list."""
-        self.head = Node(data, next_node=self.head)
-        self._length += 1
+        self._insert_after(None, data)
 
     def pop_front(self):
         """Removes and returns the data at the front of the list."""
         if not self.head:
             raise EmptyListError("List is empty")
 
-        data = self.head.data
-        self.head = self.head.next_node
-        self._length -= 1
-        return data
+        return self._remove_after(None)
 
     def push_back(self, data):
-        """Inserts a new node at the end of the linked list."""
-        new_node = Node(data)
-        if not self.head:
-            self.head = new_node
-        else:
-            current = self.head
-            while current.next_node:
-                current = current.next_node
-            current.next_node = new_node
-        self._length += 1
+        """Inserts a new node at the end of the linked list in O(1)."""
+        self._insert_after(self._tail, data)
 
     def pop_back(self):
         """Removes and returns the data at the end of the list."""
@@ -94,16 +93,12 @@ class LinkedList:
             raise EmptyListError("List is empty")
 
         if not self.head.next_node:
-            data = self.head.data
-            self.head = None
-        else:
-            current = self.head
-            while current.next_node.next_node:  # Stop one before the last node
-                current = current.next_node
-            data = current.next_node.data
-            current.next_node = None
-        self._length -= 1
-        return data
+            return self._remove_after(None)
+
+        current = self.head
+        while current.next_node.next_node:  # Stop one before the last node
+            current = current.next_node
+        return self._remove_after(current)
 
     def front(self):
         """Returns the data at the front of the list (None if empty)."""
@@ -111,12 +106,7 @@ class LinkedList:
 
     def back(self):
         """Returns the data at the end of the list (None if empty)."""
-        if not self.head:
-            return None
-        current = self.head
-        while current.next_node:
-            current = current.next_node
-        return current.data
+        return self._tail.data if self._tail else None
 
     def insert(self, index, data):
         """Inserts a new node with the given data at the specified index."""
@@ -131,8 +121,7 @@ class LinkedList:
         for _ in range(index - 1):
             current = current.next_node
 
-        current.next_node = Node(data, next_node=current.next_node)
-        self._length += 1
+        self._insert_after(current, data)
 
     def erase(self, index):
         """Removes the node at the specified index."""
@@ -147,8 +136,7 @@ class LinkedList:
         for _ in range(index - 1):
             current = current.next_node
 
-        current.next_node = current.next_node.next_node
-        self._length -= 1
+        self._remove_after(current)
 
     def value_n_from_end(self, n):
         """Returns the value of the node at the nth position from the end."""
@@ -172,6 +160,7 @@ class LinkedList:
         """Reverses the linked list in-place."""
         prev = None
         current = self.head
+        self._tail = current
         while current:
             next_node = current.next_node
             current.next_node = prev
@@ -179,6 +168,32 @@ class LinkedList:
             current = next_node
         self.head = prev
 
+    def sort(self, key=None, reverse=False):
+        """
+        Sorts the list in-place with a stable bottom-up merge sort.
+
+        Nodes are relinked rather than copied, so the sort takes
+        O(n log n) time and O(1) extra space. Runs of 1, 2, 4, ... nodes
+        are merged pairwise, a pass at a time, with no recursion. As with
+        list.sort, key is applied to the data before comparing and
+        reverse=True keeps equal elements in their original order.
+        """
+        if self._length < 2:
+            return
+        dummy = Node(None, self.head)
+        width = 1
+        while width < self._length:
+            last = dummy
+            current = dummy.next_node
+            while current:
+                left = current
+                right = _cut(left, width)
+                current = _cut(right, width)
+                last = _merge_runs(last, left, right, key, reverse)
+            width *= 2
+        self.head = dummy.next_node
+        self._tail = last
+
     def remove_value(self, value):
         """Removes the first occurrence of a node with the given value."""
         if not self.head:
@@ -191,11 +206,116 @@ class LinkedList:
         current = self.head
         while current.next_node:
             if current.next_node.data == value:
-                current.next_node = current.next_node.next_node
-                self._length -= 1
+                self._remove_after(current)
                 return
             current = current.next_node
 
+    @classmethod
+    def from_iterable(cls, iterable, pool=None):
+        """Builds a list from an iterable in one pass, linking nodes directly."""
+        linked_list = cls(pool=pool)
+        linked_list.extend(iterable)
+        return linked_list
+
+    def extend(self, iterable):
+        """Appends every item of an iterable, building the new chain before attaching it."""
+        if iterable is self:
+            iterable = list(iterable)
+        first = last = None
+        count = 0
+        for data in iterable:
+            node = self._new_node(data)
+            if last is None:
+                first = node
+            else:
+                last.next_node = node
+            last = node
+            count += 1
+        if first is not None:
+            self._attach(first, last, count)
+
+    def concat(self, other):
+        """Moves every node of another LinkedList onto the end in O(1), emptying it."""
+        if other is self:
+            raise ValueError("Cannot concatenate a list with itself")
+        if other.head:
+            self._attach(other.head, other._tail, other._length)
+            other.head = other._tail = None
+            other._length = 0
+
+    def splice(self, index, other):
+        """Moves every node of another LinkedList in at the specified index, emptying it."""
+        if not 0 <= index <= self._length:
+            raise OutOfBoundsError(f"Index {index} is out of bounds")
+        if index == self._length:
+            self.concat(other)
+        else:
+            self.cursor().advance(index).splice(other)
+
+    def split_at(self, index):
+        """
+        Splits the list before the specified index into two lists.
+
+        The two lists returned take over the existing nodes, so no data
+        is copied; this list is left empty.
+        """
+        if not 0 <= index <= self._length:
+            raise OutOfBoundsError(f"Index {index} is out of bounds")
+        front = type(self)(pool=self._pool)
+        front.concat(self)
+        back = front.cursor().advance(index).split_here()
+        return front, back
+
+    def cursor(self):
+        """Returns a LinkedListCursor positioned before the first node."""
+        return LinkedListCursor(self)
+
+    def _insert_after(self, prev, data):
+        """Links a new node after prev (at the front if prev is None) and returns it."""
+        if prev is None:
+            node = self.head = self._new_node(data, self.head)
+        else:
+            node = prev.next_node = self._new_node(data, prev.next_node)
+        if node.next_node is None:
+            self._tail = node
+        self._length += 1
+        return node
+
+    def _attach(self, first, last, count):
+        """Links the chain first..last of count nodes onto the end of the list."""
+        if self._tail is None:
+            self.head = first
+        else:
+            self._tail.next_node = first
+        self._tail = last
+        self._length += count
+
+    def _remove_after(self, prev):
+        """Unlinks the node after prev (the head if prev is None) and returns its data."""
+        if prev is None:
+            node = self.head
+            self.head = node.next_node
+        else:
+            node = prev.next_node
+            prev.next_node = node.next_node
+        if node is self._tail:
+            self._tail = prev
+        self._length -= 1
+        data = node.data
+        self._free_node(node)
+        return data
+
+    def _new_node(self, data, next_node=None):
+        """Creates a node, reusing a pooled one when the list has a pool."""
+        if self._pool is not None:
+            return self._pool.acquire(data, next_node)
+        return Node(data, next_node)
+
+    def _free_node(self, node):
+        """Hands a removed node back to the pool, if any."""
+        if self._pool is not None:
+            self._pool.release(node)
+
     def __repr__(self):
         """Returns a string representation of the linked list."""
         return f"LinkedList([{', '.join(str(data) for data in self)}])"
@@ -205,6 +325,151 @@ class LinkedList:
         return " => ".join(map(str, self))
 
 
+def _cut(node, count):
+    """Detaches the chain after the first count nodes from node and returns it."""
+    for _ in range(count - 1):
+        if node is None:
+            return None
+        node = node.next_node
+    if node is None:
+        return None
+    rest = node.next_node
+    node.next_node = None
+    return rest
+
+
+def _merge_runs(last, left, right, key, reverse):
+    """Merges two sorted chains onto the node last and returns the new last node."""
+    if right is None:
+        last.next_node = left
+    else:
+        left_key = left.data if key is None else key(left.data)
+        right_key = right.data if key is None else key(right.data)
+        while True:
+            # Taking from the left on ties keeps the sort stable
+            if left_key < right_key if reverse else right_key < left_key:
+                last.next_node = last = right
+                right = right.next_node
+                if right is None:
+                    last.next_node = left
+                    break
+                right_key = right.data if key is None else key(right.data)
+            else:
+                last.next_node = last = left
+                left = left.next_node
+                if left is None:
+                    last.next_node = right
+                    break
+                left_key = left.data if key is None else key(left.data)
+    while last.next_node:
+        last = last.next_node
+    return last
+
+
+class LinkedListCursor:
+    """
+    Remembers a position in a LinkedList so that sequential edits are O(1).
+
+    The cursor sits on a node, or before the first node right after it is
+    created (index -1). It edits the list through the node it sits on, so
+    advance, insert_after, erase_next, splice and split_here never walk
+    from the head and a single forward pass of edits stays linear. The
+    cursor is invalidated if the list is changed by other means.
+    """
+
+    def __init__(self, linked_list):
+        self._list = linked_list
+        self._node = None  # None means "before the head"
+        self._index = -1
+
+    @property
+    def index(self):
+        """Returns the position of the cursor (-1 before the first node)."""
+        return self._index
+
+    @property
+    def value(self):
+        """Returns the data of the node under the cursor."""
+        if self._node is None:
+            raise OutOfBoundsError("Cursor is before the first node")
+        return self._node.data
+
+    @value.setter
+    def value(self, data):
+        if self._node is None:
+            raise OutOfBoundsError("Cursor is before the first node")
+        self._node.data = data
+
+    def has_next(self):
+        """Checks if there is a node after the cursor."""
+        return self._next() is not None
+
+    def peek_next(self):
+        """Returns the data of the node after the cursor (None if there is none)."""
+        following = self._next()
+        return following.data if following else None
+
+    def advance(self, steps=1):
+        """Moves the cursor forward by the given number of nodes."""
+        for _ in range(steps):
+            following = self._next()
+            if following is None:
+                raise OutOfBoundsError("Cannot advance past the last node")
+            self._node = following
+            self._index += 1
+        return self
+
+    def insert_after(self, data):
+        """Inserts data right after the cursor in O(1); the cursor does not move."""
+        self._list._insert_after(self._node, data)
+
+    def erase_next(self):
+        """Removes the node right after the cursor in O(1) and returns its data."""
+        if self._next() is None:
+            raise OutOfBoundsError("There is no node after the cursor")
+        return self._list._remove_after(self._node)
+
+    def splice(self, other):
+        """Moves every node of another LinkedList in after the cursor in O(1), emptying it."""
+        if other is self._list:
+            raise ValueError("Cannot splice a list into itself")
+        if not other.head:
+            return
+        lst = self._list
+        following = self._next()
+        other._tail.next_node = following
+        if self._node is None:
+            lst.head = other.head
+        else:
+            self._node.next_node = other.head
+        if following is None:
+            lst._tail = other._tail
+        lst._length += other._length
+        other.head = other._tail = None
+        other._length = 0
+
+    def split_here(self):
+        """Detaches the nodes after the cursor into a new LinkedList in O(1) and returns it."""
+        lst = self._list
+        rest = LinkedList(pool=lst._pool)
+        following = self._next()
+        if following is None:
+            return rest
+        rest.head, rest._tail = following, lst._tail
+        rest._length = lst._length - self._index - 1
+        if self._node is None:
+            lst.head = None
+        else:
+            self._node.next_node = None
+        lst._tail = self._node
+        lst._length = self._index + 1
+        return rest
+
+    def _next(self):
+        """Returns the node after the cursor."""
+        return self._list.head if self._node is None else self._node.next_node
+
+
 if __name__ == "__main__":
     ll = LinkedList(
         head=Node(3, next_node=Node(54, next_node=Node(43, next_node=Node(1992))))
@@ -0,0 +1,297 @@
+import random
+
+from .singly_linked_list import EmptyListError, OutOfBoundsError
+
+
+class _SkipNode:
+    """Holds an element and its forward links, one per level, with their widths."""
+
+    __slots__ = ("data", "next", "width")
+
+    def __init__(self, data, level):
+        self.data = data
+        self.next = [None] * level
+        self.width = [1] * level  # Positions skipped by each forward link
+
+
+class SkipList:
+    """
+    Implements an indexable skip list with O(log n) access by position.
+
+    Every forward link records its width, the number of positions it skips,
+    so a search can count positions while it descends the levels and
+    value_at, insert and erase cost O(log n) expected time instead of a
+    walk from the head. Positions run from -1 (the head) to len(self)
+    (the end), and a link to the end has the width it would have if the end
+    were a node.
+
+    In positional mode (the default) the API matches LinkedList. With
+    ordered=True the list is an ordered set instead: elements are added
+    with add() and kept sorted without duplicates, and searching by value
+    (add, discard, index, in) is O(log n) as well.
+    """
+
+    def __init__(self, iterable=(), ordered=False, max_level=32, seed=None):
+        if not isinstance(max_level, int) or max_level < 1:
+            raise ValueError("max_level must be a positive integer")
+        self._ordered = ordered
+        self._max_level = max_level
+        self._random = random.Random(seed)
+        self._head = _SkipNode(None, max_level)
+        self._level = 1  # The number of levels in use
+        self._length = 0
+        for data in iterable:
+            if ordered:
+                self.add(data)
+            else:
+                self.push_back(data)
+
+    @property
+    def ordered(self):
+        """Returns True if the list is an ordered set."""
+        return self._ordered
+
+    def __iter__(self):
+        """Iterates over the data from front to back along the bottom level."""
+        node = self._head.next[0]
+        while node:
+            yield node.data
+            node = node.next[0]
+
+    def __len__(self):
+        """Returns the number of elements in the list (cached)."""
+        return self._length
+
+    def __contains__(self, value):
+        """Checks for a value; O(log n) in ordered mode, a scan otherwise."""
+        if not self._ordered:
+            return any(data == value for data in self)
+        node = self._find_by_value(value)[0][0].next[0]
+        return node is not None and node.data == value
+
+    def size(self):
+        """Returns the number of elements in the list (cached)."""
+        return self._length
+
+    def empty(self):
+        """Checks if the list is empty."""
+        return self._length == 0
+
+    def value_at(self, index):
+        """Returns the data at the specified index in O(log n)."""
+        if not 0 <= index < self._length:
+            raise OutOfBoundsError(f"Index {index} is out of bounds")
+        node, position = self._head, -1
+        for level in range(self._level - 1, -1, -1):
+            while node.next[level] and position + node.width[level] <= index:
+                position += node.width[level]
+                node = node.next[level]
+        return node.data
+
+    def insert(self, index, data):
+        """Inserts data at the specified index in O(log n)."""
+        self._check_positional()
+        if not 0 <= index <= self._length:
+            raise OutOfBoundsError(f"Index {index} is out of bounds")
+        self._link(*self._find_by_index(index), index, data)
+
+    def erase(self, index):
+        """Removes the element at the specified index in O(log n)."""
+        self._delete(index)
+
+    def push_front(self, data):
+        """Inserts data at the front of the list."""
+        self.insert(0, data)
+
+    def push_back(self, data):
+        """Inserts data at the end of the list."""
+        self.insert(self._length, data)
+
+    def pop_front(self):
+        """Removes and returns the data at the front of the list."""
+        if not self._length:
+            raise EmptyListError("List is empty")
+        return self._delete(0)
+
+    def pop_back(self):
+        """Removes and returns the data at the end of the list."""
+        if not self._length:
+            raise EmptyListError("List is empty")
+        return self._delete(self._length - 1)
+
+    def front(self):
+        """Returns the data at the front of the list (None if empty)."""
+        return self._head.next[0].data if self._length else None
+
+    def back(self):
+        """Returns the data at the end of the list (None if empty)."""
+        return self.value_at(self._length - 1) if self._length else None
+
+    def value_n_from_end(self, n):
+        """Returns the value of the element at the nth position from the end."""
+        if not isinstance(n, int) or n < 1:
+            raise ValueError("n must be a positive integer")
+
+        if n > self._length:
+            raise OutOfBoundsError(f"{n} is greater than the list length")
+
+        return self.value_at(self._length - n)
+
+    def reverse(self):
+        """Reverses the list in-place (positional mode only)."""
+        self._check_positional()
+        values = list(self)
+        self._clear()
+        for data in reversed(values):
+            self.push_back(data)
+
+    def remove_value(self, value):
+        """Removes the first occurrence of the given value."""
+        if self._ordered:
+            self.discard(value)
+            return
+        for index, data in enumerate(self):
+            if data == value:
+                self._delete(index)
+                return
+
+    def add(self, value):
+        """Adds a value to an ordered set in O(log n); duplicates are ignored."""
+        self._check_ordered()
+        update, positions = self._find_by_value(value)
+        following = update[0].next[0]
+        if following is None or following.data != value:
+            self._link(update, positions, positions[0] + 1, value)
+
+    def discard(self, value):
+        """Removes a value from an ordered set in O(log n), if present."""
+        self._check_ordered()
+        update, _ = self._find_by_value(value)
+        following = update[0].next[0]
+        if following is not None and following.data == value:
+            self._unlink(update, following)
+
+    def index(self, value):
+        """Returns the position of a value in an ordered set in O(log n)."""
+        self._check_ordered()
+        update, positions = self._find_by_value(value)
+        following = update[0].next[0]
+        if following is None or following.data != value:
+            raise ValueError(f"{value!r} is not in the list")
+        return positions[0] + 1
+
+    def bisect_left(self, value):
+        """Returns the position of the first element not less than value."""
+        self._check_ordered()
+        return self._find_by_value(value)[1][0] + 1
+
+    def _find_by_index(self, index):
+        """Returns, per level, the last node before position index and its position."""
+        update = [self._head] * self._max_level
+        positions = [-1] * self._max_level
+        node, position = self._head, -1
+        for level in range(self._level - 1, -1, -1):
+            while node.next[level] and position + node.width[level] < index:
+                position += node.width[level]
+                node = node.next[level]
+            update[level], positions[level] = node, position
+        return update, positions
+
+    def _find_by_value(self, value):
+        """Returns, per level, the last node whose data is less than value and its position."""
+        update = [self._head] * self._max_level
+        positions = [-1] * self._max_level
+        node, position = self._head, -1
+        for level in range(self._level - 1, -1, -1):
+            while node.next[level] and node.next[level].data < value:
+                position += node.width[level]
+                node = node.next[level]
+            update[level], positions[level] = node, position
+        return update, positions
+
+    def _link(self, update, positions, index, data):
+        """Links a new node at position index after the nodes in update."""
+        level = self._random_level()
+        if level > self._level:
+            for raised in range(self._level, level):
+                # The head's link to the end skips every position
+                self._head.width[raised] = self._length + 1
+            self._level = level
+
+        node = _SkipNode(data, level)
+        for i in range(level):
+            prev = update[i]
+            node.next[i] = prev.next[i]
+            node.width[i] = prev.width[i] - (index - positions[i]) + 1
+            prev.next[i] = node
+            prev.width[i] = index - positions[i]
+        for i in range(level, self._level):
+            update[i].width[i] += 1  # These links now skip over the new node
+        self._length += 1
+
+    def _delete(self, index):
+        """Removes the element at position index and returns its data."""
+        if not 0 <= index < self._length:
+            raise OutOfBoundsError(f"Index {index} is out of bounds")
+        update, _ = self._find_by_index(index)
+        target = update[0].next[0]
+        self._unlink(update, target)
+        return target.data
+
+    def _unlink(self, update, target):
+        """Unlinks target, which directly follows update[0]."""
+        for i in range(self._level):
+            prev = update[i]
+            if prev.next[i] is target:
+                prev.width[i] += target.width[i] - 1
+                prev.next[i] = target.next[i]
+            else:
+                prev.width[i] -= 1
+        while self._level > 1 and self._head.next[self._level - 1] is None:
+            self._level -= 1
+        self._length -= 1
+
+    def _random_level(self):
+        """Returns a level from a geometric distribution with p = 1/2."""
+        level = 1
+        while level < self._max_level and self._random.getrandbits(1):
+            level += 1
+        return level
+
+    def _clear(self):
+        """Removes every element."""
+        self._head = _SkipNode(None, self._max_level)
+        self._level = 1
+        self._length = 0
+
+    def _check_positional(self):
+        if self._ordered:
+            raise TypeError(
+                "An ordered SkipList only accepts add(), not positional inserts"
+            )
+
+    def _check_ordered(self):
+        if not self._ordered:
+            raise TypeError(
+                "Value operations need a SkipList created with ordered=True"
+            )
+
+    def __repr__(self):
+        """Returns a string representation of the list."""
+        return f"SkipList([{', '.join(str(data) for data in self)}])"
+
+    def __str__(self):
+        """Returns a string representation of the list."""
+        return " => ".join(map(str, self))
+
+
+if __name__ == "__main__":
+    sl = SkipList(range(10), seed=1)
+    sl.insert(5, 42)
+    sl.erase(0)
+    print(sl)  # 1 => 2 => 3 => 4 => 42 => 5 => 6 => 7 => 8 => 9
+    print(f"Value at 4: {sl.value_at(4)}")  # 42
+
+    ordered = SkipList([30, 10, 20, 10], ordered=True)
+    print(ordered)  # 10 => 20 => 30
+    print(f"index of 20: {ordered.index(20)}")  # 1
@@ -0,0 +1,259 @@
+from .singly_linked_list import EmptyListError, OutOfBoundsError
+
+
+class _UnrolledNode:
+    """Holds a short run of consecutive elements of an unrolled linked list."""
+
+    __slots__ = ("items", "prev_node", "next_node")
+
+    def __init__(self, items=None, prev_node=None, next_node=None):
+        self.items = items if items is not None else []
+        self.prev_node = prev_node
+        self.next_node = next_node
+
+
+class UnrolledLinkedList:
+    """
+    Implements a linked list whose nodes each hold up to node_capacity elements.
+
+    Packing elements into small arrays means one node hop (and one node
+    allocation) per run of elements instead of per element, so scans and
+    indexed walks touch far fewer objects. A full node is split in two on
+    insert, and a node that falls below half full on erase is merged with
+    (or refilled from) its successor. The API matches LinkedList.
+    """
+
+    def __init__(self, iterable=(), node_capacity=64):
+        if not isinstance(node_capacity, int) or node_capacity < 2:
+            raise ValueError("node_capacity must be an integer of at least 2")
+        self._capacity = node_capacity
+        self._head = None
+        self._tail = None
+        self._length = 0
+        self._node_count = 0
+        for data in iterable:
+            self.push_back(data)
+
+    def __iter__(self):
+        """Iterates over the data from front to back, one node at a time."""
+        node = self._head
+        while node:
+            yield from node.items
+            node = node.next_node
+
+    def __reversed__(self):
+        """Iterates over the data from back to front."""
+        node = self._tail
+        while node:
+            yield from reversed(node.items)
+            node = node.prev_node
+
+    def __len__(self):
+        """Returns the number of elements in the list (cached)."""
+        return self._length
+
+    def size(self):
+        """Returns the number of elements in the list (cached)."""
+        return self._length
+
+    def empty(self):
+        """Checks if the list is empty."""
+        return self._length == 0
+
+    def node_count(self):
+        """Returns the number of nodes currently allocated."""
+        return self._node_count
+
+    def value_at(self, index):
+        """Returns the data at the specified index."""
+        node, offset = self._locate(index)
+        return node.items[offset]
+
+    def push_front(self, data):
+        """Inserts data at the front of the list."""
+        if self._head is None or len(self._head.items) == self._capacity:
+            self._link_before(self._head, [])
+        self._head.items.insert(0, data)
+        self._length += 1
+
+    def pop_front(self):
+        """Removes and returns the data at the front of the list."""
+        if not self._length:
+            raise EmptyListError("List is empty")
+        node = self._head
+        data = node.items.pop(0)
+        self._length -= 1
+        if not node.items:
+            self._unlink(node)
+        return data
+
+    def push_back(self, data):
+        """Inserts data at the end of the list."""
+        if self._tail is None or len(self._tail.items) == self._capacity:
+            self._link_after(self._tail, [])
+        self._tail.items.append(data)
+        self._length += 1
+
+    def pop_back(self):
+        """Removes and returns the data at the end of the list."""
+        if not self._length:
+            raise EmptyListError("List is empty")
+        node = self._tail
+        data = node.items.pop()
+        self._length -= 1
+        if not node.items:
+            self._unlink(node)
+        return data
+
+    def front(self):
+        """Returns the data at the front of the list (None if empty)."""
+        return self._head.items[0] if self._length else None
+
+    def back(self):
+        """Returns the data at the end of the list (None if empty)."""
+        return self._tail.items[-1] if self._length else None
+
+    def insert(self, index, data):
+        """Inserts data at the specified index, splitting a full node."""
+        if not 0 <= index <= self._length:
+            raise OutOfBoundsError(f"Index {index} is out of bounds")
+        if index == self._length:
+            self.push_back(data)
+            return
+
+        node, offset = self._locate(index)
+        if len(node.items) == self._capacity:
+            half = self._capacity // 2
+            self._link_after(node, node.items[half:])
+            del node.items[half:]
+            if offset > half:
+                node, offset = node.next_node, offset - half
+        node.items.insert(offset, data)
+        self._length += 1
+
+    def erase(self, index):
+        """Removes the element at the specified index, merging an underfull node."""
+        node, offset = self._locate(index)
+        del node.items[offset]
+        self._length -= 1
+        self._rebalance(node)
+
+    def value_n_from_end(self, n):
+        """Returns the value of the element at the nth position from the end."""
+        if not isinstance(n, int) or n < 1:
+            raise ValueError("n must be a positive integer")
+
+        if n > self._length:
+            raise OutOfBoundsError(f"{n} is greater than the list length")
+
+        return self.value_at(self._length - n)
+
+    def reverse(self):
+        """Reverses the list in-place."""
+        node = self._head
+        while node:
+            node.items.reverse()
+            node.prev_node, node.next_node = node.next_node, node.prev_node
+            node = node.prev_node  # The old next node
+        self._head, self._tail = self._tail, self._head
+
+    def remove_value(self, value):
+        """Removes the first occurrence of the given value."""
+        node = self._head
+        while node:
+            if value in node.items:
+                node.items.remove(value)
+                self._length -= 1
+                self._rebalance(node)
+                return
+            node = node.next_node
+
+    def _locate(self, index):
+        """Returns the node holding the index and the offset within it."""
+        if not 0 <= index < self._length:
+            raise OutOfBoundsError(f"Index {index} is out of bounds")
+
+        if index < self._length // 2:
+            node = self._head
+            while index >= len(node.items):
+                index -= len(node.items)
+                node = node.next_node
+            return node, index
+
+        # Walk backwards, counting positions from the end
+        from_end = self._length - 1 - index
+        node = self._tail
+        while from_end >= len(node.items):
+            from_end -= len(node.items)
+            node = node.prev_node
+        return node, len(node.items) - 1 - from_end
+
+    def _rebalance(self, node):
+        """Restores the half-full invariant of a node after a removal."""
+        if not node.items:
+            self._unlink(node)
+            return
+        successor = node.next_node
+        if len(node.items) >= self._capacity // 2 or successor is None:
+            return
+        if len(node.items) + len(successor.items) <= self._capacity:
+            node.items.extend(successor.items)
+            self._unlink(successor)
+        else:
+            # Borrow enough from the successor to leave both about even
+            count = (len(successor.items) - len(node.items)) // 2
+            node.items.extend(successor.items[:count])
+            del successor.items[:count]
+
+    def _link_after(self, prev_node, items):
+        """Creates a node holding items after prev_node (or as the head if None)."""
+        next_node = prev_node.next_node if prev_node else self._head
+        node = _UnrolledNode(items, prev_node, next_node)
+        if prev_node:
+            prev_node.next_node = node
+        else:
+            self._head = node
+        if next_node:
+            next_node.prev_node = node
+        else:
+            self._tail = node
+        self._node_count += 1
+        return node
+
+    def _link_before(self, next_node, items):
+        """Creates a node holding items before next_node (or as the tail if None)."""
+        prev_node = next_node.prev_node if next_node else self._tail
+        return self._link_after(prev_node, items)
+
+    def _unlink(self, node):
+        """Removes a node from the chain of nodes."""
+        if node.prev_node:
+            node.prev_node.next_node = node.next_node
+        else:
+            self._head = node.next_node
+        if node.next_node:
+            node.next_node.prev_node = node.prev_node
+        else:
+            self._tail = node.prev_node
+        node.prev_node = node.next_node = None
+        self._node_count -= 1
+
+    def __repr__(self):
+        """Returns a string representation of the list."""
+        return f"UnrolledLinkedList([{', '.join(str(data) for data in self)}])"
+
+    def __str__(self):
+        """Returns a string representation of the list."""
+        return " => ".join(map(str, self))
+
+
+if __name__ == "__main__":
+    ull = UnrolledLinkedList(range(10), node_capacity=4)
+    print(ull)  # 0 => 1 => 2 => ... => 9
+    print(f"nodes: {ull.node_count()}")  # 3
+    ull.insert(2, 42)
+    ull.erase(0)
+    print(f"Value at 1: {ull.value_at(1)}")  # 42
+    print(f"3rd last node: {ull.value_n_from_end(3)}")  # 7
+    ull.reverse()
+    print(ull)  # 9 => 8 => ... => 42 => 1
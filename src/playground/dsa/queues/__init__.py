@@ -1,5 +1,6 @@
 from .circular_queue import CircularQueue
+from .concurrent_linked_queue import ConcurrentLinkedQueue
 from .queue_adt import QueueADT
 from .queue_with_stack import Queue
 
-__all__ = ["CircularQueue", "Queue", "QueueADT"]
+__all__ = ["CircularQueue", "ConcurrentLinkedQueue", "Queue", "QueueADT"]
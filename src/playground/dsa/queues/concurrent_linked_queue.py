@@ -0,0 +1,299 @@
+import threading
+import time
+
+from playground.dsa.linked_list import Node
+
+from .queue_adt import QueueADT
+
+
+class QueueUnderflowError(Exception):
+    """
+    An exception raised when a get finds the queue empty or times out.
+    """
+
+    pass
+
+
+class QueueClosedError(Exception):
+    """
+    An exception raised on a put to a closed queue, or a get from a closed, drained one.
+    """
+
+    pass
+
+
+class ConcurrentLinkedQueue(QueueADT):
+    """
+    A thread-safe, unbounded FIFO queue with separate head and tail locks.
+
+    This is the two-lock queue of Michael and Scott (1996). The linked list
+    always starts with a dummy node: producers append after the tail under
+    the tail lock, and consumers advance the head under the head lock, so
+    producers never contend with consumers and put_many/get_many move a
+    whole batch per lock acquisition.
+
+    A consumer that finds the queue empty can block on a condition of the
+    head lock. It first registers in a waiting counter, which producers
+    read without locking, so a producer only takes the head lock to wake
+    a consumer when one is actually waiting.
+
+    After close(), puts raise QueueClosedError; gets drain the items left
+    and then raise QueueClosedError instead of blocking.
+
+    Raises:
+        QueueUnderflowError: If a non-blocking or timed get finds no item.
+        QueueClosedError: If the queue is used after close().
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty queue.
+        """
+        self._head = self._tail = Node(None)  # The dummy node
+        self._head_lock = threading.Lock()
+        self._tail_lock = threading.Lock()
+        self._not_empty = threading.Condition(self._head_lock)
+        self._waiting = 0  # Consumers blocked in _not_empty; guarded by the head lock
+        self._put_count = 0  # Guarded by the tail lock
+        self._get_count = 0  # Guarded by the head lock
+        self._closed = False
+
+    def __len__(self):
+        """
+        Returns the number of items in the queue.
+
+        Returns:
+            int: A snapshot that may already be stale under concurrent use.
+        """
+        # The counters are read without locks, one after the other: items put
+        # and taken between the two reads can push the difference below zero
+        return max(0, self._put_count - self._get_count)
+
+    def __bool__(self):
+        """
+        Checks if the queue is non-empty.
+
+        Returns:
+            bool: True if the queue held an item when checked.
+        """
+        return self._head.next_node is not None
+
+    @property
+    def closed(self):
+        """
+        bool: True once close() has been called.
+        """
+        return self._closed
+
+    def put(self, item):
+        """
+        Adds an item to the end of the queue; never blocks.
+
+        Args:
+            item: The item to add.
+
+        Raises:
+            QueueClosedError: If the queue is closed.
+        """
+        node = Node(item)
+        with self._tail_lock:
+            if self._closed:
+                raise QueueClosedError("Cannot put onto a closed queue")
+            self._put_count += 1
+            self._tail.next_node = node
+            self._tail = node
+        self._wake(1)
+
+    def put_many(self, items):
+        """
+        Adds several items to the end of the queue with one lock acquisition.
+
+        Args:
+            items (Iterable): The items to add, in order.
+
+        Raises:
+            QueueClosedError: If the queue is closed.
+        """
+        first = last = None
+        count = 0
+        for item in items:  # Build the chain before taking the lock
+            node = Node(item)
+            if last is None:
+                first = node
+            else:
+                last.next_node = node
+            last = node
+            count += 1
+        with self._tail_lock:
+            if self._closed:
+                raise QueueClosedError("Cannot put onto a closed queue")
+            if first is None:
+                return
+            self._put_count += count
+            self._tail.next_node = first
+            self._tail = last
+        self._wake(count)
+
+    def get(self, block=True, timeout=None):
+        """
+        Removes and returns the item at the front of the queue.
+
+        Args:
+            block (bool, optional): Wait for an item if the queue is empty.
+                Defaults to True.
+            timeout (float, optional): The most seconds to wait. Defaults to
+                None, which waits until an item arrives or the queue closes.
+
+        Returns:
+            Any: The item at the front of the queue.
+
+        Raises:
+            QueueUnderflowError: If no item arrived in time.
+            QueueClosedError: If the queue is closed and drained.
+        """
+        with self._head_lock:
+            self._wait_for_item(block, timeout)
+            return self._take()
+
+    def get_many(self, max_items, block=True, timeout=None):
+        """
+        Removes up to max_items items from the front with one lock acquisition.
+
+        Waits, as get() does, for the first item only; then takes whatever
+        else is already queued, up to max_items.
+
+        Args:
+            max_items (int): The most items to return.
+            block (bool, optional): Wait for an item if the queue is empty.
+                Defaults to True.
+            timeout (float, optional): The most seconds to wait. Defaults to None.
+
+        Returns:
+            list: Between 1 and max_items items, in queue order.
+
+        Raises:
+            ValueError: If max_items is not a positive integer.
+            QueueUnderflowError: If no item arrived in time.
+            QueueClosedError: If the queue is closed and drained.
+        """
+        if not isinstance(max_items, int) or max_items < 1:
+            raise ValueError("max_items must be a positive integer")
+        with self._head_lock:
+            self._wait_for_item(block, timeout)
+            items = [self._take()]
+            while len(items) < max_items and self._head.next_node is not None:
+                items.append(self._take())
+            return items
+
+    def close(self):
+        """
+        Closes the queue: puts fail from now on and blocked gets wake up.
+
+        Items already queued can still be taken.
+        """
+        with self._tail_lock, self._head_lock:
+            self._closed = True
+            self._not_empty.notify_all()
+
+    def enqueue(self, item):
+        """
+        Adds an item to the end of the queue.
+        """
+        self.put(item)
+
+    def dequeue(self):
+        """
+        Removes and returns the item at the front of the queue without blocking.
+
+        Raises:
+            QueueUnderflowError: If the queue is empty.
+        """
+        return self.get(block=False)
+
+    def peek(self):
+        """
+        Returns the item at the front of the queue without removing it.
+
+        Raises:
+            QueueUnderflowError: If the queue is empty.
+        """
+        with self._head_lock:
+            first = self._head.next_node
+            if first is None:
+                raise QueueUnderflowError("Cannot peek into an empty queue")
+            return first.data
+
+    def is_empty(self):
+        """
+        Checks if the queue is empty.
+        """
+        return not self
+
+    def size(self):
+        """
+        Returns the number of items in the queue.
+        """
+        return len(self)
+
+    def _wait_for_item(self, block, timeout):
+        """Waits until an item is queued; the caller holds the head lock."""
+        if self._head.next_node is not None:
+            return
+        if self._closed:
+            raise QueueClosedError("The queue is closed and empty")
+        if not block:
+            raise QueueUnderflowError("Cannot get from an empty queue")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        # Registering before the re-check means a producer that links an
+        # item after the check is sure to see a waiter and notify
+        self._waiting += 1
+        try:
+            while self._head.next_node is None:
+                if self._closed:
+                    raise QueueClosedError("The queue is closed and empty")
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise QueueUnderflowError("Timed out waiting for an item")
+                self._not_empty.wait(remaining)
+        finally:
+            self._waiting -= 1
+
+    def _take(self):
+        """Unlinks the first item; the caller holds the head lock and knows it exists."""
+        first = self._head.next_node
+        item = first.data
+        first.data = None  # first becomes the new dummy node
+        self._head = first
+        self._get_count += 1
+        return item
+
+    def _wake(self, count):
+        """Wakes up to count blocked consumers, taking the head lock only if any wait."""
+        if self._waiting:
+            with self._head_lock:
+                self._not_empty.notify(count)
+
+    def __repr__(self):
+        return f"ConcurrentLinkedQueue(size={len(self)}, closed={self._closed})"
+
+
+if __name__ == "__main__":
+    queue = ConcurrentLinkedQueue()
+    results = []
+
+    def consume():
+        while True:
+            try:
+                results.extend(queue.get_many(64))
+            except QueueClosedError:
+                return
+
+    consumers = [threading.Thread(target=consume) for _ in range(4)]
+    for thread in consumers:
+        thread.start()
+    for start in range(0, 10000, 100):
+        queue.put_many(range(start, start + 100))
+    queue.close()
+    for thread in consumers:
+        thread.join()
+    print(len(results), sorted(results) == list(range(10000)))  # 10000 True
@@ -0,0 +1,105 @@
+import pickle
+import random
+import unittest
+
+from playground.dsa.linked_list import ArrayLinkedList
+from playground.dsa.linked_list.singly_linked_list import (
+    EmptyListError,
+    OutOfBoundsError,
+)
+
+
+class TestArrayLinkedList(unittest.TestCase):
+    def test_empty_list(self):
+        """Test operations on an empty list."""
+        all_ = ArrayLinkedList()
+        self.assertTrue(all_.empty())
+        self.assertIsNone(all_.front())
+        self.assertIsNone(all_.back())
+        with self.assertRaises(EmptyListError):
+            all_.pop_front()
+        with self.assertRaises(EmptyListError):
+            all_.pop_back()
+        with self.assertRaises(OutOfBoundsError):
+            all_.erase(0)
+
+    def test_free_list_reuses_slots(self):
+        """Test that freed slots are reused before the arrays grow."""
+        all_ = ArrayLinkedList(range(4), initial_capacity=4)
+        self.assertEqual(all_.capacity, 4)
+        freed = all_.pop_front()
+        self.assertEqual(freed, 0)
+        self.assertEqual(all_.push_back(4), 0)  # Slot 0 is reused
+        self.assertEqual(all_.capacity, 4)
+        all_.push_back(5)
+        self.assertEqual(all_.capacity, 8)
+        self.assertEqual(list(all_), [1, 2, 3, 4, 5])
+
+    def test_random_operations_match_list(self):
+        """Test the LinkedList API against a plain list."""
+        rng = random.Random(9)
+        all_ = ArrayLinkedList(typecode="q", initial_capacity=2)
+        expected = []
+        for step in range(2000):
+            op = rng.random()
+            if op < 0.4:
+                i = rng.randint(0, len(expected))
+                all_.insert(i, step)
+                expected.insert(i, step)
+            elif op < 0.6 and expected:
+                i = rng.randrange(len(expected))
+                all_.erase(i)
+                del expected[i]
+            elif op < 0.7 and expected:
+                self.assertEqual(all_.pop_back(), expected.pop())
+            elif op < 0.8 and expected:
+                value = rng.choice(expected)
+                all_.remove_value(value)
+                expected.remove(value)
+            elif expected:
+                i = rng.randrange(len(expected))
+                self.assertEqual(all_.value_at(i), expected[i])
+        self.assertEqual(list(all_), expected)
+        self.assertEqual(all_.back(), expected[-1])
+        self.assertEqual(all_.value_n_from_end(3), expected[-3])
+        all_.reverse()
+        self.assertEqual(list(all_), expected[::-1])
+
+    def test_compact_and_pickle(self):
+        """Test renumbering in list order and round-tripping through pickle."""
+        all_ = ArrayLinkedList(["a", "b", "c"])
+        all_.push_front("z")
+        all_.compact()
+        self.assertEqual(all_.capacity, 4)
+        self.assertEqual(list(all_._next), [1, 2, 3, -1])
+        clone = pickle.loads(pickle.dumps(all_))
+        self.assertEqual(list(clone), ["z", "a", "b", "c"])
+        next_view, data_view = ArrayLinkedList([7], typecode="d").buffers()
+        self.assertEqual(next_view.format, "q")
+        self.assertEqual(data_view.tolist()[0], 7.0)
+
+    def test_failed_push_and_pinned_growth(self):
+        """Test that rejected values and views held across a grow lose no slots."""
+        all_ = ArrayLinkedList([1], typecode="q", initial_capacity=2)
+        for _ in range(3):
+            with self.assertRaises(TypeError):
+                all_.push_back("x")
+            with self.assertRaises(OverflowError):
+                all_.push_front(2**70)
+        all_.push_back(2)
+        self.assertEqual((list(all_), all_.capacity), ([1, 2], 2))
+
+        next_view, data_view = all_.buffers()
+        with self.assertRaises(BufferError):
+            all_.push_back(3)
+        data_view.release()
+        with self.assertRaises(BufferError):
+            all_.push_back(3)
+        self.assertEqual((list(all_), all_.capacity, len(all_._data)), ([1, 2], 2, 2))
+        next_view.release()
+        all_.push_back(3)
+        self.assertEqual(list(all_), [1, 2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import operator
+import unittest
+from unittest import mock
+
+from playground.dsa.arrays import DynamicArray, TypedDynamicArray
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestBulkOpsPurePython(unittest.TestCase):
+    """The bulk operations with plain callables, or without NumPy installed."""
+
+    def setUp(self):
+        for module in ("arrays", "typed_array"):
+            patcher = mock.patch(f"playground.dsa.arrays.{module}.np", None)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_map_filter_reduce(self):
+        da = DynamicArray()
+        da.extend([3, 1, 2])
+        self.assertEqual(list(da.map(lambda x: x * 10)), [30, 10, 20])
+        self.assertEqual(list(da.filter(lambda x: x > 1)), [3, 2])
+        self.assertEqual(da.reduce(operator.add), 6)
+        self.assertEqual(da.reduce(operator.add, 10), 16)
+        with self.assertRaises(TypeError):
+            DynamicArray().reduce(operator.add)
+
+    def test_argsort_and_take(self):
+        ta = TypedDynamicArray("q")
+        ta.extend([30, 10, 20, 10])
+        order = ta.argsort()
+        self.assertEqual(list(order), [1, 3, 2, 0])
+        taken = ta.take(order)
+        self.assertIsInstance(taken, TypedDynamicArray)
+        self.assertEqual(taken.tolist(), [10, 10, 20, 30])
+        with self.assertRaises(IndexError):
+            ta.take([4])
+
+    def test_to_numpy_requires_numpy(self):
+        with self.assertRaises(ImportError):
+            DynamicArray().to_numpy()
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestNumPyInterop(unittest.TestCase):
+    def test_object_argsort_and_take_ignore_numpy(self):
+        """Object elements keep Python semantics even with NumPy installed."""
+        da = DynamicArray()
+        da.extend([(2, "b"), (1, "z"), (2, "a")])
+        self.assertEqual(list(da.argsort()), [1, 2, 0])
+        self.assertEqual(list(da.take([2, 1])), [(2, "a"), (1, "z")])
+        mixed = DynamicArray()
+        mixed.extend([10, 9.5, 2])
+        self.assertEqual(list(mixed.take([0, 2])), [10, 2])
+        self.assertIsInstance(mixed.take([0])[0], int)
+        mixed.append("x")
+        with self.assertRaises(TypeError):
+            mixed.argsort()  # As sorted() would, rather than comparing as strings
+
+    def test_from_numpy_returns_subclass(self):
+        class Subclass(DynamicArray):
+            pass
+
+        self.assertIsInstance(Subclass.from_numpy(np.array([1, 2])), Subclass)
+
+        class TypedSubclass(TypedDynamicArray):
+            pass
+
+        typed = TypedSubclass.from_numpy(np.array([1.5, 2.5]))
+        self.assertIsInstance(typed, TypedSubclass)
+        self.assertEqual((typed.typecode, typed.tolist()), ("d", [1.5, 2.5]))
+
+    def test_object_array_round_trip(self):
+        da = DynamicArray.from_numpy(np.array([1.5, 2.5]))
+        self.assertEqual(list(da), [1.5, 2.5])
+        self.assertIsInstance(da[0], float)
+        self.assertEqual(da.to_numpy().tolist(), [1.5, 2.5])
+        with self.assertRaises(ValueError):
+            DynamicArray.from_numpy(np.zeros((2, 2)))
+
+    def test_typed_to_numpy_shares_memory(self):
+        ta = TypedDynamicArray("d")
+        ta.extend([1.0, 2.0, 3.0])
+        values = ta.to_numpy()
+        values[0] = 9.0
+        self.assertEqual(ta[0], 9.0)
+        copy = TypedDynamicArray.from_numpy(values)
+        self.assertEqual(copy.tolist(), [9.0, 2.0, 3.0])
+        with self.assertRaises(TypeError):
+            TypedDynamicArray.from_numpy(values, "q")
+
+    def test_from_numpy_rejects_overflowing_cast(self):
+        with self.assertRaises(TypeError):
+            TypedDynamicArray.from_numpy(np.array([300, -1]), "b")
+        with self.assertRaises(TypeError):
+            TypedDynamicArray.from_numpy(np.array([2**40]), "i")
+        with self.assertRaises(TypeError):
+            TypedDynamicArray.from_numpy(np.array([-1]), "Q")
+        narrowed = TypedDynamicArray.from_numpy(np.array([127, -128]), "b")
+        self.assertEqual(narrowed.tolist(), [127, -128])
+
+        ta = TypedDynamicArray("B")
+        with self.assertRaises(TypeError):
+            ta._from_numpy_result(np.array([400, 100]))
+        self.assertEqual(ta._from_numpy_result(np.array([200, 0])).tolist(), [200, 0])
+
+    def test_ufunc_bulk_ops(self):
+        ta = TypedDynamicArray("d")
+        ta.extend([4.0, -1.0, 9.0])
+        self.assertEqual(ta.map(np.abs).tolist(), [4.0, 1.0, 9.0])
+        self.assertEqual(ta.filter(np.signbit).tolist(), [-1.0])
+        self.assertEqual(ta.reduce(np.add), 12.0)
+        self.assertEqual(list(ta.argsort()), [1, 0, 2])
+        self.assertEqual(ta.take([2, 0]).tolist(), [9.0, 4.0])
+        with self.assertRaises(IndexError):
+            ta.take([-1])
+
+        da = DynamicArray()
+        da.extend([1, 2, 3])
+        self.assertEqual(list(da.map(np.negative)), [-1, -2, -3])
+        self.assertEqual(da.reduce(np.multiply, 2), 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
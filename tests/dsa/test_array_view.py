@@ -0,0 +1,109 @@
+import unittest
+
+from playground.dsa.arrays import ArrayView, DynamicArray, TypedDynamicArray
+
+
+def make_array(values):
+    da = DynamicArray()
+    da.extend(values)
+    return da
+
+
+class TestSlicing(unittest.TestCase):
+    def test_get_slice(self):
+        """Test that slicing returns a copy of the same array type."""
+        da = make_array(range(10))
+        part = da[2:5]
+        self.assertIsInstance(part, DynamicArray)
+        self.assertEqual(list(part), [2, 3, 4])
+        self.assertEqual(list(da[::3]), [0, 3, 6, 9])
+        self.assertEqual(list(da[::-4]), [9, 5, 1])
+        self.assertEqual(list(da[7:2]), [])
+        part[0] = 100
+        self.assertEqual(da[2], 2)
+
+        ta = TypedDynamicArray("d")
+        ta.extend([1.0, 2.0, 3.0])
+        self.assertIsInstance(ta[1:], TypedDynamicArray)
+        self.assertEqual(ta[1:].tolist(), [2.0, 3.0])
+
+    def test_set_slice(self):
+        """Test that contiguous slice assignment can grow and shrink the array."""
+        da = make_array(range(5))
+        da[1:3] = ["a", "b", "c", "d"]
+        self.assertEqual(list(da), [0, "a", "b", "c", "d", 3, 4])
+        da[0:5] = []
+        self.assertEqual(list(da), [3, 4])
+        da[2:2] = make_array([5, 6])
+        self.assertEqual(list(da), [3, 4, 5, 6])
+        da[::2] = [30, 50]
+        self.assertEqual(list(da), [30, 4, 50, 6])
+        with self.assertRaises(ValueError):
+            da[::2] = [1]
+
+    def test_set_slice_typed(self):
+        """Test slice assignment on typed storage."""
+        ta = TypedDynamicArray("q", initial_capacity=2)
+        ta.extend([1, 2, 3])
+        ta[1:2] = [20, 21, 22]
+        self.assertEqual(ta.tolist(), [1, 20, 21, 22, 3])
+        ta[:4] = []
+        self.assertEqual(ta.tolist(), [3])
+
+
+class TestArrayView(unittest.TestCase):
+    def test_view_shares_storage(self):
+        """Test that writes through a view are visible in the parent."""
+        da = make_array(range(10))
+        view = da.view(2, 6)
+        self.assertIsInstance(view, ArrayView)
+        self.assertEqual(len(view), 4)
+        self.assertEqual(list(view), [2, 3, 4, 5])
+        view[0] = 20
+        view[1:3] = [30, 40]
+        self.assertEqual(list(da[2:5]), [20, 30, 40])
+        da[5] = 50
+        self.assertEqual(view[3], 50)
+        self.assertIn(50, view)
+        self.assertFalse(view.detached)
+
+        with self.assertRaises(IndexError):
+            view[4]
+        with self.assertRaises(ValueError):
+            view[0:2] = [1]
+        with self.assertRaises(IndexError):
+            da.view(5, 11)
+
+    def test_nested_views(self):
+        """Test that views of views address the shared storage directly."""
+        da = make_array(range(10))
+        outer = da.view(2, 9)
+        inner = outer[1:4]
+        self.assertIsInstance(inner, ArrayView)
+        self.assertIs(inner._parent, da)
+        self.assertEqual(list(inner), [3, 4, 5])
+        inner[0] = 33
+        self.assertEqual(da[3], 33)
+        self.assertEqual(list(outer[::3]), [2, 5, 8])
+
+    def test_copy_on_write(self):
+        """Test that copy-on-write views leave the parent untouched."""
+        da = make_array(range(6))
+        view = da.view(1, 4, copy_on_write=True)
+        view[0] = 10
+        self.assertTrue(view.detached)
+        self.assertEqual(list(view), [10, 2, 3])
+        self.assertEqual(list(da), [0, 1, 2, 3, 4, 5])
+
+    def test_add_and_repr(self):
+        """Test concatenation and representation of views."""
+        da = make_array(range(5))
+        combined = da.view(0, 2) + da.view(3)
+        self.assertIsInstance(combined, DynamicArray)
+        self.assertEqual(list(combined), [0, 1, 3, 4])
+        self.assertEqual(list(da + da.view(4)), [0, 1, 2, 3, 4, 4])
+        self.assertEqual(repr(da.view(1, 3)), "[1, 2]")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,6 @@
+import random
 import unittest
+
 from playground.dsa.arrays import DynamicArray
 
 
@@ -83,6 +85,37 @@ class TestDynamicArray(unittest.TestCase):
         self.assertEqual(da[1], 2)
         self.assertEqual(da[2], 3)
 
+    def test_extend_sized_resizes_once(self):
+        """Test that extending with a sized iterable resizes the storage once."""
+        da = DynamicArray(initial_capacity=2)
+        da.append(0)
+        resizes = []
+        original_resize = da._resize
+        da._resize = lambda c: (resizes.append(c), original_resize(c))
+        da.extend(range(1, 100))
+        self.assertEqual(resizes, [100])
+        self.assertEqual(list(da), list(range(100)))
+
+    def test_extend_iterator_and_self(self):
+        """Test extending with an unsized iterator and with the array itself."""
+        da = DynamicArray(initial_capacity=1)
+        da.extend(x * 2 for x in range(4))
+        self.assertEqual(list(da), [0, 2, 4, 6])
+        da.extend(da)
+        self.assertEqual(list(da), [0, 2, 4, 6, 0, 2, 4, 6])
+
+    def test_insert_and_pop_shift(self):
+        """Test that block shifts keep the order for head, middle and tail edits."""
+        da = DynamicArray(initial_capacity=2)
+        da.extend([1, 2, 3, 4, 5])
+        da.insert(0, 0)
+        da.insert(3, 25)
+        da.insert(len(da), 6)
+        self.assertEqual(list(da), [0, 1, 2, 25, 3, 4, 5, 6])
+        self.assertEqual(da.pop(3), 25)
+        self.assertEqual(da.pop(0), 0)
+        self.assertEqual(list(da), [1, 2, 3, 4, 5, 6])
+
     def test_clear(self):
         """Test clearing DynamicArray."""
         da = DynamicArray()
@@ -117,6 +150,18 @@ class TestDynamicArray(unittest.TestCase):
         with self.assertRaises(TypeError):
             da1 + [5, 6]
 
+    def test_results_keep_subclass(self):
+        """Test that slices and concatenation build the caller's class."""
+
+        class Subclass(DynamicArray):
+            pass
+
+        sa = Subclass()
+        sa.extend([1, 2, 3])
+        self.assertIsInstance(sa[1:], Subclass)
+        self.assertIsInstance(sa + sa, Subclass)
+        self.assertEqual(list(sa[::2]), [1, 3])
+
     def test_repr(self):
         """Test string representation of DynamicArray."""
         da = DynamicArray()
@@ -126,5 +171,92 @@ class TestDynamicArray(unittest.TestCase):
         self.assertEqual(repr(da), "[1, 2]")
 
 
+class TestDynamicArrayIndex(unittest.TestCase):
+    def assertIndexConsistent(self, da):
+        expected = {}
+        for i, value in enumerate(da):
+            expected.setdefault(value, set()).add(i)
+        self.assertEqual(da._index, expected)
+
+    def test_contains_and_remove(self):
+        da = DynamicArray(indexed=True)
+        da.extend([5, 1, 5, 2])
+        self.assertIn(5, da)
+        self.assertNotIn(3, da)
+        da.remove(5)
+        self.assertEqual(list(da), [1, 5, 2])
+        self.assertIndexConsistent(da)
+        with self.assertRaises(ValueError):
+            da.remove(3)
+
+    def test_mutations_keep_index_consistent(self):
+        rng = random.Random(7)
+        da = DynamicArray(initial_capacity=2, indexed=True)
+        expected = []
+        for _ in range(500):
+            op = rng.random()
+            value = rng.randrange(10)
+            if op < 0.3:
+                da.append(value)
+                expected.append(value)
+            elif op < 0.5:
+                i = rng.randint(0, len(expected))
+                da.insert(i, value)
+                expected.insert(i, value)
+            elif op < 0.7 and expected:
+                i = rng.randrange(len(expected))
+                self.assertEqual(da.pop(i), expected.pop(i))
+            elif op < 0.8 and expected:
+                i = rng.randrange(len(expected))
+                da[i] = value
+                expected[i] = value
+            elif op < 0.9:
+                block = [value] * rng.randrange(4)
+                da[1:3] = block
+                expected[1:3] = block
+            elif expected:
+                da.remove(expected[0])
+                expected.pop(0)
+            self.assertEqual(list(da), expected)
+        self.assertIndexConsistent(da)
+        da.clear()
+        self.assertNotIn(0, da)
+
+    def test_unhashable_queries_scan(self):
+        """Test that unhashable queries behave as they do without the index."""
+
+        class EqualsTwo:
+            __hash__ = None
+
+            def __eq__(self, other):
+                return other == 2
+
+        for indexed in (False, True):
+            da = DynamicArray(indexed=indexed)
+            da.extend([1, 2, 3])
+            self.assertNotIn([1], da)
+            with self.assertRaises(ValueError):
+                da.remove([1])
+            self.assertIn(EqualsTwo(), da)
+            da.remove(EqualsTwo())
+            self.assertEqual(list(da), [1, 3])
+            if indexed:
+                self.assertIndexConsistent(da)
+
+    def test_enable_and_disable(self):
+        da = DynamicArray()
+        da.extend([[1], [2]])
+        with self.assertRaises(TypeError):
+            da.enable_index()
+        self.assertIsNone(da._index)
+        da.clear()
+        da.extend([3, 4, 3])
+        da.enable_index()
+        self.assertIndexConsistent(da)
+        self.assertIsNotNone(da[0:2]._index)
+        da.disable_index()
+        self.assertIn(4, da)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,62 @@
+import contextlib
+import io
+import unittest
+
+from playground.algorithms.graphs.breadth_first_search_adj_list import bfs_adj_matrix
+from playground.dsa.arrays import BitArray
+
+
+class TestBitArray(unittest.TestCase):
+    def test_get_set_and_test_and_set(self):
+        bits = BitArray(20)
+        self.assertEqual(len(bits), 20)
+        self.assertFalse(bits[13])
+        bits[13] = True
+        self.assertTrue(bits[13])
+        self.assertTrue(bits.test_and_set(13))
+        self.assertFalse(bits.test_and_set(0))
+        bits[13] = False
+        self.assertEqual([i for i, bit in enumerate(bits) if bit], [0])
+        with self.assertRaises(IndexError):
+            bits[20]
+        with self.assertRaises(ValueError):
+            BitArray(-1)
+
+    def test_count_and_find(self):
+        bits = BitArray(19, fill=True)
+        self.assertEqual(bits.count(), 19)
+        self.assertEqual(bits.find_first_unset(), -1)
+        bits[17] = False
+        self.assertEqual(bits.find_first_unset(), 17)
+        self.assertEqual(BitArray(19).find_first_set(), -1)
+        empty = BitArray(19)
+        empty[9] = True
+        self.assertEqual(empty.find_first_set(), 9)
+        self.assertEqual(BitArray(0).count(), 0)
+
+    def test_bulk_operations(self):
+        a, b = BitArray(12), BitArray(12)
+        for i in (1, 3, 5, 11):
+            a[i] = True
+        for i in (3, 4, 11):
+            b[i] = True
+        self.assertEqual([i for i, bit in enumerate(a & b) if bit], [3, 11])
+        self.assertEqual((a | b).count(), 5)
+        self.assertEqual([i for i, bit in enumerate(a ^ b) if bit], [1, 4, 5])
+        self.assertEqual((~a).count(), 8)
+        a |= b
+        self.assertEqual(a, BitArray(12) | a)
+        with self.assertRaises(ValueError):
+            a & BitArray(13)
+
+    def test_graph_visited_store(self):
+        graph = [[0, 1, 0], [0, 0, 1], [0, 0, 0]]
+        visited = BitArray(3)
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            bfs_adj_matrix(graph, 0, 3, visited)
+        self.assertEqual(out.getvalue().split(), ["0", "1", "2"])
+        self.assertEqual(visited.count(), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,185 @@
+import random
+import unittest
+from collections import OrderedDict
+
+from playground.dsa.caches import ARCCache, LFUCache, LRUCache, memoize
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_matches_ordered_dict(self):
+        """Test random gets and puts against an OrderedDict model."""
+        rng = random.Random(1)
+        cache, model = LRUCache(capacity=8), OrderedDict()
+        for step in range(3000):
+            key = rng.randrange(20)
+            if rng.random() < 0.5:
+                expected = model.get(key)
+                if key in model:
+                    model.move_to_end(key, last=False)
+                self.assertEqual(cache.get(key), expected)
+            else:
+                cache.put(key, step)
+                model[key] = step
+                model.move_to_end(key, last=False)
+                if len(model) > 8:
+                    model.popitem()
+        self.assertEqual(list(cache), list(model))
+        stats = cache.stats()
+        self.assertEqual(stats["hits"] + stats["misses"], cache.hits + cache.misses)
+        self.assertGreater(stats["evictions"], 0)
+
+    def test_cost_based_eviction(self):
+        """Test that eviction keeps the total cost within the capacity."""
+        cache = LRUCache(capacity=10, weigher=lambda key, value: len(value))
+        cache.put("a", "xxxx")
+        cache.put("b", "xxxx")
+        self.assertTrue(cache.put("c", "xxx"))  # Evicts "a"
+        self.assertEqual((list(cache), cache.cost), (["c", "b"], 7))
+        self.assertFalse(cache.put("b", "x" * 11))  # Too big; drops the old "b"
+        self.assertNotIn("b", cache)
+        cache.put("d", "ignored", cost=7)
+        self.assertEqual(
+            (list(cache), cache.cost, cache.evictions), (["d", "c"], 10, 1)
+        )
+        cache.remove("d")
+        cache.clear()
+        self.assertEqual((len(cache), cache.cost), (0, 0))
+        with self.assertRaises(ValueError):
+            LRUCache(capacity=0)
+
+
+class TestFloatCosts(unittest.TestCase):
+    def test_rounding_never_evicts_from_empty(self):
+        """Test that float cost rounding cannot make put() evict from an empty cache."""
+        for cache_type in (LRUCache, LFUCache):
+            cache = cache_type(capacity=1.0)
+            for key, cost in enumerate([0.1, 0.1, 0.1, 0.3]):
+                cache.put(key, key, cost=cost)
+            self.assertTrue(cache.put("big", "big", cost=1.0))
+            self.assertEqual((list(cache._map), cache.cost), (["big"], 1.0))
+            cache.remove("big")
+            self.assertEqual(cache.cost, 0)
+            for key in range(3):
+                cache.put(key, key, cost=0.1)
+            for key in range(3):
+                cache.remove(key)
+            self.assertEqual(cache.cost, 0)
+
+
+class TestLFUCache(unittest.TestCase):
+    def test_evicts_least_frequent_then_least_recent(self):
+        """Test LFU order with LRU tie-breaking."""
+        cache = LFUCache(capacity=3)
+        for key in "abc":
+            cache.put(key, key)
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+        cache.put("d", "d")  # "c" was used least
+        self.assertNotIn("c", cache)
+        cache.get("d")
+        cache.put("e", "e")  # "b" and "d" tie at 2; "b" is older
+        self.assertEqual(sorted(cache._map), ["a", "d", "e"])
+        self.assertEqual(cache.frequency("a"), 3)
+        cache.put("a", "A")  # Updating counts as an access
+        self.assertEqual((cache.get("a"), cache.frequency("a")), ("A", 5))
+
+    def test_matches_reference(self):
+        """Test random operations against a scanning reference model."""
+        rng = random.Random(6)
+        cache, model, clock = LFUCache(capacity=5, weigher=lambda k, v: v), {}, 0
+        for _ in range(3000):
+            key, clock = rng.randrange(12), clock + 1
+            if rng.random() < 0.5:
+                self.assertEqual(
+                    cache.get(key), model[key][0] if key in model else None
+                )
+                if key in model:
+                    value, freq, _ = model[key]
+                    model[key] = (value, freq + 1, clock)
+            elif rng.random() < 0.1:
+                cache.remove(key)
+                model.pop(key, None)
+            else:
+                cost = rng.randint(1, 3)
+                freq = model.pop(key)[1] + 1 if key in model else 1
+                while sum(entry[0] for entry in model.values()) + cost > 5:
+                    victim = min(model, key=lambda k: model[k][1:])
+                    del model[victim]
+                cache.put(key, cost)
+                model[key] = (cost, freq, clock)
+            self.assertEqual(sorted(cache._map), sorted(model))
+        self.assertEqual(cache.cost, sum(entry[0] for entry in model.values()))
+
+
+class TestARCCache(unittest.TestCase):
+    def test_invariants_and_adaptation(self):
+        """Test ARC's list-size invariants over a random workload."""
+        rng = random.Random(3)
+        cache = ARCCache(capacity=10)
+        for step in range(5000):
+            key = rng.randrange(10) if rng.random() < 0.6 else rng.randrange(100)
+            if cache.get(key) is None:
+                cache.put(key, step)
+            self.assertLessEqual(len(cache), 10)
+            self.assertLessEqual(len(cache._t1) + len(cache._b1), 10)
+            self.assertLessEqual(len(cache) + len(cache._b1) + len(cache._b2), 20)
+            self.assertTrue(0 <= cache.p <= 10)
+        self.assertEqual(len(cache._map), len(cache) + len(cache._b1) + len(cache._b2))
+        self.assertGreater(cache.hits, 0)
+
+    def test_scan_resistance(self):
+        """Test that a one-off scan does not flush frequently used entries."""
+        cache = ARCCache(capacity=4)
+        for _ in range(2):
+            for key in "ab":
+                if cache.get(key) is None:
+                    cache.put(key, key)
+        for key in range(100):
+            cache.put(key, key)
+        self.assertIn("a", cache)
+        self.assertIn("b", cache)
+        cache.put("a", "A")
+        self.assertEqual(cache.get("a"), "A")
+        cache.remove("a")
+        cache.clear()
+        self.assertEqual((len(cache), len(cache._map)), (0, 0))
+        with self.assertRaises(ValueError):
+            ARCCache(capacity=0)
+        with self.assertRaises(TypeError):
+            ARCCache(capacity=2.5)
+
+
+class TestMemoize(unittest.TestCase):
+    def test_memoize(self):
+        """Test bare and parameterized use of the decorator."""
+        calls = []
+
+        @memoize
+        def square(n, offset=0):
+            calls.append(n)
+            return None if n < 0 else n * n + offset
+
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(3), 9)
+        self.assertIsNone(square(-1))
+        self.assertIsNone(square(-1))  # A cached None is a hit
+        self.assertEqual(square(3, offset=1), 10)
+        self.assertEqual(calls, [3, -1, 3])
+        square.cache_clear()
+        square(3)
+        self.assertEqual(len(calls), 4)
+
+        @memoize(cache=LFUCache(capacity=2), key=lambda n: n % 10)
+        def last_digit(n):
+            return n % 10
+
+        for n in range(100):
+            last_digit(n)
+        self.assertEqual(len(last_digit.cache), 2)
+        self.assertEqual(last_digit.cache.stats()["hits"], 0)
+        self.assertEqual(last_digit.__name__, "last_digit")
+
+
+if __name__ == "__main__":
+    unittest.main()
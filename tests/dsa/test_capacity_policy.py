@@ -0,0 +1,87 @@
+import unittest
+
+from playground.dsa.arrays import (
+    AdditivePolicy,
+    DynamicArray,
+    GeometricPolicy,
+    HysteresisPolicy,
+    NeverShrinkPolicy,
+    TypedDynamicArray,
+)
+
+
+class TestCapacityPolicy(unittest.TestCase):
+    def test_default_policy_matches_classic_behaviour(self):
+        """Test that the default policy doubles when full and halves below 25%."""
+        da = DynamicArray(initial_capacity=4)
+        self.assertIsInstance(da._policy, GeometricPolicy)
+        da.extend(range(4))
+        da.append(4)
+        self.assertEqual(da._capacity, 8)
+        for _ in range(4):
+            da.pop()
+        self.assertEqual(da._capacity, 4)
+        self.assertEqual(da.stats()["resizes"], 2)
+
+    def test_hysteresis_avoids_thrashing(self):
+        """Test that oscillating around a boundary does not reallocate each time."""
+        da = DynamicArray(initial_capacity=8, policy=HysteresisPolicy())
+        da.extend(range(8))
+        before = da.stats()["resizes"]
+        for _ in range(100):
+            da.append(0)
+            da.pop()
+        self.assertEqual(da.stats()["resizes"], before + 1)
+
+        for _ in range(5):
+            da.pop()
+        self.assertEqual(len(da), 3)
+        self.assertEqual(da._capacity, 6)
+
+    def test_additive_policy(self):
+        """Test growth by a fixed increment."""
+        da = DynamicArray(initial_capacity=4, policy=AdditivePolicy(increment=4))
+        da.extend(range(5))
+        self.assertEqual(da._capacity, 8)
+        da.extend(range(10))
+        self.assertEqual(da._capacity, 16)
+        for _ in range(12):
+            da.pop()
+        self.assertLessEqual(da._capacity, len(da) + 8)
+
+    def test_never_shrink_and_explicit_resizing(self):
+        """Test reserve(), shrink_to_fit() and the copy counters."""
+        da = DynamicArray(initial_capacity=2, policy=NeverShrinkPolicy())
+        da.reserve(100)
+        self.assertEqual(da._capacity, 100)
+        da.extend(range(100))
+        while len(da) > 3:
+            da.pop()
+        self.assertEqual(da._capacity, 100)
+        da.shrink_to_fit()
+        self.assertEqual(
+            da.stats(),
+            {"length": 3, "capacity": 3, "resizes": 2, "elements_copied": 3},
+        )
+        self.assertEqual(list(da), [0, 1, 2])
+
+    def test_policy_is_inherited_by_copies(self):
+        """Test that slices and typed arrays carry the policy along."""
+        policy = NeverShrinkPolicy()
+        ta = TypedDynamicArray("q", policy=policy)
+        ta.extend(range(5))
+        self.assertIs(ta[1:3]._policy, policy)
+        self.assertIs((ta + ta)._policy, policy)
+
+    def test_validation(self):
+        """Test that invalid policy parameters are rejected."""
+        with self.assertRaises(ValueError):
+            GeometricPolicy(factor=1.0)
+        with self.assertRaises(ValueError):
+            HysteresisPolicy(shrink_below=0.5, shrink_to=0.25)
+        with self.assertRaises(ValueError):
+            AdditivePolicy(increment=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import threading
+import time
+import unittest
+
+from playground.dsa.queues import ConcurrentLinkedQueue
+from playground.dsa.queues.concurrent_linked_queue import (
+    QueueClosedError,
+    QueueUnderflowError,
+)
+
+
+class TestConcurrentLinkedQueue(unittest.TestCase):
+    def test_fifo_and_batches(self):
+        """Test single-threaded FIFO order, batches and the QueueADT methods."""
+        queue = ConcurrentLinkedQueue()
+        self.assertTrue(queue.is_empty())
+        with self.assertRaises(QueueUnderflowError):
+            queue.dequeue()
+        with self.assertRaises(QueueUnderflowError):
+            queue.peek()
+        queue.put(1)
+        queue.put_many([2, 3, 4])
+        queue.put_many([])
+        queue.enqueue(5)
+        self.assertEqual((queue.size(), queue.peek()), (5, 1))
+        self.assertEqual(queue.get(), 1)
+        self.assertEqual(queue.get_many(3), [2, 3, 4])
+        self.assertEqual(queue.get_many(10), [5])
+        self.assertEqual(len(queue), 0)
+        with self.assertRaises(ValueError):
+            queue.get_many(0)
+
+    def test_timeout_and_close(self):
+        """Test timed gets and that close() drains, then fails."""
+        queue = ConcurrentLinkedQueue()
+        start = time.monotonic()
+        with self.assertRaises(QueueUnderflowError):
+            queue.get(timeout=0.05)
+        self.assertGreaterEqual(time.monotonic() - start, 0.04)
+
+        queue.put("left")
+        queue.close()
+        self.assertTrue(queue.closed)
+        with self.assertRaises(QueueClosedError):
+            queue.put("late")
+        with self.assertRaises(QueueClosedError):
+            queue.put_many(["late"])
+        self.assertEqual(queue.get(), "left")
+        with self.assertRaises(QueueClosedError):
+            queue.get()
+
+    def test_close_wakes_blocked_consumers(self):
+        """Test that close() releases consumers blocked without a timeout."""
+        queue = ConcurrentLinkedQueue()
+        outcomes = []
+
+        def consume():
+            try:
+                queue.get()
+            except QueueClosedError:
+                outcomes.append("closed")
+
+        threads = [threading.Thread(target=consume) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        queue.close()
+        for thread in threads:
+            thread.join(timeout=5)
+        self.assertEqual(outcomes, ["closed"] * 3)
+
+    def test_many_producers_and_consumers(self):
+        """Test that every item is delivered once, in order per producer."""
+        queue = ConcurrentLinkedQueue()
+        producers, per_producer = 4, 2000
+        received = [[] for _ in range(4)]
+
+        def produce(producer):
+            for start in range(0, per_producer, 50):
+                if start % 100:
+                    queue.put_many((producer, i) for i in range(start, start + 50))
+                else:
+                    for i in range(start, start + 50):
+                        queue.put((producer, i))
+
+        def consume(out):
+            while True:
+                try:
+                    out.extend(queue.get_many(32, timeout=5))
+                except QueueClosedError:
+                    return
+
+        consumers = [threading.Thread(target=consume, args=(out,)) for out in received]
+        workers = [
+            threading.Thread(target=produce, args=(p,)) for p in range(producers)
+        ]
+        for thread in consumers + workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        queue.close()
+        for thread in consumers:
+            thread.join()
+
+        items = [item for out in received for item in out]
+        self.assertEqual(len(items), producers * per_producer)
+        self.assertEqual(len(set(items)), len(items))
+        for out in received:
+            for producer in range(producers):
+                sequence = [i for p, i in out if p == producer]
+                self.assertEqual(sequence, sorted(sequence))
+        self.assertEqual(len(queue), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
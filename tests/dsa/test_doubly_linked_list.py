@@ -0,0 +1,102 @@
+import unittest
+
+from playground.dsa.linked_list import DoublyLinkedList, DoublyNode, NodePool
+from playground.dsa.linked_list.singly_linked_list import (
+    EmptyListError,
+    OutOfBoundsError,
+)
+
+
+class TestDoublyLinkedList(unittest.TestCase):
+    def test_empty_list(self):
+        """Test operations on an empty list."""
+        dll = DoublyLinkedList()
+        self.assertTrue(dll.empty())
+        self.assertEqual(len(dll), 0)
+        self.assertIsNone(dll.front())
+        self.assertIsNone(dll.back())
+        self.assertIsNone(dll.head)
+        with self.assertRaises(EmptyListError):
+            dll.pop_front()
+        with self.assertRaises(EmptyListError):
+            dll.pop_back()
+        with self.assertRaises(OutOfBoundsError):
+            dll.value_at(0)
+        with self.assertRaises(OutOfBoundsError):
+            dll.erase(0)
+
+    def test_both_ends(self):
+        """Test pushing and popping at both ends."""
+        dll = DoublyLinkedList()
+        dll.push_back(2)
+        dll.push_front(1)
+        dll.push_back(3)
+        self.assertEqual(list(dll), [1, 2, 3])
+        self.assertEqual(list(reversed(dll)), [3, 2, 1])
+        self.assertEqual((dll.front(), dll.back()), (1, 3))
+        self.assertEqual(dll.pop_back(), 3)
+        self.assertEqual(dll.pop_front(), 1)
+        self.assertEqual(list(dll), [2])
+        self.assertEqual(dll.size(), 1)
+
+    def test_node_handles(self):
+        """Test O(1) removal and insertion around a node handle."""
+        dll = DoublyLinkedList([1, 2, 3])
+        handle = dll.push_back(4)
+        dll.insert_before(handle, 3.5)
+        dll.insert_after(handle, 5)
+        self.assertEqual(dll.remove_node(handle), 4)
+        self.assertEqual(list(dll), [1, 2, 3, 3.5, 5])
+        with self.assertRaises(ValueError):
+            dll.remove_node(handle)
+
+    def test_move_nodes(self):
+        """Test moving a node to either end without reallocating it."""
+        dll = DoublyLinkedList()
+        first, middle, last = (dll.push_back(value) for value in (1, 2, 3))
+        dll.move_to_front(middle)
+        self.assertEqual(list(dll), [2, 1, 3])
+        dll.move_to_back(middle)
+        dll.move_to_back(middle)
+        dll.move_to_front(first)
+        self.assertEqual(list(dll), [1, 3, 2])
+        self.assertEqual(list(reversed(dll)), [2, 3, 1])
+        self.assertIs(dll.tail, middle)
+        self.assertEqual(len(dll), 3)
+        dll.remove_node(last)
+        with self.assertRaises(ValueError):
+            dll.move_to_front(last)
+
+    def test_linked_list_api(self):
+        """Test the operations shared with LinkedList."""
+        dll = DoublyLinkedList([10, 20, 30, 40, 50])
+        self.assertEqual(dll.value_at(1), 20)
+        self.assertEqual(dll.value_at(4), 50)
+        dll.insert(2, 25)
+        dll.insert(6, 60)
+        dll.erase(0)
+        self.assertEqual(list(dll), [20, 25, 30, 40, 50, 60])
+        self.assertEqual(dll.value_n_from_end(2), 50)
+        dll.remove_value(30)
+        dll.remove_value(99)
+        dll.reverse()
+        self.assertEqual(list(dll), [60, 50, 40, 25, 20])
+        self.assertEqual(list(reversed(dll)), [20, 25, 40, 50, 60])
+        dll.push_back(10)
+        self.assertEqual(dll.back(), 10)
+        self.assertEqual(repr(dll), "DoublyLinkedList([60, 50, 40, 25, 20, 10])")
+        self.assertEqual(str(DoublyLinkedList([1, 2])), "1 <=> 2")
+
+    def test_pool_node_type(self):
+        """Test that a pool must recycle DoublyNodes."""
+        pool = NodePool(node_type=DoublyNode)
+        dll = DoublyLinkedList([1, 2], pool=pool)
+        dll.pop_front()
+        dll.push_back(3)
+        self.assertEqual(list(dll), [2, 3])
+        with self.assertRaises(TypeError):
+            DoublyLinkedList(pool=NodePool())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import random
+import unittest
+
+from playground.dsa.arrays import GapBuffer
+
+
+class TestGapBuffer(unittest.TestCase):
+    def test_cursor_edits(self):
+        """Test inserting and deleting around a moving cursor."""
+        gb = GapBuffer(initial_capacity=4)
+        gb.insert_many("hello world")
+        self.assertEqual(gb.cursor, 11)
+        gb.move_cursor(5)
+        gb.insert_at_cursor(",")
+        self.assertEqual(gb.delete_at_cursor(), [" "])
+        gb.insert_many(" there ")
+        self.assertEqual("".join(gb), "hello, there world")
+        self.assertEqual(gb.cursor, 13)
+        gb.move_cursor(0)
+        self.assertEqual(gb.delete_at_cursor(7), list("hello, "))
+        self.assertEqual("".join(gb), "there world")
+
+        with self.assertRaises(IndexError):
+            gb.move_cursor(len(gb) + 1)
+        gb.move_cursor(len(gb))
+        with self.assertRaises(IndexError):
+            gb.delete_at_cursor()
+
+    def test_move_cost_is_distance(self):
+        """Test that moving the cursor only touches the elements passed over."""
+        gb = GapBuffer()
+        gb.insert_many(range(1000))
+        gb.move_cursor(990)
+        writes = []
+
+        class Recorder(list):
+            def __setitem__(self, index, value):
+                writes.append(index)
+                super().__setitem__(index, value)
+
+        gb._A = Recorder(gb._A)
+        gb.move_cursor(980)
+        moved = sum(
+            len(range(*w.indices(len(gb._A)))) for w in writes if isinstance(w, slice)
+        )
+        self.assertLessEqual(moved, 20)
+        self.assertEqual(list(gb), list(range(1000)))
+
+    def test_sequence_api(self):
+        """Test the DynamicArray-style API against a Python list."""
+        rng = random.Random(3)
+        gb, expected = GapBuffer(initial_capacity=1), []
+        for step in range(500):
+            if expected and rng.random() < 0.3:
+                index = rng.randrange(len(expected))
+                self.assertEqual(gb.pop(index), expected.pop(index))
+            else:
+                index = rng.randrange(len(expected) + 1)
+                gb.insert(index, step)
+                expected.insert(index, step)
+        self.assertEqual(list(gb), expected)
+        self.assertEqual([gb[i] for i in range(len(gb))], expected)
+        self.assertIn(expected[0], gb)
+        self.assertNotIn(-1, gb)
+        self.assertTrue(
+            all(slot is None for slot in gb._A[gb._gap_start : gb._gap_end])
+        )
+
+    def test_append_extend_add(self):
+        """Test appending, extending, slicing and concatenating."""
+        gb = GapBuffer()
+        gb.append(1)
+        gb.extend([2, 3])
+        gb[0] = 0
+        self.assertEqual(repr(gb), "[0, 2, 3]")
+        self.assertEqual(list(gb[1:]), [2, 3])
+        self.assertEqual(list(gb + gb), [0, 2, 3, 0, 2, 3])
+        with self.assertRaises(TypeError):
+            gb + [4]
+        gb.clear()
+        self.assertEqual(len(gb), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import random
+import unittest
+
+from playground.dsa.linked_list import LinkedList
+from playground.dsa.linked_list.singly_linked_list import OutOfBoundsError
+
+
+class TestLinkedListCursor(unittest.TestCase):
+    def test_walk_and_edit(self):
+        """Test advancing and editing around the cursor."""
+        ll = LinkedList()
+        cursor = ll.cursor()
+        self.assertEqual(cursor.index, -1)
+        self.assertFalse(cursor.has_next())
+        with self.assertRaises(OutOfBoundsError):
+            _ = cursor.value
+        with self.assertRaises(OutOfBoundsError):
+            cursor.erase_next()
+
+        cursor.insert_after(1)  # Inserts at the front
+        cursor.advance()
+        cursor.insert_after(3)
+        cursor.insert_after(2)
+        self.assertEqual(list(ll), [1, 2, 3])
+        self.assertEqual(ll.back(), 3)
+        cursor.advance(2)
+        self.assertEqual((cursor.index, cursor.value), (2, 3))
+        cursor.insert_after(4)
+        self.assertEqual(ll.back(), 4)
+        with self.assertRaises(OutOfBoundsError):
+            cursor.advance(2)
+
+        cursor = ll.cursor().advance()
+        self.assertEqual(cursor.erase_next(), 2)
+        cursor.value = 10
+        self.assertEqual(list(ll), [10, 3, 4])
+        cursor.advance()
+        self.assertEqual(cursor.erase_next(), 4)
+        self.assertEqual((len(ll), ll.back()), (2, 3))
+        ll.push_back(5)
+        self.assertEqual(list(ll), [10, 3, 5])
+
+    def test_splice_and_split_here(self):
+        """Test moving whole lists in and out at the cursor."""
+        ll = LinkedList()
+        for value in (1, 5):
+            ll.push_back(value)
+        middle = LinkedList()
+        for value in (2, 3, 4):
+            middle.push_back(value)
+
+        cursor = ll.cursor().advance()
+        cursor.splice(middle)
+        self.assertEqual(list(ll), [1, 2, 3, 4, 5])
+        self.assertEqual((len(middle), middle.front(), middle.back()), (0, None, None))
+        with self.assertRaises(ValueError):
+            cursor.splice(ll)
+
+        cursor.advance(2)
+        rest = cursor.split_here()
+        self.assertEqual((list(ll), len(ll), ll.back()), ([1, 2, 3], 3, 3))
+        self.assertEqual((list(rest), len(rest), rest.back()), ([4, 5], 2, 5))
+        self.assertEqual(len(cursor.split_here()), 0)
+
+        everything = ll.cursor().split_here()
+        self.assertEqual((list(everything), len(ll), ll.back()), ([1, 2, 3], 0, None))
+        ll.cursor().splice(everything)
+        ll.push_back(4)
+        self.assertEqual(list(ll), [1, 2, 3, 4])
+
+    def test_single_pass_edits_match_list(self):
+        """Test a random forward pass of cursor edits against a plain list."""
+        rng = random.Random(3)
+        ll = LinkedList()
+        for value in range(200):
+            ll.push_back(value)
+        expected = list(range(200))
+        cursor, position = ll.cursor(), -1
+        while cursor.has_next():
+            op = rng.random()
+            if op < 0.3:
+                self.assertEqual(cursor.erase_next(), expected.pop(position + 1))
+            elif op < 0.5:
+                cursor.insert_after(-position)
+                expected.insert(position + 1, -position)
+                cursor.advance()
+                position += 1
+            else:
+                cursor.advance()
+                position += 1
+            self.assertEqual(cursor.index, position)
+        self.assertEqual(list(ll), expected)
+        self.assertEqual((len(ll), ll.back()), (len(expected), expected[-1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
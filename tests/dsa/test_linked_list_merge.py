@@ -0,0 +1,64 @@
+import itertools
+import random
+import unittest
+
+from playground.dsa.linked_list import LinkedList, merge_sorted
+
+
+class TestLinkedListSort(unittest.TestCase):
+    def test_sort_matches_sorted(self):
+        """Test sorting lists of many lengths against sorted()."""
+        rng = random.Random(4)
+        for length in [0, 1, 2, 3, 7, 8, 9, 100, 1025]:
+            values = [rng.randrange(50) for _ in range(length)]
+            ll = LinkedList.from_iterable(values)
+            ll.sort()
+            self.assertEqual(list(ll), sorted(values))
+            self.assertEqual(len(ll), length)
+            self.assertEqual(ll.back(), max(values) if values else None)
+            ll.push_back(-1)  # The tail is still correct
+            self.assertEqual(ll.value_n_from_end(1), -1)
+
+    def test_sort_is_stable_in_place(self):
+        """Test stability, key, reverse and that nodes are relinked, not copied."""
+        pairs = [(3, "a"), (1, "b"), (3, "c"), (2, "d"), (1, "e")]
+        ll = LinkedList.from_iterable(pairs)
+        nodes = set()
+        current = ll.head
+        while current:
+            nodes.add(id(current))
+            current = current.next_node
+        ll.sort(key=lambda pair: pair[0])
+        self.assertEqual(list(ll), sorted(pairs, key=lambda pair: pair[0]))
+        current = ll.head
+        while current:
+            self.assertIn(id(current), nodes)
+            current = current.next_node
+        ll.sort(key=lambda pair: pair[0], reverse=True)
+        self.assertEqual(
+            list(ll), sorted(pairs, key=lambda pair: pair[0], reverse=True)
+        )
+
+
+class TestMergeSorted(unittest.TestCase):
+    def test_merge_sorted(self):
+        """Test a stable k-way merge that empties its inputs."""
+        rng = random.Random(8)
+        runs = [sorted(rng.randrange(20) for _ in range(n)) for n in (0, 5, 9, 1, 30)]
+        lists = [LinkedList.from_iterable(run) for run in runs]
+        merged = merge_sorted(lists)
+        values = list(itertools.chain.from_iterable(runs))
+        self.assertEqual(list(merged), sorted(values))
+        self.assertEqual(len(merged), 45)
+        self.assertEqual(merged.back(), max(values))
+        self.assertTrue(all(ll.empty() and ll.back() is None for ll in lists))
+        self.assertTrue(merge_sorted([]).empty())
+
+        first = LinkedList.from_iterable([(1, "a"), (2, "a")])
+        second = LinkedList.from_iterable([(1, "b"), (2, "b")])
+        merged = merge_sorted([first, second], key=lambda pair: pair[0])
+        self.assertEqual(list(merged), [(1, "a"), (1, "b"), (2, "a"), (2, "b")])
+
+
+if __name__ == "__main__":
+    unittest.main()
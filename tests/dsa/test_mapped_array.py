@@ -0,0 +1,85 @@
+import os
+import tempfile
+import unittest
+
+from playground.dsa.arrays import MappedDynamicArray, TypedDynamicArray
+
+
+class TestMappedDynamicArray(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmpdir.name, "array.bin")
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def test_append_grows_file(self):
+        """Test that appending past capacity extends the backing file."""
+        with MappedDynamicArray(self.path, "q", initial_capacity=2) as ma:
+            for i in range(5):
+                ma.append(i)
+            self.assertEqual(len(ma), 5)
+            self.assertEqual(ma._capacity, 8)
+            self.assertEqual(ma.tolist(), [0, 1, 2, 3, 4])
+        header = MappedDynamicArray._HEADER.size
+        self.assertEqual(os.path.getsize(self.path), header + 8 * 8)
+
+    def test_reopen(self):
+        """Test that reopening the file restores typecode, length and records."""
+        with MappedDynamicArray(self.path, "d", initial_capacity=4) as ma:
+            ma.extend([0.5, 1.5, 2.5])
+            ma.insert(0, -0.5)
+            self.assertEqual(ma.pop(1), 0.5)
+
+        with MappedDynamicArray(self.path) as ma:
+            self.assertEqual(ma.typecode, "d")
+            self.assertEqual(ma.tolist(), [-0.5, 1.5, 2.5])
+            self.assertEqual(ma[2], 2.5)
+            ma[2] = 3.5
+            self.assertIn(3.5, ma)
+
+        with self.assertRaises(ValueError):
+            MappedDynamicArray(self.path, "q")
+
+    def test_live_export_blocks_resize(self):
+        """Test that a resize or close with a live view fails and keeps the array usable."""
+        with MappedDynamicArray(self.path, "q", initial_capacity=2) as ma:
+            ma.extend([1, 2])
+            view = ma.buffer()
+            with self.assertRaises(BufferError):
+                ma.append(3)
+            with self.assertRaises(BufferError):
+                ma.close()
+            self.assertEqual((ma.tolist(), ma._capacity), ([1, 2], 2))
+            ma[0] = 5
+            self.assertEqual(view.tolist(), [5, 2])
+            view.release()
+            ma.append(3)
+            self.assertEqual(ma.tolist(), [5, 2, 3])
+        with MappedDynamicArray(self.path) as ma:
+            self.assertEqual(ma.tolist(), [5, 2, 3])
+
+    def test_rejects_foreign_file(self):
+        """Test that a file without the header magic is rejected."""
+        with open(self.path, "wb") as f:
+            f.write(b"\0" * 64)
+        with self.assertRaises(ValueError):
+            MappedDynamicArray(self.path)
+
+    def test_slices_and_concat(self):
+        """Test that slices and concatenation produce in-memory typed arrays."""
+        with MappedDynamicArray(self.path, "i") as ma:
+            ma.extend(range(6))
+            ma[1:3] = [10, 20, 30]
+            self.assertEqual(ma.tolist(), [0, 10, 20, 30, 3, 4, 5])
+            part = ma[2:4]
+            self.assertIsInstance(part, TypedDynamicArray)
+            self.assertNotIsInstance(part, MappedDynamicArray)
+            self.assertEqual(part.tolist(), [20, 30])
+            self.assertEqual((part + ma).tolist()[:3], [20, 30, 0])
+            ma.clear()
+            self.assertEqual(len(ma), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from playground.dsa.linked_list import (
+    DoublyLinkedList,
+    DoublyNode,
+    LinkedList,
+    Node,
+    NodePool,
+)
+
+
+class TestNodePool(unittest.TestCase):
+    def test_nodes_are_slotted(self):
+        """Test that nodes carry no per-instance __dict__."""
+        self.assertFalse(hasattr(Node(1), "__dict__"))
+        self.assertFalse(hasattr(DoublyNode(1), "__dict__"))
+
+    def test_linked_list_recycles_nodes(self):
+        """Test that removed nodes are reused by later inserts."""
+        pool = NodePool(max_size=2)
+        ll = LinkedList(pool=pool)
+        for i in range(4):
+            ll.push_front(i)
+        ll.pop_front()
+        ll.erase(1)
+        ll.remove_value(0)
+        self.assertEqual(list(ll), [2])
+        self.assertEqual(len(pool), 2)
+        self.assertEqual(pool.discarded, 1)
+
+        ll.push_back(5)
+        ll.insert(1, 4)
+        self.assertEqual(list(ll), [2, 4, 5])
+        stats = pool.stats()
+        self.assertEqual((stats["allocated"], stats["reused"]), (4, 2))
+        self.assertEqual(stats["free"], 0)
+
+    def test_released_nodes_drop_references(self):
+        """Test that pooled nodes do not keep data alive."""
+        pool = NodePool()
+        ll = LinkedList(pool=pool)
+        ll.push_front(object())
+        ll.pop_back()
+        self.assertIsNone(pool._free[0].data)
+        self.assertIsNone(pool._free[0].next_node)
+
+    def test_doubly_linked_list_pool(self):
+        """Test pooling with DoublyNode."""
+        pool = NodePool(node_type=DoublyNode)
+        dll = DoublyLinkedList([1, 2, 3], pool=pool)
+        dll.pop_front()
+        dll.pop_back()
+        dll.push_front(0)
+        self.assertEqual(list(dll), [0, 2])
+        self.assertEqual((pool.allocated, pool.reused, len(pool)), (3, 1, 1))
+        with self.assertRaises(ValueError):
+            NodePool(max_size=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
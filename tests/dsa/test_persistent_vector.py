@@ -0,0 +1,74 @@
+import unittest
+
+from playground.dsa.arrays import DynamicArray, PersistentVector
+
+
+class TestPersistentVector(unittest.TestCase):
+    def test_append_keeps_old_versions(self):
+        """Test that every append returns a new version and leaves the old one intact."""
+        versions = [PersistentVector()]
+        for i in range(2000):
+            versions.append(versions[-1].append(i))
+        for size in (0, 1, 31, 32, 33, 1024, 1025, 2000):
+            self.assertEqual(len(versions[size]), size)
+            self.assertEqual(list(versions[size]), list(range(size)))
+        self.assertEqual(versions[2000][1500], 1500)
+        with self.assertRaises(IndexError):
+            versions[10][10]
+
+    def test_set_shares_structure(self):
+        """Test that set copies only the path to the changed element."""
+        v1 = PersistentVector(range(5000))
+        v2 = v1.set(100, "x")
+        self.assertEqual(v1[100], 100)
+        self.assertEqual(v2[100], "x")
+        self.assertIs(v1._root.children[1], v2._root.children[1])
+        self.assertIsNot(v1._root.children[0], v2._root.children[0])
+        self.assertEqual(v2.set(4999, "y")[4999], "y")
+        self.assertEqual(v2[4999], 4999)
+
+    def test_pop(self):
+        """Test popping back through tail, leaf and root-level boundaries."""
+        size = 32 * 32 + 40
+        vector = PersistentVector(range(size))
+        original = vector
+        for expected in range(size - 1, -1, -1):
+            self.assertEqual(vector[len(vector) - 1], expected)
+            vector = vector.pop()
+        self.assertEqual(len(vector), 0)
+        self.assertEqual(list(original), list(range(size)))
+        with self.assertRaises(IndexError):
+            vector.pop()
+
+    def test_transient(self):
+        """Test batch edits through a transient and freezing it back."""
+        base = PersistentVector(range(100))
+        transient = base.transient()
+        transient.extend(range(100, 1100)).set(0, "a").set(1050, "b").pop()
+        frozen = transient.persistent()
+        self.assertEqual(len(frozen), 1099)
+        self.assertEqual(frozen[0], "a")
+        self.assertEqual(frozen[1050], "b")
+        self.assertEqual(list(base), list(range(100)))
+        with self.assertRaises(RuntimeError):
+            transient.append(1)
+
+        again = frozen.transient().set(0, "c").persistent()
+        self.assertEqual(frozen[0], "a")
+        self.assertEqual(again[0], "c")
+
+    def test_dynamic_array_conversion(self):
+        """Test conversion to and from DynamicArray."""
+        da = DynamicArray()
+        da.extend(range(50))
+        vector = PersistentVector.from_dynamic_array(da)
+        self.assertEqual(vector, PersistentVector(range(50)))
+        back = vector.to_dynamic_array()
+        self.assertIsInstance(back, DynamicArray)
+        self.assertEqual(list(back), list(range(50)))
+        self.assertIn(49, vector)
+        self.assertEqual(repr(PersistentVector([1, 2])), "PersistentVector([1, 2])")
+
+
+if __name__ == "__main__":
+    unittest.main()
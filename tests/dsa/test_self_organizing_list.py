@@ -0,0 +1,109 @@
+import random
+import unittest
+
+from playground.dsa.linked_list import (
+    CountedNode,
+    LinkedList,
+    NodePool,
+    SelfOrganizingList,
+)
+from playground.dsa.linked_list.singly_linked_list import Node, OutOfBoundsError
+
+
+class TestSelfOrganizingList(unittest.TestCase):
+    def test_policies_reorder(self):
+        """Test how each policy moves the item found."""
+        sol = SelfOrganizingList([1, 2, 3, 4])
+        self.assertEqual(sol.find(3), 3)
+        self.assertEqual(list(sol), [3, 1, 2, 4])
+        self.assertEqual(sol.find(4), 4)
+        self.assertEqual((list(sol), sol.back()), ([4, 3, 1, 2], 2))
+        self.assertIsNone(sol.find(9))
+        self.assertEqual(sol.stats()["probes"], 3 + 4 + 4)
+
+        sol = SelfOrganizingList([1, 2, 3, 4], policy="transpose")
+        sol.find(3)
+        sol.find(3)
+        sol.find(3)
+        self.assertEqual(list(sol), [3, 1, 2, 4])
+        self.assertEqual(sol.average_probe_length(), (3 + 2 + 1) / 3)
+
+        sol = SelfOrganizingList([1, 2, 3, 4], policy="count")
+        for target in [4, 4, 3, 2, 3, 4]:
+            sol.find(target)
+        self.assertEqual(list(sol), [4, 3, 2, 1])
+        sol.find(1)
+        sol.find(2)
+        self.assertEqual((list(sol), sol.back()), ([4, 3, 2, 1], 1))
+        sol.find(1)  # Ties with 3 and 2, so it stays behind them
+        self.assertEqual(list(sol), [4, 3, 2, 1])
+        sol.find(1)
+        self.assertEqual((list(sol), sol.back()), ([4, 1, 3, 2], 2))
+        with self.assertRaises(ValueError):
+            SelfOrganizingList(policy="random")
+
+    def test_lookup_table(self):
+        """Test a key function, membership and a node pool."""
+        pool = NodePool(node_type=CountedNode)
+        table = SelfOrganizingList(
+            [("a", 1), ("b", 2)], key=lambda item: item[0], pool=pool
+        )
+        self.assertEqual(table.find("b"), ("b", 2))
+        self.assertIn("a", table)
+        self.assertNotIn("z", table)
+        self.assertEqual(table.front(), ("a", 1))
+        table.pop_front()
+        self.assertEqual(len(pool), 1)
+        table.reset_stats()
+        self.assertEqual(table.stats()["searches"], 0)
+        with self.assertRaises(ValueError):
+            SelfOrganizingList(pool=NodePool())
+
+    def test_foreign_nodes_and_split(self):
+        """Test concat, splice and split_at with plain lists and nodes."""
+        for policy in ("move_to_front", "transpose"):
+            sol = SelfOrganizingList([1, 2], policy=policy)
+            sol.head.next_node.next_node = Node(3)  # Relinked by hand
+            self.assertEqual(sol.find(3), 3)  # Only "count" reads the counts
+        for policy in ("move_to_front", "transpose", "count"):
+            sol = SelfOrganizingList([1, 4], policy=policy)
+            plain = LinkedList.from_iterable([5, 6])
+            sol.concat(plain)
+            sol.splice(1, LinkedList.from_iterable([2, 3]))
+            sol.splice(0, SelfOrganizingList([0]))
+            self.assertEqual((list(sol), len(plain)), ([0, 1, 2, 3, 4, 5, 6], 0))
+            with self.assertRaises(OutOfBoundsError):
+                sol.splice(9, plain)
+            for target in [6, 5, 6]:
+                self.assertEqual(sol.find(target), target)
+
+        sol = SelfOrganizingList(range(6), policy="count", key=lambda n: -n)
+        front, back = sol.split_at(2)
+        self.assertEqual((list(front), list(back), len(sol)), ([0, 1], [2, 3, 4, 5], 0))
+        for half in (front, back):
+            self.assertIsInstance(half, SelfOrganizingList)
+            self.assertEqual(half.policy, "count")
+        self.assertEqual(back.find(-5), 5)
+        self.assertEqual(list(back), [5, 2, 3, 4])
+        self.assertEqual(back.back(), 4)
+        front, back = front.split_at(2)
+        self.assertEqual((list(front), len(back), back.policy), ([0, 1], 0, "count"))
+
+    def test_skewed_access_cuts_probes(self):
+        """Test that Zipf lookups probe far fewer nodes than a static scan."""
+        rng = random.Random(0)
+        items = rng.sample(range(500), 500)
+        weights = [1 / rank**1.5 for rank in range(1, 501)]
+        lookups = rng.choices(range(500), weights, k=5000)
+        static = sum(items.index(target) + 1 for target in lookups) / len(lookups)
+        for policy in ("move_to_front", "count"):
+            sol = SelfOrganizingList(items, policy=policy)
+            for target in lookups:
+                self.assertEqual(sol.find(target), target)
+            self.assertLess(sol.average_probe_length() * 5, static)
+            self.assertEqual(sorted(sol), sorted(items))
+            self.assertEqual(len(sol), 500)
+
+
+if __name__ == "__main__":
+    unittest.main()
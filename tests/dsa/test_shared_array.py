@@ -0,0 +1,88 @@
+import multiprocessing
+import pickle
+import unittest
+
+from playground.dsa.arrays import SharedDynamicArray, TypedDynamicArray
+from playground.dsa.arrays.shared_array import ArrayOverflowError
+
+
+def total(array):
+    return sum(array)
+
+
+class TestSharedDynamicArray(unittest.TestCase):
+    def setUp(self):
+        self.array = SharedDynamicArray("q", initial_capacity=8)
+
+    def tearDown(self):
+        self.array.close()
+        self.array.unlink()
+
+    def test_fixed_capacity(self):
+        """Test that the array fills up to its fixed capacity and no further."""
+        self.array.extend(range(8))
+        self.assertEqual(self.array.tolist(), list(range(8)))
+        with self.assertRaises(ArrayOverflowError):
+            self.array.append(8)
+        with self.assertRaises(ArrayOverflowError):
+            self.array.extend([8, 9])
+        self.assertEqual(len(self.array), 8)
+        self.assertEqual(self.array.pop(0), 0)
+        self.assertEqual(self.array._capacity, 8)
+
+    def test_attach_shares_memory(self):
+        """Test that an attached array sees writes made through the creator."""
+        self.array.extend([1, 2, 3])
+        other = SharedDynamicArray.attach(self.array.name)
+        try:
+            self.assertEqual(other.tolist(), [1, 2, 3])
+            self.array.insert(0, 0)
+            self.assertEqual(other.tolist(), [0, 1, 2, 3])
+            other[3] = 30
+            self.assertEqual(self.array[3], 30)
+        finally:
+            other.close()
+
+    def test_pickle_sends_name(self):
+        """Test that pickling transfers a reference, not the elements."""
+        self.array.extend(range(8))
+        payload = pickle.dumps(self.array)
+        self.assertLess(len(payload), 200)
+        other = pickle.loads(payload)
+        try:
+            self.assertEqual(other.tolist(), list(range(8)))
+        finally:
+            other.close()
+
+    def test_seqlock(self):
+        """Test that every write leaves the sequence counter even and advanced."""
+        version = self.array.version
+        self.array.append(1)
+        self.assertEqual(self.array.version, version + 2)
+        with self.array.write():
+            self.assertEqual(self.array.version % 2, 1)
+            self.array.append(2)
+            self.array.append(3)
+        self.assertEqual(self.array.version, version + 4)
+        snapshot = self.array.snapshot()
+        self.assertIsInstance(snapshot, TypedDynamicArray)
+        self.assertEqual(snapshot.tolist(), [1, 2, 3])
+
+    def test_read_gives_up_on_stuck_writer(self):
+        """Test that a sequence left odd by a dead writer times out readers."""
+        self.array.append(1)
+        self.array._header[self.array._SEQUENCE] += 1  # A write that never ended
+        with self.assertRaises(TimeoutError):
+            self.array.read_consistent(total, timeout=0.05)
+        self.array._header[self.array._SEQUENCE] += 1
+        self.assertEqual(self.array.read_consistent(total), 1)
+
+    def test_pool_workers(self):
+        """Test that pool workers read the array after attaching by name."""
+        self.array.extend(range(8))
+        with multiprocessing.Pool(2) as pool:
+            self.assertEqual(pool.map(total, [self.array] * 3), [28] * 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
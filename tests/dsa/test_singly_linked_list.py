@@ -258,6 +258,56 @@ class TestLinkedList(unittest.TestCase):
         self.assertEqual(ll.value_at(0), 1)
         self.assertEqual(ll.value_at(1), 2)
         self.assertEqual(ll.value_at(2), 3)
+        self.assertEqual(ll.back(), 3)
+
+    def test_from_iterable_and_extend(self):
+        """Test bulk construction and appending."""
+        ll = LinkedList.from_iterable(range(3))
+        self.assertEqual((list(ll), len(ll), ll.back()), ([0, 1, 2], 3, 2))
+        ll.extend(iter([3, 4]))
+        ll.extend([])
+        ll.extend(ll)  # Extending with itself copies a snapshot
+        self.assertEqual(list(ll), [0, 1, 2, 3, 4] * 2)
+        self.assertEqual((len(ll), ll.back()), (10, 4))
+        empty = LinkedList()
+        empty.extend("ab")
+        self.assertEqual(
+            (list(empty), empty.front(), empty.back()), (["a", "b"], "a", "b")
+        )
+
+    def test_concat_and_splice(self):
+        """Test moving the nodes of one list into another."""
+        ll = LinkedList.from_iterable([1, 5])
+        other = LinkedList.from_iterable([6, 7])
+        ll.concat(other)
+        self.assertEqual((list(ll), len(ll), ll.back()), ([1, 5, 6, 7], 4, 7))
+        self.assertTrue(other.empty())
+        ll.splice(1, LinkedList.from_iterable([2, 3, 4]))
+        ll.splice(0, LinkedList.from_iterable([0]))
+        ll.splice(len(ll), LinkedList.from_iterable([8]))
+        ll.concat(LinkedList())
+        self.assertEqual(list(ll), list(range(9)))
+        self.assertEqual((len(ll), ll.back()), (9, 8))
+        with self.assertRaises(OutOfBoundsError):
+            ll.splice(10, LinkedList())
+        with self.assertRaises(ValueError):
+            ll.concat(ll)
+
+    def test_split_at(self):
+        """Test splitting a list into two lists that share its nodes."""
+        ll = LinkedList.from_iterable(range(5))
+        second = ll.head.next_node
+        front, back = ll.split_at(2)
+        self.assertTrue(ll.empty())
+        self.assertIs(front.head.next_node, second)
+        self.assertEqual((list(front), len(front), front.back()), ([0, 1], 2, 1))
+        self.assertEqual((list(back), len(back), back.back()), ([2, 3, 4], 3, 4))
+        front, back = back.split_at(0)
+        self.assertEqual((list(front), list(back)), ([], [2, 3, 4]))
+        front, back = back.split_at(3)
+        self.assertEqual((list(front), list(back), back.back()), ([2, 3, 4], [], None))
+        with self.assertRaises(OutOfBoundsError):
+            front.split_at(4)
 
 
 if __name__ == "__main__":
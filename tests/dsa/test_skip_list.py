@@ -0,0 +1,84 @@
+import bisect
+import random
+import unittest
+
+from playground.dsa.linked_list import SkipList
+from playground.dsa.linked_list.singly_linked_list import (
+    EmptyListError,
+    OutOfBoundsError,
+)
+
+
+class TestSkipList(unittest.TestCase):
+    def test_empty_list(self):
+        """Test operations on an empty list."""
+        sl = SkipList()
+        self.assertTrue(sl.empty())
+        self.assertIsNone(sl.front())
+        self.assertIsNone(sl.back())
+        with self.assertRaises(EmptyListError):
+            sl.pop_front()
+        with self.assertRaises(OutOfBoundsError):
+            sl.value_at(0)
+        with self.assertRaises(OutOfBoundsError):
+            sl.insert(1, 0)
+
+    def test_positional_operations_match_list(self):
+        """Test positional inserts and deletes against a plain list."""
+        rng = random.Random(11)
+        sl = SkipList(seed=11)
+        expected = []
+        for step in range(3000):
+            op = rng.random()
+            if op < 0.45:
+                i = rng.randint(0, len(expected))
+                sl.insert(i, step)
+                expected.insert(i, step)
+            elif op < 0.7 and expected:
+                i = rng.randrange(len(expected))
+                sl.erase(i)
+                del expected[i]
+            elif op < 0.75 and expected:
+                self.assertEqual(sl.pop_back(), expected.pop())
+            elif expected:
+                i = rng.randrange(len(expected))
+                self.assertEqual(sl.value_at(i), expected[i])
+        self.assertEqual(list(sl), expected)
+        self.assertEqual(sl.back(), expected[-1])
+        self.assertEqual(sl.value_n_from_end(2), expected[-2])
+        sl.reverse()
+        self.assertEqual(list(sl), expected[::-1])
+        sl.remove_value(expected[0])
+        self.assertEqual(len(sl), len(expected) - 1)
+
+    def test_ordered_set(self):
+        """Test the ordered-set mode against a sorted list."""
+        rng = random.Random(2)
+        sl = SkipList(ordered=True, seed=2)
+        expected = []
+        for _ in range(2000):
+            value = rng.randrange(500)
+            if rng.random() < 0.6:
+                sl.add(value)
+                if value not in expected:
+                    bisect.insort(expected, value)
+            else:
+                sl.discard(value)
+                if value in expected:
+                    expected.remove(value)
+        self.assertEqual(list(sl), expected)
+        for value in expected[::37]:
+            self.assertIn(value, sl)
+            self.assertEqual(sl.index(value), expected.index(value))
+            self.assertEqual(sl.value_at(sl.index(value)), value)
+        self.assertEqual(sl.bisect_left(250), bisect.bisect_left(expected, 250))
+        with self.assertRaises(ValueError):
+            sl.index(-1)
+        with self.assertRaises(TypeError):
+            sl.push_back(1)
+        with self.assertRaises(TypeError):
+            SkipList().add(1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import bisect
+import random
+import unittest
+
+from playground.algorithms.searches.binary_search import lower_bound, upper_bound
+from playground.dsa.arrays import SortedArray
+
+
+class TestSortedArray(unittest.TestCase):
+    def test_bounds(self):
+        a = [1, 2, 2, 2, 5]
+        for k in range(7):
+            self.assertEqual(lower_bound(a, k), bisect.bisect_left(a, k))
+            self.assertEqual(upper_bound(a, k), bisect.bisect_right(a, k))
+
+    def test_add_discard_and_queries(self):
+        sa = SortedArray([5, 1, 3])
+        sa.add(2)
+        sa.add(3)
+        self.assertEqual(list(sa), [1, 2, 3, 3, 5])
+        self.assertEqual(sa.index(3), 2)
+        self.assertEqual((sa.bisect_left(3), sa.bisect_right(3)), (2, 4))
+        self.assertEqual(sa.count(3), 2)
+        self.assertIn(5, sa)
+        self.assertNotIn(4, sa)
+        sa.discard(4)
+        sa.remove(3)
+        self.assertEqual(list(sa), [1, 2, 3, 5])
+        with self.assertRaises(ValueError):
+            sa.remove(4)
+        with self.assertRaises(ValueError):
+            sa.index(4)
+        with self.assertRaises(IndexError):
+            sa[4]
+        self.assertEqual(repr(sa), "SortedArray([1, 2, 3, 5])")
+
+    def test_irange(self):
+        sa = SortedArray(range(0, 100, 5), load=4)
+        self.assertEqual(list(sa.irange(12, 30)), [15, 20, 25, 30])
+        self.assertEqual(list(sa.irange(15, 30, (False, False))), [20, 25])
+        self.assertEqual(list(sa.irange(hi=10)), [0, 5, 10])
+        self.assertEqual(list(sa.irange(96)), [])
+
+    def test_random_operations_match_sorted_list(self):
+        rng = random.Random(3)
+        sa = SortedArray(load=4)
+        expected = []
+        for _ in range(3000):
+            value = rng.randrange(200)
+            op = rng.random()
+            if op < 0.5:
+                sa.add(value)
+                bisect.insort(expected, value)
+            elif op < 0.75:
+                sa.discard(value)
+                if value in expected:
+                    expected.remove(value)
+            elif op < 0.85 and expected:
+                i = rng.randrange(len(expected))
+                self.assertEqual(sa.pop(i), expected.pop(i))
+            elif expected:
+                i = rng.randrange(len(expected))
+                self.assertEqual(sa[i], expected[i])
+                self.assertEqual(
+                    sa.bisect_left(value), bisect.bisect_left(expected, value)
+                )
+        self.assertEqual(list(sa), expected)
+        self.assertEqual(len(sa), len(expected))
+        sa.update(range(1000))
+        self.assertEqual(list(sa), sorted(expected + list(range(1000))))
+        sa.clear()
+        self.assertEqual(len(sa), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
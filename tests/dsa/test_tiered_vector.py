@@ -0,0 +1,78 @@
+import random
+import unittest
+
+from playground.dsa.arrays import DynamicArray, TieredVector
+
+
+class TestTieredVector(unittest.TestCase):
+    def test_append_and_index(self):
+        """Test appending across several blocks and indexing them back."""
+        tv = TieredVector()
+        tv.extend(range(100))
+        self.assertEqual(len(tv), 100)
+        self.assertEqual(tv[0], 0)
+        self.assertEqual(tv[57], 57)
+        self.assertEqual(list(tv), list(range(100)))
+        tv[57] = -1
+        self.assertEqual(tv[57], -1)
+        with self.assertRaises(IndexError):
+            tv[100]
+
+    def test_insert_and_pop(self):
+        """Test head, middle and tail edits keep every block but the last full."""
+        tv = TieredVector()
+        tv.extend(range(40))
+        tv.insert(0, "head")
+        tv.insert(20, "mid")
+        tv.insert(len(tv), "tail")
+        expected = ["head"] + list(range(19)) + ["mid"] + list(range(19, 40)) + ["tail"]
+        self.assertEqual(list(tv), expected)
+        for block in tv._blocks[:-1]:
+            self.assertEqual(block.count, tv._block_size)
+
+        self.assertEqual(tv.pop(20), "mid")
+        self.assertEqual(tv.pop(0), "head")
+        self.assertEqual(tv.pop(), "tail")
+        self.assertEqual(list(tv), list(range(40)))
+        with self.assertRaises(IndexError):
+            tv.insert(42, 0)
+
+    def test_random_edits_match_list(self):
+        """Test a random edit stream against a Python list, across block resizes."""
+        rng = random.Random(7)
+        tv, expected = TieredVector(), []
+        for step in range(6000):
+            if expected and rng.random() < 0.3:
+                index = rng.randrange(len(expected))
+                self.assertEqual(tv.pop(index), expected.pop(index))
+            else:
+                index = rng.randrange(len(expected) + 1)
+                tv.insert(index, step)
+                expected.insert(index, step)
+        self.assertEqual(list(tv), expected)
+        self.assertGreater(tv._block_size, TieredVector._MIN_BLOCK_SIZE)
+
+        while expected:
+            self.assertEqual(tv.pop(0), expected.pop(0))
+        self.assertEqual(len(tv), 0)
+        self.assertEqual(tv._block_size, TieredVector._MIN_BLOCK_SIZE)
+
+    def test_contains_remove_add(self):
+        """Test membership, removal, slicing and concatenation."""
+        tv = TieredVector()
+        tv.extend("abcdef")
+        self.assertIn("c", tv)
+        tv.remove("c")
+        self.assertNotIn("c", tv)
+        with self.assertRaises(ValueError):
+            tv.remove("z")
+        self.assertEqual(list(tv[1:3]), ["b", "d"])
+        da = DynamicArray()
+        da.extend("xy")
+        self.assertEqual(repr(tv + da), "[a, b, d, e, f, x, y]")
+        tv.clear()
+        self.assertEqual(len(tv), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+import sys
+import unittest
+
+from playground.dsa.arrays import DynamicArray, TypedDynamicArray
+
+
+class TestTypedDynamicArray(unittest.TestCase):
+    def test_initialization(self):
+        """Test initialization of TypedDynamicArray."""
+        ta = TypedDynamicArray("d", initial_capacity=4)
+        self.assertEqual(len(ta), 0)
+        self.assertEqual(ta.typecode, "d")
+        self.assertEqual(ta.itemsize, 8)
+        self.assertEqual(ta._capacity, 4)
+
+        with self.assertRaises(ValueError):
+            TypedDynamicArray("u")
+        with self.assertRaises(ValueError):
+            TypedDynamicArray("q", initial_capacity=0)
+
+    def test_append_and_resize(self):
+        """Test appending past capacity keeps raw values."""
+        ta = TypedDynamicArray("q", initial_capacity=2)
+        for i in range(5):
+            ta.append(i * 10)
+        self.assertEqual(len(ta), 5)
+        self.assertEqual(ta.tolist(), [0, 10, 20, 30, 40])
+        self.assertEqual(ta._A.typecode, "q")
+
+    def test_rejects_wrong_type(self):
+        """Test that non-numeric values are rejected by the typed buffer."""
+        ta = TypedDynamicArray("q")
+        with self.assertRaises(TypeError):
+            ta.append("x")
+        with self.assertRaises(OverflowError):
+            ta.append(2**64)
+
+    def test_failed_insert_leaves_contents(self):
+        """Test that a value rejected by the typecode does not shift the tail."""
+        ta = TypedDynamicArray("q")
+        ta.extend([1, 2])
+        with self.assertRaises(OverflowError):
+            ta.insert(0, 2**70)
+        with self.assertRaises(TypeError):
+            ta.insert(1, "x")
+        self.assertEqual(ta.tolist(), [1, 2])
+
+    def test_insert_pop_remove(self):
+        """Test the mutating DynamicArray operations on typed storage."""
+        ta = TypedDynamicArray("i")
+        ta.extend([1, 3, 4])
+        ta.insert(1, 2)
+        self.assertEqual(ta.tolist(), [1, 2, 3, 4])
+        self.assertEqual(ta.pop(), 4)
+        self.assertEqual(ta.pop(0), 1)
+        ta.remove(3)
+        self.assertEqual(ta.tolist(), [2])
+        self.assertIn(2, ta)
+        self.assertNotIn(3, ta)
+        ta.enable_index()
+        self.assertNotIn([2], ta)
+
+    def test_index_tracks_stored_values(self):
+        """Test that the hash index holds the float32 values actually stored."""
+        ta = TypedDynamicArray("f", indexed=True)
+        ta.append(0.1)
+        ta.append(0.2)
+        ta.insert(1, 0.3)
+        ta[2] = 0.4
+        ta[0:1] = [0.5]
+        ta.extend([0.1])
+        self.assertEqual(0.2 in ta, 0.2 in ta.tolist())
+        self.assertNotIn(0.2, ta)
+        self.assertIn(ta.tolist()[1], ta)
+        self.assertEqual(ta.pop(0), 0.5)
+        ta.remove(ta.tolist()[-1])
+        self.assertEqual(len(ta), 2)
+        self.assertEqual(ta._index, {value: {i} for i, value in enumerate(ta.tolist())})
+
+    def test_index_with_nan_and_failed_stores(self):
+        """Test NaN values and rejected values on an indexed typed array."""
+        nan = float("nan")
+        ta = TypedDynamicArray("d", indexed=True)
+        ta.extend([nan, 1.0])
+        ta.append(nan)
+        ta.insert(0, 2.0)
+        ta[1] = 3.0
+        self.assertEqual(ta.pop(0), 2.0)
+        self.assertEqual(ta.pop(0), 3.0)
+        self.assertNotIn(nan, ta)  # As for a scan, NaN never equals itself
+        with self.assertRaises(ValueError):
+            ta.remove(nan)
+
+        with self.assertRaises(TypeError):
+            ta.append("x")
+        with self.assertRaises(TypeError):
+            ta[0] = "x"
+        self.assertNotIn("x", ta)
+        self.assertEqual(ta.tolist()[0], 1.0)
+        self.assertIn(1.0, ta)
+
+    def test_buffer(self):
+        """Test the buffer protocol export of the stored elements."""
+        ta = TypedDynamicArray("d")
+        ta.extend([1.0, 2.0, 3.0])
+        view = ta.buffer()
+        self.assertEqual(view.format, "d")
+        self.assertEqual(len(view), 3)
+        self.assertEqual(view.tolist(), [1.0, 2.0, 3.0])
+        self.assertEqual(bytes(view), ta.tobytes())
+
+    @unittest.skipUnless(sys.version_info >= (3, 12), "PEP 688 needs Python 3.12")
+    def test_buffer_protocol(self):
+        """Test that memoryview() accepts the array directly on Python 3.12+."""
+        ta = TypedDynamicArray("i")
+        ta.extend([1, 2])
+        self.assertEqual(memoryview(ta).tolist(), [1, 2])
+
+    @unittest.skipIf(sys.version_info >= (3, 12), "PEP 688 exports the array")
+    def test_no_buffer_protocol_before_pep_688(self):
+        """Test that older Pythons need buffer() for a view."""
+        with self.assertRaises(TypeError):
+            memoryview(TypedDynamicArray("i"))
+
+    def test_add(self):
+        """Test concatenating typed and object-backed arrays."""
+        ta = TypedDynamicArray("q")
+        ta.extend([1, 2])
+        da = DynamicArray()
+        da.extend([3, 4])
+        result = ta + da
+        self.assertIsInstance(result, TypedDynamicArray)
+        self.assertEqual(result.tolist(), [1, 2, 3, 4])
+
+        with self.assertRaises(TypeError):
+            ta + [5, 6]
+
+    def test_results_keep_subclass(self):
+        """Test that slices and concatenation build the caller's class."""
+
+        class Subclass(TypedDynamicArray):
+            pass
+
+        sa = Subclass("i")
+        sa.extend([1, 2, 3])
+        for result in (sa[:2], sa + sa):
+            self.assertIsInstance(result, Subclass)
+            self.assertEqual(result.typecode, "i")
+
+
+if __name__ == "__main__":
+    unittest.main()
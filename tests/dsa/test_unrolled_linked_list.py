@@ -0,0 +1,75 @@
+import random
+import unittest
+
+from playground.dsa.linked_list import UnrolledLinkedList
+from playground.dsa.linked_list.singly_linked_list import (
+    EmptyListError,
+    OutOfBoundsError,
+)
+
+
+class TestUnrolledLinkedList(unittest.TestCase):
+    def test_empty_list(self):
+        """Test operations on an empty list."""
+        ull = UnrolledLinkedList()
+        self.assertTrue(ull.empty())
+        self.assertIsNone(ull.front())
+        self.assertIsNone(ull.back())
+        with self.assertRaises(EmptyListError):
+            ull.pop_front()
+        with self.assertRaises(EmptyListError):
+            ull.pop_back()
+        with self.assertRaises(OutOfBoundsError):
+            ull.value_at(0)
+        with self.assertRaises(ValueError):
+            UnrolledLinkedList(node_capacity=1)
+
+    def test_packs_elements_into_nodes(self):
+        """Test that nodes fill up before new ones are allocated."""
+        ull = UnrolledLinkedList(range(100), node_capacity=16)
+        self.assertEqual(ull.node_count(), 7)
+        self.assertEqual(list(ull), list(range(100)))
+        self.assertEqual(list(reversed(ull)), list(range(99, -1, -1)))
+        self.assertEqual(ull.value_n_from_end(1), 99)
+
+    def test_random_operations_match_list(self):
+        """Test splits and merges against a plain list."""
+        rng = random.Random(5)
+        ull = UnrolledLinkedList(node_capacity=4)
+        expected = []
+        for step in range(3000):
+            op = rng.random()
+            if op < 0.2:
+                ull.push_back(step)
+                expected.append(step)
+            elif op < 0.35:
+                ull.push_front(step)
+                expected.insert(0, step)
+            elif op < 0.6:
+                i = rng.randint(0, len(expected))
+                ull.insert(i, step)
+                expected.insert(i, step)
+            elif op < 0.8 and expected:
+                i = rng.randrange(len(expected))
+                ull.erase(i)
+                del expected[i]
+            elif op < 0.85 and expected:
+                self.assertEqual(ull.pop_front(), expected.pop(0))
+            elif op < 0.9 and expected:
+                self.assertEqual(ull.pop_back(), expected.pop())
+            elif op < 0.95 and expected:
+                value = rng.choice(expected)
+                ull.remove_value(value)
+                expected.remove(value)
+            elif expected:
+                i = rng.randrange(len(expected))
+                self.assertEqual(ull.value_at(i), expected[i])
+        self.assertEqual(list(ull), expected)
+        self.assertEqual(len(ull), len(expected))
+        ull.reverse()
+        self.assertEqual(list(ull), expected[::-1])
+        self.assertLessEqual(ull.node_count(), len(expected) // 2 + 2)
+
+
+if __name__ == "__main__":
+    unittest.main()